@@ -26,9 +26,11 @@ from .uvm_recorder import *
 from .uvm_registry import *
 from .uvm_report_catcher import *
 from .uvm_report_handler import *
+from .uvm_report_log import UVMReportLogWriter, UVMReportLogReader
 from .uvm_report_message import *
 from .uvm_report_object import *
 from .uvm_report_server import *
+from .uvm_report_sink import *
 from .uvm_resource import *
 from .uvm_resource_db import *
 from .uvm_root import *
@@ -26,6 +26,7 @@ access. cocotb is already hiding these details from us.
 """
 
 from inspect import getframeinfo, stack
+from functools import lru_cache
 import re
 import random
 from typing import List, Any
@@ -44,8 +45,7 @@ RET_OK = 0
 
 
 def uvm_re_match(rex, _str):
-    m = re.search(rex, _str)
-    if m is not None:
+    if uvm_re_matcher(rex)(_str):
         return RET_OK
     return RET_ERR
 
@@ -71,6 +71,83 @@ def uvm_glob_to_re(_str: str) -> str:
     return res
 
 
+UVM_MATCH_CACHE_SIZE = 4096
+
+# Characters with a special meaning in regular expressions
+_RE_CHARS = frozenset(".^$*+?{}[]\\|()")
+# Regex characters which uvm_glob_to_re does not escape
+_GLOB_RE_CHARS = frozenset("*?+()^$|\\{}")
+
+
+def _match_all(_str) -> bool:
+    return True
+
+
+def uvm_glob_literal(glob):
+    """
+    Returns the literal string which a glob matches as a substring, or None
+    if the glob must be matched as a regular expression. As the globs are
+    matched without anchors, a glob without wildcards, or with only
+    leading/trailing '*' (ie. "top.env.*"), matches exactly the strings
+    containing it.
+
+    Args:
+        glob (str): Glob pattern, see `uvm_glob_to_re`.
+    Returns:
+        str: Literal to search for, empty string if all strings match.
+    """
+    if glob is None or glob == "":
+        return ""
+    if glob[0] == "/" and glob[-1] == "/":
+        return None
+    literal = glob.strip("*")
+    if any(c in _GLOB_RE_CHARS for c in literal):
+        return None
+    return literal
+
+
+@lru_cache(maxsize=UVM_MATCH_CACHE_SIZE)
+def uvm_re_matcher(rex):
+    """
+    Returns a function which tells if `rex` matches (anywhere in) the given
+    string, ie. re.search(rex, str) is not None. Regexes without special
+    characters are matched as substrings, other ones are compiled once.
+    Results are cached for the UVM_MATCH_CACHE_SIZE most recently used
+    regexes.
+
+    Args:
+        rex (str): Regular expression.
+    Returns:
+        callable: Function taking a string and returning bool.
+    """
+    if rex == "":
+        return _match_all
+    if isinstance(rex, str) and not any(c in _RE_CHARS for c in rex):
+        return lambda _str: rex in _str
+    search = re.compile(rex).search
+    return lambda _str: search(_str) is not None
+
+
+@lru_cache(maxsize=UVM_MATCH_CACHE_SIZE)
+def uvm_glob_matcher(glob):
+    """
+    Returns a function which tells if `glob` matches the given string, with
+    the same semantics as uvm_re_match(uvm_glob_to_re(glob), str) == RET_OK.
+    Results are cached like in `uvm_re_matcher`.
+
+    Args:
+        glob (str): Glob pattern with '*' and '?' wildcards.
+    Returns:
+        callable: Function taking a string and returning bool.
+    """
+    literal = uvm_glob_literal(glob)
+    if literal is None:
+        return uvm_re_matcher(uvm_glob_to_re(glob))
+    if literal == "":
+        return _match_all
+    return lambda _str: literal in _str
+
+
 def uvm_split_string(_str, sep: str, split_vals: List[str]) -> List[str]:
     res = _str.split(sep)
     for val in res:
@@ -227,25 +304,17 @@ class sv:
         This is to make porting faster, but should be switched to native python
         formatting inside UVM code
 
+        The SV format specifiers in `msg` are translated into a Python
+        format string only once per distinct `msg`, and kept in a bounded
+        LRU cache (see `sv_compile_format`).
+
         Args:
             msg (str): String to format containing format specifiers.
             args (*any): Values that are used in formatting.
         Returns:
             str: Formatted string
         """
-        #formats = {"%t": "%d", "%0t": "%0d"}
-        #for s in formats:
-        #    msg = msg.replace(s, formats[s])
-        #return sformatf(msg, *args)
-        # TODO substitute old types %s/%d etc with {}
-        #new_msg = cls.STR_RE.sub(r'{:\1}', msg)
-        #print("new_msg is " + new_msg)
-        for s in cls.formats:
-            if s == "%h" or s == "%0h":
-                msg = msg.replace(s, "{:X}")
-            else:
-                msg = msg.replace(s, "{}")
-        return msg.format(*args)
+        return sv_compile_format(msg)(*args)
 
     @classmethod
     def random(cls):
@@ -559,6 +628,39 @@ def sformatf(fmt, *args):
     return fmt % args
 
 
+# Matches any of the format specifiers in sv.formats. No specifier contains
+# another one as a substring, so a single left-to-right pass gives the same
+# result as replacing the specifiers one by one.
+SV_FORMAT_RE = re.compile("|".join(re.escape(f)
+    for f in sorted(sv.formats, key=len, reverse=True)))
+
+SV_FORMAT_CACHE_SIZE = 1024
+
+
+def _sv_format_repl(match) -> str:
+    if match.group(0) in ("%h", "%0h"):
+        return "{:X}"
+    return "{}"
+
+
+@lru_cache(maxsize=SV_FORMAT_CACHE_SIZE)
+def sv_compile_format(msg: str):
+    """
+    Translates a SV format string into a Python format string, and returns
+    its bound `format` method. Results are cached for the
+    SV_FORMAT_CACHE_SIZE most recently used format strings.
+
+    %h and %0h are formatted as upper-case hex, and the other specifiers
+    in `sv.formats` (%d, %0d, %s, %t, %0t, %p etc.) use str().
+
+    Args:
+        msg (str): SV format string.
+    Returns:
+        callable: Function taking the format arguments and returning str.
+    """
+    return SV_FORMAT_RE.sub(_sv_format_repl, msg).format
+
+
 def cat(*args):
     ret = ""
     for a in args:
@@ -102,6 +102,9 @@ class UVMCallbacksBase(UVMObject):
     m_b_inst = None
     m_pool = UVMPool()  # uvm_object -> uvm_queue#(uvm_callback)
     m_tracing = True
+    # Incremented on each add(). Used to invalidate data derived from the
+    # callback queues, such as the report catcher index.
+    m_generation = 0
 
     def __init__(self, name):
         super().__init__(name)
@@ -778,6 +781,7 @@ class UVMCallbacks(UVMTypedCallbacks):
                     q.append(cb)
                 else:
                     q.insert(0, cb)
+        UVMCallbacksBase.m_generation += 1
 
         #  endfunction
 
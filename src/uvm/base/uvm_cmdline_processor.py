@@ -177,6 +177,13 @@ value conversions.  For example::
 No equivalent of set_config_object() exists since no way exists to pass a
 `UVMObject` into the simulation via the command line.
 
+Variable: +uvm_set_config_file
+
+~+uvm_set_config_file=<file>~ applies all the settings in a JSON or TOML
+file, see `UVMConfigDb.load_settings`. For example::
+
+  <sim command> +uvm_set_config_file=regress/fast_mode.toml
+
 The implementation of this is in uvm_root.
 
 Variable: +uvm_set_default_sequence
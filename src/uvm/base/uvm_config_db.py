@@ -46,7 +46,7 @@ from cocotb.triggers import Event
 from .uvm_resource import UVMResourceBase, UVMResource, UVMResourcePool, PRI_HIGH
 from .uvm_resource_db import UVMResourceDb
 from .uvm_pool import UVMPool
-from .sv import uvm_re_match, uvm_glob_to_re
+from .sv import uvm_glob_matcher
 from .uvm_debug import uvm_debug
 
 
@@ -84,8 +84,19 @@ class UVMConfigDb(UVMResourceDb):
 
     #  // Internal waiter list for wait_modified
     #  static local uvm_queue#(m_uvm_waiter) m_waiters[string];
+    # Waiters are indexed by field name, and removed when triggered
     m_waiters = {}
 
+    # Nesting depth of begin_batch/end_batch, and the (inst_name,
+    # field_name) pairs set during the batch
+    m_batch_depth = 0
+    m_batch_pending = {}
+
+    # Results of get, when caching is on (see UVMConfigDbOptions). Maps
+    # (cntxt, inst_name, field_name, T) -> (generation of field_name in
+    # the resource pool, resource, resource version, value)
+    m_get_cache = {}
+
     @classmethod
     def get(cls, cntxt, inst_name, field_name, value, T=None):
         """
@@ -115,6 +126,20 @@ class UVMConfigDb(UVMResourceDb):
         Returns:
         Raises:
         """
+        caching = UVMConfigDbOptions.caching and not UVMConfigDbOptions.tracing
+        if caching:
+            key = (cntxt, inst_name, field_name, T)
+            entry = UVMConfigDb.m_get_cache.get(key)
+            if entry is not None:
+                gen, r, version, val = entry
+                if (gen == UVMResourcePool.m_name_generation.get(field_name, 0)
+                        and (r is None or r.m_version == version)):
+                    if r is None:
+                        return False
+                    value.append(val)
+                    return True
+            gen = UVMResourcePool.m_name_generation.get(field_name, 0)
+
         #//TBD: add file/line
         # p = 0
         r = None  # uvm_resource#(T) r, rt;
@@ -139,12 +164,17 @@ class UVMConfigDb(UVMResourceDb):
             UVMResourceDb.m_show_msg("CFGDB/GET", "Configuration","read", inst_name,
                 field_name, cntxt, r)
         if r is None:
+            if caching:
+                UVMConfigDb.m_get_cache[key] = (gen, None, 0, None)
             return False
 
         if hasattr(value, 'append'):
-            value.append(r.read(cntxt))
+            val = r.read(cntxt)
+            value.append(val)
         else:
             raise Exception('value must be a list-like with append')
+        if caching:
+            UVMConfigDb.m_get_cache[key] = (gen, r, r.m_version, val)
         return True
 
     @classmethod
@@ -190,8 +220,6 @@ class UVMConfigDb(UVMResourceDb):
         """
         p = None
         curr_phase = None
-        exists = False
-        lookup = ""
         pool = None  # uvm_pool#(string,uvm_resource#(T)) pool;
         rstate = ""
         from .uvm_coreservice import UVMCoreService
@@ -218,6 +246,37 @@ class UVMConfigDb(UVMResourceDb):
             UVMConfigDb.m_rsc[cntxt] = UVMPool()
         pool = UVMConfigDb.m_rsc[cntxt]
 
+        if curr_phase is not None and curr_phase.get_name() == "build":
+            precedence = UVMResourceBase.default_precedence - cntxt.get_depth()
+        else:
+            precedence = UVMResourceBase.default_precedence
+
+        r = cls.m_set_resource(pool, cntxt, inst_name, field_name, value,
+            precedence)
+
+        # trigger any waiters
+        if UVMConfigDb.m_batch_depth > 0:
+            UVMConfigDb.m_batch_pending[(inst_name, field_name)] = True
+        elif field_name in UVMConfigDb.m_waiters:
+            UVMConfigDb.m_notify_waiters(inst_name, field_name)
+
+        if p is not None:
+            p.set_randstate(rstate)
+
+        if UVMConfigDbOptions.is_tracing():
+            UVMResourceDb.m_show_msg("CFGDB/SET", "Configuration","set", inst_name, field_name, cntxt, r)
+
+    @classmethod
+    def m_set_resource(cls, pool, cntxt, inst_name, field_name, value,
+            precedence):
+        """
+        Creates or updates the resource of a setting in `pool`, the
+        resources set from `cntxt`, and puts it at the head of the
+        resource pool. `inst_name` is the full scope of the setting.
+
+        Returns:
+            UVMResource: The resource of the setting.
+        """
         # Insert the token in the middle to prevent cache
         # oddities like i=foobar,f=xyz and i=foo,f=barxyz.
         # Can't just use '.', because '.' isn't illegal
@@ -225,6 +284,7 @@ class UVMConfigDb(UVMResourceDb):
         lookup = inst_name + "__M_UVM__" + field_name
 
         r = None  # uvm_resource#(T) r;
+        exists = False
         if not pool.exists(lookup):
             r = UVMResource(field_name, inst_name)
             pool.add(lookup, r)
@@ -232,11 +292,7 @@ class UVMConfigDb(UVMResourceDb):
             r = pool.get(lookup)
             exists = True
 
-        if curr_phase is not None and curr_phase.get_name() == "build":
-            r.precedence = UVMResourceBase.default_precedence - cntxt.get_depth()
-        else:
-            r.precedence = UVMResourceBase.default_precedence
-
+        r.precedence = precedence
         r.write(value, cntxt)
 
         if exists:
@@ -245,20 +301,144 @@ class UVMConfigDb(UVMResourceDb):
         else:
             # Doesn't exist yet, so put it in resource db at the head.
             r.set_override()
+        return r
 
-        # trigger any waiters
-        if field_name in UVMConfigDb.m_waiters:
-            w = None
-            for i in range(len(UVMConfigDb.m_waiters[field_name])):
-                w = UVMConfigDb.m_waiters[field_name].get(i)
-                if uvm_re_match(uvm_glob_to_re(inst_name),w.inst_name) == 0:
-                    w.trigger.set()
+    @classmethod
+    def set_many(cls, cntxt, settings):
+        """
+        Applies many settings from `cntxt` in one pass. The result is the
+        same as calling `set` for each setting in order, but the context,
+        phase and precedence are looked up only once. Waiters blocked in
+        `wait_modified` are woken once at the end, as in `begin_batch`.
 
-        if p is not None:
-            p.set_randstate(rstate)
+        .. code-block:: python
+
+          UVMConfigDb.set_many(self, [("env.agent*", "is_active", UVM_PASSIVE),
+                                      ("env.sb", "enabled", 1)])
 
+        Args:
+            cntxt (UVMComponent): Context of the settings, `uvm_top` if None.
+            settings: Iterable of (inst_name, field_name, value) tuples.
+        Returns:
+            int: Number of settings applied.
+        """
         if UVMConfigDbOptions.is_tracing():
-            UVMResourceDb.m_show_msg("CFGDB/SET", "Configuration","set", inst_name, field_name, cntxt, r)
+            # Print the settings exactly like set does
+            num = 0
+            for inst_name, field_name, value in settings:
+                cls.set(cntxt, inst_name, field_name, value)
+                num += 1
+            return num
+
+        from .uvm_coreservice import UVMCoreService
+        cs = UVMCoreService.get()
+        top = cs.get_root()
+        curr_phase = top.m_current_phase
+        if cntxt is None:
+            cntxt = top
+        cntxt_name = cntxt.get_full_name()
+
+        if cntxt not in UVMConfigDb.m_rsc:
+            UVMConfigDb.m_rsc[cntxt] = UVMPool()
+        pool = UVMConfigDb.m_rsc[cntxt]
+
+        if curr_phase is not None and curr_phase.get_name() == "build":
+            precedence = UVMResourceBase.default_precedence - cntxt.get_depth()
+        else:
+            precedence = UVMResourceBase.default_precedence
+
+        num = 0
+        cls.begin_batch()
+        try:
+            for inst_name, field_name, value in settings:
+                if inst_name == "":
+                    inst_name = cntxt_name
+                elif cntxt_name != "":
+                    inst_name = cntxt_name + "." + inst_name
+                cls.m_set_resource(pool, cntxt, inst_name, field_name, value,
+                    precedence)
+                if field_name in UVMConfigDb.m_waiters:
+                    UVMConfigDb.m_batch_pending[(inst_name, field_name)] = True
+                num += 1
+        finally:
+            cls.end_batch()
+        return num
+
+    @classmethod
+    def load_settings(cls, cntxt, source):
+        """
+        Applies the settings from a JSON or TOML file, or from a mapping,
+        using `set_many`. The settings are given as a table of instance
+        names, each containing a table of field names and values:
+
+        .. code-block:: json
+
+          {"env.agent*": {"is_active": 0, "num_items": 10},
+           "env.sb": {"enabled": 1}}
+
+        .. code-block:: toml
+
+          ["env.agent*"]
+          is_active = 0
+          num_items = 10
+
+        A JSON file can also contain a list of entries of the form
+        {"inst_name": ..., "field_name": ..., "value": ...}. TOML files
+        need the tomllib module (Python 3.11+) or the tomli package.
+
+        Args:
+            cntxt (UVMComponent): Context of the settings, `uvm_top` if None.
+            source (str|Mapping): File name (.json or .toml), or a mapping.
+        Returns:
+            int: Number of settings applied.
+        Raises:
+            ValueError: If the settings are not in the expected format.
+        """
+        return cls.set_many(cntxt, UVMConfigDb.m_read_settings(source))
+
+    @classmethod
+    def m_read_settings(cls, source):
+        """
+        Reads the settings for `load_settings`.
+
+        Returns:
+            list: (inst_name, field_name, value) tuples.
+        """
+        if isinstance(source, str):
+            if source.endswith(".toml"):
+                try:
+                    import tomllib
+                except ImportError:
+                    import tomli as tomllib
+                with open(source, "rb") as f:
+                    data = tomllib.load(f)
+            else:
+                import json
+                with open(source, "r") as f:
+                    data = json.load(f)
+        else:
+            data = source
+
+        settings = []
+        if isinstance(data, list):
+            for entry in data:
+                try:
+                    settings.append((entry["inst_name"], entry["field_name"],
+                        entry["value"]))
+                except (KeyError, TypeError):
+                    raise ValueError("Invalid config setting " + str(entry)
+                        + ": expected inst_name, field_name and value")
+            return settings
+        if not hasattr(data, "items"):
+            raise ValueError("Config settings must be a table or a list, got "
+                + str(type(data)))
+        for inst_name, fields in data.items():
+            if not hasattr(fields, "items"):
+                raise ValueError("Config settings for " + inst_name +
+                    " must be a table of fields and values")
+            for field_name, value in fields.items():
+                settings.append((inst_name, field_name, value))
+        return settings
 
     @classmethod
     def exists(cls, cntxt, inst_name, field_name, spell_chk=False):
@@ -290,49 +470,95 @@ class UVMConfigDb(UVMResourceDb):
         found_val = UVMResourceDb.get_by_name(inst_name,field_name,spell_chk)
         return found_val is not None
 
-    #  // Function: wait_modified
-    #  //
-    #  // Wait for a configuration setting to be set for ~field_name~
-    #  // in ~cntxt~ and ~inst_name~. The task blocks until a new configuration
-    #  // setting is applied that effects the specified field.
-    #
-    #  static task wait_modified(UVMComponent cntxt, string inst_name,
-    #      string field_name);
-    #    process p = process::self();
-    #    string rstate = p.get_randstate();
-    #    m_uvm_waiter waiter;
-    #    uvm_coreservice_t cs = uvm_coreservice_t::get();
-    #
-    #    if(cntxt == null)
-    #      cntxt = cs.get_root();
-    #    if(cntxt != cs.get_root()) begin
-    #      if(inst_name != "")
-    #        inst_name = {cntxt.get_full_name(),".",inst_name};
-    #      else
-    #        inst_name = cntxt.get_full_name();
-    #    end
-    #
-    #    waiter = new(inst_name, field_name);
-    #
-    #    if(!m_waiters.exists(field_name))
-    #      m_waiters[field_name] = new;
-    #    m_waiters[field_name].push_back(waiter);
-    #
-    #    p.set_randstate(rstate);
-    #
-    #    // wait on the waiter to trigger
-    #    @waiter.trigger;
-    #
-    #    // Remove the waiter from the waiter list
-    #    for(int i=0; i<m_waiters[field_name].size(); ++i) begin
-    #      if(m_waiters[field_name].get(i) == waiter) begin
-    #        m_waiters[field_name].delete(i);
-    #        break;
-    #      end
-    #    end
-    #  endtask
-    #
-    #
+    @classmethod
+    async def wait_modified(cls, cntxt, inst_name, field_name):
+        """
+        Wait for a configuration setting to be set for `field_name`
+        in `cntxt` and `inst_name`. The task blocks until a new configuration
+        setting is applied that effects the specified field.
+
+        Args:
+            cntxt (UVMComponent): Context, `uvm_top` if None.
+            inst_name (str): Instance name relative to `cntxt`.
+            field_name (str): Name of the field.
+        """
+        waiter = cls.m_add_waiter(cntxt, inst_name, field_name)
+        # wait on the waiter to trigger, set() removes it from the list
+        await waiter.trigger.wait()
+
+    @classmethod
+    def m_add_waiter(cls, cntxt, inst_name, field_name):
+        """
+        Adds a waiter for `wait_modified`.
+
+        Returns:
+            m_uvm_waiter: The waiter, triggered by a matching `set`.
+        """
+        from .uvm_coreservice import UVMCoreService
+        cs = UVMCoreService.get()
+        if cntxt is None:
+            cntxt = cs.get_root()
+        if cntxt != cs.get_root():
+            if inst_name != "":
+                inst_name = cntxt.get_full_name() + "." + inst_name
+            else:
+                inst_name = cntxt.get_full_name()
+
+        waiter = m_uvm_waiter(inst_name, field_name)
+        if field_name not in UVMConfigDb.m_waiters:
+            UVMConfigDb.m_waiters[field_name] = []
+        UVMConfigDb.m_waiters[field_name].append(waiter)
+        return waiter
+
+    @classmethod
+    def m_notify_waiters(cls, inst_name, field_name):
+        """
+        Triggers and removes the waiters of `field_name` whose instance
+        name matches the `inst_name` glob of a setting.
+        """
+        waiters = UVMConfigDb.m_waiters.get(field_name)
+        if not waiters:
+            return
+        match = uvm_glob_matcher(inst_name)
+        remaining = []
+        for w in waiters:
+            if match(w.inst_name):
+                w.trigger.set()
+            else:
+                remaining.append(w)
+        if len(remaining) > 0:
+            UVMConfigDb.m_waiters[field_name] = remaining
+        else:
+            del UVMConfigDb.m_waiters[field_name]
+
+    @classmethod
+    def begin_batch(cls):
+        """
+        Starts a batch of settings, for example when a test applies many
+        settings in its build_phase. Waiters blocked in `wait_modified` are
+        not woken by `set` until the matching `end_batch` is called. Then
+        each waiter is woken once, even if several settings match it.
+        Batches can be nested.
+        """
+        UVMConfigDb.m_batch_depth += 1
+
+    @classmethod
+    def end_batch(cls):
+        """
+        Ends a batch started with `begin_batch`, and wakes the waiters
+        matching any of the settings made during the batch.
+        """
+        if UVMConfigDb.m_batch_depth == 0:
+            return
+        UVMConfigDb.m_batch_depth -= 1
+        if UVMConfigDb.m_batch_depth > 0:
+            return
+        pending = UVMConfigDb.m_batch_pending
+        UVMConfigDb.m_batch_pending = {}
+        for (inst_name, field_name) in pending:
+            if field_name in UVMConfigDb.m_waiters:
+                UVMConfigDb.m_notify_waiters(inst_name, field_name)
+
     #endclass
 
 #// Section: Types
@@ -386,12 +612,17 @@ class UVMConfigDbOptions:
       * tracing:  on/off
 
         The default for tracing is off.
+
+      * caching:  on/off
+
+        Caching of get results, see `turn_on_caching`. The default is off.
     """
 
     #  static local bit ready;
     ready = False
     #  static local bit tracing;
     tracing = False
+    caching = False
 
     @classmethod
     def turn_on_tracing(cls):
@@ -425,6 +656,41 @@ class UVMConfigDbOptions:
         return UVMConfigDbOptions.tracing
 
 
+    @classmethod
+    def turn_on_caching(cls):
+        """
+        Turn on caching of `UVMConfigDb.get` results. A cached result is
+        returned until a resource with the same field name is set, or its
+        scope or priority changes, or the resource which was found is
+        written. Use this when components poll settings in loops.
+        Reads from the cache are not recorded in the resource audit trail,
+        and the cache is not used while tracing is on.
+
+        This method is implicitly called by the `+UVM_CONFIG_DB_CACHE`.
+        """
+        if not UVMConfigDbOptions.ready:
+            UVMConfigDbOptions.init()
+        UVMConfigDbOptions.caching = True
+
+    @classmethod
+    def turn_off_caching(cls):
+        """
+        Turn caching off, and clear the cached results.
+        """
+        if not UVMConfigDbOptions.ready:
+            UVMConfigDbOptions.init()
+        UVMConfigDbOptions.caching = False
+        UVMConfigDb.m_get_cache.clear()
+
+    @classmethod
+    def is_caching(cls):
+        """
+        Returns: True if caching of get results is on.
+        """
+        if not UVMConfigDbOptions.ready:
+            UVMConfigDbOptions.init()
+        return UVMConfigDbOptions.caching
+
     @classmethod
     def init(cls):
         trace_args = []  # string trace_args[$];
@@ -434,4 +700,6 @@ class UVMConfigDbOptions:
             UVMConfigDbOptions.tracing = 1
         if clp.get_arg_matches("+UVM_CONFIG_DB_TRACE=", trace_args) > 0:
             UVMConfigDbOptions.tracing = 1
+        if clp.get_arg_matches("+UVM_CONFIG_DB_CACHE", trace_args) > 0:
+            UVMConfigDbOptions.caching = True
         UVMConfigDbOptions.ready = 1
@@ -19,3 +19,10 @@ class UVMFinishError(Exception):
     Exception which is thrown when the test is finished
     """
     pass
+
+class UVMReleasedObjectError(Exception):
+    """
+    Exception which is thrown when an object is accessed after it has been
+    released into the free list of its type, and pool debugging is on
+    """
+    pass
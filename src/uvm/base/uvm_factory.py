@@ -143,6 +143,10 @@ class UVMFactory:
 class UVMDefaultFactory(UVMFactory):
 
     m_debug_pass = False
+    # Max number of resolved wrappers cached, the cache is cleared when full.
+    # Object names are part of the key, so uniquely named objects each add
+    # an entry.
+    m_resolve_cache_size = 10000
 
     def __init__(self):
         self.m_override_info: List[UVMFactoryOverride] = []
@@ -153,6 +157,11 @@ class UVMDefaultFactory(UVMFactory):
         self.m_inst_override_queues = {}  # [uvm_object_wrapper] -> queue
         self.m_inst_override_name_queues = {}  # [string] -> queue
         self.m_wildcard_inst_overrides = UVMQueue()
+        # Resolved wrappers of create_*: (requested type or type name,
+        # full_inst_path) -> (wrapper, overrides used in the resolution).
+        # Cleared by register and set_*_override_*
+        self.m_resolve_cache = {}
+        self.m_override_loop = False
 
 
     def register(self, obj) -> None:
@@ -169,6 +178,7 @@ class UVMDefaultFactory(UVMFactory):
             uvm_report_fatal("NULLWR",
                 "Attempting to register a null object with the factory")
 
+        self.m_resolve_cache.clear()
         if obj.get_type_name() != "" and obj.get_type_name() != "<unknown>":
             if self.m_type_names.exists(obj.get_type_name()):
                 uvm_report_warning("TPRGED", ("Type name '" + obj.get_type_name()
@@ -213,6 +223,7 @@ class UVMDefaultFactory(UVMFactory):
             override_type:
             replace:
         """
+        self.m_resolve_cache.clear()
         replaced = False
 
         # check that old and new are not the same
@@ -281,6 +292,7 @@ class UVMDefaultFactory(UVMFactory):
             override_type_name:
             replace:
         """
+        self.m_resolve_cache.clear()
         replaced = False
         original_type = None
         override_type = None
@@ -384,6 +396,7 @@ class UVMDefaultFactory(UVMFactory):
             override_type:
             full_inst_path:
         """
+        self.m_resolve_cache.clear()
 
         override = None  # uvm_factory_override
 
@@ -480,17 +493,12 @@ class UVMDefaultFactory(UVMFactory):
         """
         inst_path = self._get_inst_path(parent_inst_path, name)
 
-        self.m_override_info.clear()
-        wrapper = self.find_override_by_name(requested_type_name, inst_path)
-
-        # if no override exists, try to use requested_type_name directly
+        wrapper = self.m_resolve_by_name(requested_type_name, inst_path)
         if wrapper is None:
-            if not self.m_type_names.exists(requested_type_name):
-                uvm_report_warning("BDTYP", ("Cannot create an object of type '"
-                    + requested_type_name + "' because it is not registered with the factory."),
-                    UVM_NONE)
-                return None
-            wrapper = self.m_type_names.get(requested_type_name)
+            uvm_report_warning("BDTYP", ("Cannot create an object of type '"
+                + requested_type_name + "' because it is not registered with the factory."),
+                UVM_NONE)
+            return None
         return wrapper.create_object(name)
 
     def create_object_by_type(self, requested_type, parent_inst_path="", name=""):
@@ -507,12 +515,73 @@ class UVMDefaultFactory(UVMFactory):
             uvm_report_fatal("REQ_TYPE_NONE", "Requested type object was None")
         full_inst_path = self._get_inst_path(parent_inst_path, name)
 
-        self.m_override_info.clear()
-        requested_type = self.find_override_by_type(requested_type, full_inst_path)
+        requested_type = self.m_resolve_by_type(requested_type, full_inst_path)
         if requested_type is None:
             uvm_report_fatal("REQ_TYPE_NONE", "Requested type object was None after override")
         return requested_type.create_object(name)
 
+    def m_resolve_by_type(self, requested_type, full_inst_path):
+        """
+        Returns the final wrapper created for `requested_type` at
+        `full_inst_path`, resolving it with find_override_by_type only on the
+        first request. The `used` counters of the overrides on the cached
+        resolution are still updated on every call.
+
+        Args:
+            requested_type (UVMObjectWrapper):
+            full_inst_path (str):
+        Returns:
+            UVMObjectWrapper
+        """
+        key = (requested_type, full_inst_path)
+        entry = self.m_resolve_cache.get(key)
+        if entry is not None:
+            for override in entry[1]:
+                override.used += 1
+            return entry[0]
+        self.m_override_info.clear()
+        self.m_override_loop = False
+        wrapper = self.find_override_by_type(requested_type, full_inst_path)
+        if wrapper is not None and not self.m_override_loop:
+            self.m_cache_resolved(key, wrapper)
+        return wrapper
+
+    def m_resolve_by_name(self, requested_type_name, full_inst_path):
+        """
+        Like `m_resolve_by_type`, but resolves `requested_type_name` with
+        find_override_by_name. If no override exists, the type registered
+        with that name is returned, or None if there is no such type.
+
+        Args:
+            requested_type_name (str):
+            full_inst_path (str):
+        Returns:
+            UVMObjectWrapper
+        """
+        key = (requested_type_name, full_inst_path)
+        entry = self.m_resolve_cache.get(key)
+        if entry is not None:
+            for override in entry[1]:
+                override.used += 1
+            return entry[0]
+        self.m_override_info.clear()
+        self.m_override_loop = False
+        wrapper = self.find_override_by_name(requested_type_name, full_inst_path)
+
+        # if no override exists, try to use requested_type_name directly
+        if wrapper is None:
+            if not self.m_type_names.exists(requested_type_name):
+                return None
+            wrapper = self.m_type_names.get(requested_type_name)
+        if not self.m_override_loop:
+            self.m_cache_resolved(key, wrapper)
+        return wrapper
+
+    def m_cache_resolved(self, key, wrapper) -> None:
+        if len(self.m_resolve_cache) >= self.m_resolve_cache_size:
+            self.m_resolve_cache.clear()
+        self.m_resolve_cache[key] = (wrapper, tuple(self.m_override_info))
+
     def _get_inst_path(self, parent_inst_path, name):
         inst_path = ""
         if parent_inst_path == "":
@@ -538,18 +607,12 @@ class UVMDefaultFactory(UVMFactory):
 
         inst_path = self._get_inst_path(parent_inst_path, name)
 
-        self.m_override_info.clear()
-        wrapper = self.find_override_by_name(requested_type_name, inst_path)
-
-        # if no override exists, try to use requested_type_name directly
+        wrapper = self.m_resolve_by_name(requested_type_name, inst_path)
         if wrapper is None:
-            if not self.m_type_names.exists(requested_type_name):
-                uvm_report_warning("BDTYP", ("Cannot create a component of type '"
-                    + requested_type_name + "' because it is not registered with the factory."),
-                    UVM_NONE)
-                return None
-            wrapper = self.m_type_names.get(requested_type_name)
-
+            uvm_report_warning("BDTYP", ("Cannot create a component of type '"
+                + requested_type_name + "' because it is not registered with the factory."),
+                UVM_NONE)
+            return None
         return wrapper.create_component(name, parent)
 
     def create_component_by_type(self, requested_type, parent_inst_path, name,
@@ -566,8 +629,7 @@ class UVMDefaultFactory(UVMFactory):
         """
         full_inst_path = self._get_inst_path(parent_inst_path, name)
 
-        self.m_override_info.clear()
-        requested_type = self.find_override_by_type(requested_type, full_inst_path)
+        requested_type = self.m_resolve_by_type(requested_type, full_inst_path)
         return requested_type.create_component(name, parent)
 
     # find_wrapper_by_name
@@ -668,6 +730,7 @@ class UVMDefaultFactory(UVMFactory):
         for index in range(0, len(self.m_override_info)):
             if self.m_override_info[index].orig_type == requested_type:
                 uvm_report_error("OVRDLOOP", "Recursive loop detected while finding override.", UVM_NONE)
+                self.m_override_loop = True
                 if UVMDefaultFactory.m_debug_pass is False:
                     self.debug_create_by_type(requested_type, full_inst_path)
 
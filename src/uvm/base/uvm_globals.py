@@ -25,8 +25,8 @@
 #   preserved where possible.
 # ------------------------------------------------------------------------------
 
-from typing import List, Any
-from inspect import getframeinfo, stack
+import sys
+from typing import List, Any, Dict, Tuple
 
 import cocotb
 from cocotb.triggers import ReadWrite, NullTrigger
@@ -36,7 +36,7 @@ from .uvm_object_globals import (UVM_CALL_HOOK, UVM_COUNT, UVM_DISPLAY, UVM_ERRO
                                  UVM_FATAL, UVM_INFO, UVM_LOG, UVM_LOW, UVM_MEDIUM, UVM_NONE,
                                  UVM_NO_ACTION, UVM_RM_RECORD, UVM_STOP, UVM_WARNING)
 from .uvm_debug import UVMDebug, uvm_debug
-from .sv import uvm_glob_to_re, uvm_re_match
+from .sv import sv, uvm_glob_matcher
 from .uvm_exceptions import UVMFinishError
 
 """
@@ -111,55 +111,52 @@ def uvm_report_enabled(verbosity, severity=UVM_INFO, id=""):
 
 
 def uvm_report_info(id, message, verbosity=UVM_MEDIUM, filename="", line=0,
-        context_name="", report_enabled_checked=False):
+        context_name="", report_enabled_checked=False, args=()):
     if uvm_report_enabled(verbosity, UVM_INFO, id):
         cs = get_cs()
         top = cs.get_root()
-        # tpoikela: Do not refactor into function
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        if filename == "" or line == 0:
+            caller_file, caller_line = uvm_get_caller_file_line(1)
+            if filename == "":
+                filename = caller_file
+            if line == 0:
+                line = caller_line
         top.uvm_report_info(id, message, verbosity, filename, line, context_name,
-                report_enabled_checked)
+                report_enabled_checked, args)
 
 
 def uvm_report_error(id, message, verbosity=UVM_LOW, filename="", line=0,
-        context_name="", report_enabled_checked=False):
+        context_name="", report_enabled_checked=False, args=()):
     if uvm_report_enabled(verbosity, UVM_ERROR, id):
         cs = get_cs()
         top = cs.get_root()
-        # tpoikela: Do not refactor into function
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        if filename == "" or line == 0:
+            caller_file, caller_line = uvm_get_caller_file_line(1)
+            if filename == "":
+                filename = caller_file
+            if line == 0:
+                line = caller_line
         top.uvm_report_error(id, message, verbosity, filename, line, context_name,
-                report_enabled_checked)
+                report_enabled_checked, args)
 
 
 def uvm_report_warning(id, message, verbosity=UVM_LOW, filename="", line=0,
-        context_name="", report_enabled_checked=False):
+        context_name="", report_enabled_checked=False, args=()):
     if uvm_report_enabled(verbosity, UVM_WARNING, id):
         cs = get_cs()
         top = cs.get_root()
-        # tpoikela: Do not refactor into function
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        if filename == "" or line == 0:
+            caller_file, caller_line = uvm_get_caller_file_line(1)
+            if filename == "":
+                filename = caller_file
+            if line == 0:
+                line = caller_line
         top.uvm_report_warning(id, message, verbosity, filename, line, context_name,
-                report_enabled_checked)
+                report_enabled_checked, args)
 
 
 def uvm_report_fatal(id, message, verbosity=UVM_NONE, filename="", line=0,
-        context_name="", report_enabled_checked=False):
+        context_name="", report_enabled_checked=False, args=()):
     """
     These methods, defined in package scope, are convenience functions that
     delegate to the corresponding component methods in ~uvm_top~. They can be
@@ -169,20 +166,94 @@ def uvm_report_fatal(id, message, verbosity=UVM_NONE, filename="", line=0,
     *Note:* Verbosity is ignored for warnings, errors, and fatals to ensure users
     do not inadvertently filter them out. It remains in the methods for backward
     compatibility.
+
+    The message can be given lazily, see `uvm_format_message`.
     """
 
     if uvm_report_enabled(verbosity, UVM_FATAL, id):
         cs = get_cs()
         top = cs.get_root()
-        # tpoikela: Do not refactor into function
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        if filename == "" or line == 0:
+            caller_file, caller_line = uvm_get_caller_file_line(1)
+            if filename == "":
+                filename = caller_file
+            if line == 0:
+                line = caller_line
         top.uvm_report_fatal(id, message, verbosity, filename, line, context_name,
-                report_enabled_checked)
+                report_enabled_checked, args)
+
+
+def uvm_format_message(message, args=()) -> str:
+    """
+    Resolves a lazily given report message into a string. This is called by
+    the reporting functions and macros only after the message has passed
+    the verbosity check, so filtered messages are never formatted.
+
+    If `args` are given, `message` is a SV-style format string passed to
+    `sv.sformatf` with `args`. Otherwise, if `message` is a callable, it is
+    called without arguments and its return value is used as the message.
+
+    Args:
+        message (str|callable): Message, format string or callable.
+        args (tuple): Arguments for the format string.
+    Returns:
+        str: Formatted message.
+    """
+    if args:
+        return sv.sformatf(message, *args)
+    if callable(message):
+        return message()
+    return message
+
+
+# Maps a call site (code object, bytecode offset) to its (filename, line)
+_m_uvm_call_sites: Dict[Tuple[Any, int], Tuple[str, int]] = {}
+_m_uvm_report_file_line_disabled = False
+
+
+def uvm_report_disable_file_line(disable=True) -> None:
+    """
+    Disables (or re-enables) the capture of filename and line number for
+    the reporting macros and functions. This is the Python equivalent of
+    defining UVM_REPORT_DISABLE_FILE_LINE in SV. When disabled, no caller
+    frame is inspected at all, and messages are printed without file/line.
+
+    Args:
+        disable (bool): True to drop file/line information.
+    """
+    global _m_uvm_report_file_line_disabled
+    _m_uvm_report_file_line_disabled = disable
+
+
+def uvm_report_file_line_disabled() -> bool:
+    """
+    Returns:
+        bool: True if file/line capture for reports has been disabled.
+    """
+    return _m_uvm_report_file_line_disabled
+
+
+def uvm_get_caller_file_line(depth=1) -> Tuple[str, int]:
+    """
+    Returns the filename and line number of the caller `depth` frames
+    above the function calling this. Only a single frame is looked up, and
+    the result is cached per call site, so this is much cheaper than
+    using `inspect.stack()`.
+
+    Args:
+        depth (int): Number of frames to go up from the calling function.
+    Returns:
+        tuple(str, int): Filename and line number, or ("", 0) if disabled.
+    """
+    if _m_uvm_report_file_line_disabled:
+        return ("", 0)
+    frame = sys._getframe(depth + 1)
+    key = (frame.f_code, frame.f_lasti)
+    site = _m_uvm_call_sites.get(key)
+    if site is None:
+        site = (frame.f_code.co_filename, frame.f_lineno)
+        _m_uvm_call_sites[key] = site
+    return site
 
 
 def uvm_process_report_message(report_message):
@@ -246,8 +317,7 @@ def uvm_is_match(expr: str, _str: str) -> int:
     character. The 2nd argument, ~str~, is the string begin matched against.
     It must not contain any wildcards.
     """
-    s = uvm_glob_to_re(expr)
-    return uvm_re_match(s, _str) == 0
+    return uvm_glob_matcher(expr)(_str)
 
 
 UVM_LINE_WIDTH = 120
@@ -20,10 +20,11 @@
 #
 #----------------------------------------------------------------------
 
+from collections import deque
 from .uvm_queue import UVMQueue
 from cocotb.triggers import Event, Timer
 from .uvm_debug import UVMDebug, uvm_debug
-from typing import List, Any
+from typing import List, Any, Deque
 
 
 def _uvm_debug(self, func, msg):
@@ -35,48 +36,43 @@ OutputItem = List[Any]
 class UVMMailbox():
     """
     Class to mimic SystemVerilog mailbox class.
+
+    Blocked getters, putters and peekers wait in FIFO order, each on its own
+    Event. Putting an item wakes the first blocked getter (and all blocked
+    peekers), and getting an item wakes the first blocked putter, so a state
+    change does not wake every waiter.
     """
 
     def __init__(self, size=0, name='mailbox'):
         self.max_size = size
         self.name = name
         self.m_queue = UVMQueue()
-        self.m_read_event = Event('mailbox_read_event')
-        self.m_write_event = Event('mailbox_write_event')
+        self.m_get_waiters: Deque[Event] = deque()
+        self.m_put_waiters: Deque[Event] = deque()
+        self.m_peek_waiters: Deque[Event] = deque()
+        self.m_free_events: List[Event] = []
         self.debug_enabled = False
 
 
     async def put(self, item: Any) -> None:
-        _uvm_debug(self, 'put', 'Starting to check can_put()')
-        can_put = self.can_put()
-        while can_put is False:
-            self.m_read_event.clear()
-            await self.m_read_event.wait()
-            self.m_read_event.clear()
-            can_put = self.can_put()
-        _uvm_debug(self, 'put', 'Putting an event into item queue')
+        retry = False
+        while not self.can_put():
+            _uvm_debug(self, 'put', 'Mailbox full, waiting for a get')
+            await self.m_wait(self.m_put_waiters, retry)
+            retry = True
         self.m_queue.push_back(item)
-        _uvm_debug(self, 'put', 'ZZZ pushed to queue, can_get is ' + str(self.can_get()))
-        self.m_write_event.set()
+        self.m_item_added()
         _uvm_debug(self, 'put', 'Finished')
 
 
     async def get(self, itemq: OutputItem=None) -> Any:
-        can_get = self.can_get()
-        while can_get is False:
-            _uvm_debug(self, 'get', 'waiting write event to get item')
-            self.m_write_event.clear()
-            await self.m_write_event.wait()
-            self.m_write_event.clear()
-            _uvm_debug(self, 'get', 'event cleared, can_get ' + str(self.can_get()))
-            can_get = self.can_get()
-
-        _uvm_debug(self, 'get', 'wait write event DONE')
-        if not self.can_get():
-            raise Exception('can_get() should return True, but got false. q: ' +
-                    str(self.m_queue))
+        retry = False
+        while not self.can_get():
+            _uvm_debug(self, 'get', 'Mailbox empty, waiting for a put')
+            await self.m_wait(self.m_get_waiters, retry)
+            retry = True
         item = self.m_queue.pop_front()
-        self.m_read_event.set()
+        self.m_item_removed()
         _uvm_debug(self, 'get', 'getting an item from mailbox now')
         if itemq is not None:
             itemq.append(item)
@@ -85,24 +81,55 @@ class UVMMailbox():
 
     async def peek(self, itemq: OutputItem=None) -> Any:
         """ Peeks (with blocking) next item from mailbox without removing it """
-        if not self.can_get():
-            _uvm_debug(self, 'get', 'waiting write event to get item')
-            self.m_write_event.clear()
-            await self.m_write_event.wait()
-            self.m_write_event.clear()
-            _uvm_debug(self, 'get', 'event cleared, can_get ' + str(self.can_get()))
+        while not self.can_get():
+            _uvm_debug(self, 'peek', 'Mailbox empty, waiting for a put')
+            await self.m_wait(self.m_peek_waiters, False)
         item = self.m_queue.front()
         if itemq is not None:
             itemq.append(item)
         return item
 
+    async def put_many(self, items) -> None:
+        """
+        Puts all `items` into the mailbox in order, blocking whenever the
+        mailbox is full.
+
+        Args:
+            items: Iterable of items
+        """
+        for item in items:
+            if self.can_put():
+                self.m_queue.push_back(item)
+                self.m_item_added()
+            else:
+                await self.put(item)
+
+    async def get_many(self, num: int, itemq: OutputItem=None) -> List[Any]:
+        """
+        Gets `num` items from the mailbox, blocking until all of them have
+        been received.
+
+        Args:
+            num (int): Number of items to get.
+            itemq: Optional list to which the items are appended.
+        Returns:
+            list: Items in the order they were put.
+        """
+        items = []
+        while len(items) < num:
+            if self.can_get():
+                items.append(self.m_queue.pop_front())
+                self.m_item_removed()
+            else:
+                items.append(await self.get())
+        if itemq is not None:
+            itemq.extend(items)
+        return items
+
     def try_put(self, item: Any) -> bool:
-        _uvm_debug(self, 'try_put', 'Starting function')
         if self.can_put() is True:
-            _uvm_debug(self, 'try_put', 'can_put is True')
             self.m_queue.push_back(item)
-            _uvm_debug(self, 'try_put', 'pushed to queue, can_get is ' + str(self.can_get()))
-            self.m_write_event.set()
+            self.m_item_added()
             _uvm_debug(self, 'try_put', 'try_put finishing OK')
             return True
         return False
@@ -120,11 +147,30 @@ class UVMMailbox():
         if self.can_get() is True:
             item = self.m_queue.pop_front()
             itemq.append(item)
-            self.m_read_event.set()
+            self.m_item_removed()
             _uvm_debug(self, 'try_get', 'try_get finishing OK')
             return True
         return False
 
+    def try_get_many(self, itemq: OutputItem, max_items: int = -1) -> int:
+        """
+        Retrieves the items available in the mailbox without blocking, up to
+        `max_items` of them (all if -1), and appends them to the given list.
+
+        Args:
+            itemq: List[Any]
+            max_items (int): Maximum number of items to get.
+        Returns:
+            int: Number of items retrieved.
+        """
+        num = self.m_queue.size()
+        if 0 <= max_items < num:
+            num = max_items
+        for _ in range(num):
+            itemq.append(self.m_queue.pop_front())
+            self.m_item_removed()
+        return num
+
     def try_peek(self, itemq: OutputItem) -> bool:
         """
         Tries to "peek" an item and append it to given list.
@@ -152,4 +198,46 @@ class UVMMailbox():
         return self.m_queue.size() < self.max_size
 
     def num(self) -> int:
-        return self.m_queue.size() > 0
+        """
+        Returns:
+            int: Number of items in the mailbox.
+        """
+        return self.m_queue.size()
+
+    async def m_wait(self, waiters: Deque[Event], retry: bool) -> None:
+        """
+        Blocks until woken from `waiters`. A waiter which was woken but
+        could not proceed (another process took the item or slot first)
+        retries at the front of the list.
+        """
+        event = self.m_free_events.pop() if self.m_free_events else Event()
+        if retry:
+            waiters.appendleft(event)
+        else:
+            waiters.append(event)
+        try:
+            await event.wait()
+        except BaseException:
+            # Killed while waiting, do not lose a wakeup meant for it
+            if event in waiters:
+                waiters.remove(event)
+            elif event.is_set():
+                self.m_wake(waiters)
+            raise
+        event.clear()
+        self.m_free_events.append(event)
+
+    def m_wake(self, waiters: Deque[Event]) -> None:
+        if waiters:
+            waiters.popleft().set()
+
+    def m_item_added(self) -> None:
+        if self.m_peek_waiters:
+            peek_waiters = self.m_peek_waiters
+            self.m_peek_waiters = deque()
+            for event in peek_waiters:
+                event.set()
+        self.m_wake(self.m_get_waiters)
+
+    def m_item_removed(self) -> None:
+        self.m_wake(self.m_put_waiters)
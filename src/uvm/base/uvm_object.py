@@ -65,6 +65,10 @@ class UVMObject(sv_obj):
     uvm_global_copy_map = {}  # type: Dict['UVMObject', 'UVMObject']
     _m_uvm_status_container = UVMStatusContainer()
 
+    # Set by the UVMObjectRegistry of a pooled type, see release()
+    m_pool = None
+    m_released = False
+
     def __init__(self, name: str):
         """ Creates a new uvm_object with the given instance `name`. If `name` is not
         supplied, the object is unnamed.
@@ -298,6 +302,49 @@ class UVMObject(sv_obj):
             tmp.copy(self)
         return tmp
 
+    def release(self) -> None:
+        """
+        Group: Pooling
+
+        Returns this object into the free list of its type, if pooling has been
+        enabled for the type with `UVMObjectRegistry.set_pool_size`. The factory
+        reuses released objects when creating new objects of the same type,
+        after calling `reinit` on them. Objects not created by the factory from
+        a pooled type are left to the garbage collector.
+
+        The object must not be used after it has been released. With pool
+        debugging on, any access to a released object raises
+        `UVMReleasedObjectError`.
+        """
+        if self.m_pool is not None:
+            self.m_pool.m_release(self)
+
+    def reinit(self, name: str) -> None:
+        """
+        Re-initializes an object taken from the free list of its type before the
+        factory returns it. Gives the object the new instance `name` and a new
+        instance id, and then calls `do_reinit`. Classes which set up state in
+        their constructor extend this method to reset it.
+
+        Args:
+            name (str): Name of the reused object.
+        """
+        self.name = name
+        self.leaf_name = name
+        self.inst_id = UVMObject.m_inst_count
+        UVMObject.m_inst_count += 1
+        # Accessor id of the old name in the compact resource audit trail
+        self.__dict__.pop("m_audit_id", None)
+        self.do_reinit()
+
+    def do_reinit(self) -> None:
+        """
+        The `do_reinit` method is the user-definable hook called by `reinit`.
+        A derived class should override this method to reset its own fields to
+        the values set by its constructor.
+        """
+        return
+
     def print_obj(self, printer=None) -> None:
         """
         Group: Printing
@@ -702,9 +749,7 @@ class UVMObject(sv_obj):
     #                                  input uvm_packer packer=None)
     def pack_bytes(self, bytestream, packer=None) -> Any:
         packer = self.m_pack(packer)
-        packed_bytes = packer.get_bytes()
-        for b in packed_bytes:
-            bytestream.append(b)
+        bytestream.extend(packer.m_get_stream_bytes())
         return packer.get_packed_size()
 
 
@@ -729,12 +774,97 @@ class UVMObject(sv_obj):
         #  extern function int pack_ints (ref int unsigned intstream[],
         #                                 input uvm_packer packer=None)
         packer = self.m_pack(packer)
-        ints = packer.get_ints()
-        for i in ints:
-            intstream.append(i)
+        intstream.extend(packer.get_ints())
         return packer.get_packed_size()
 
 
+    def pack_into(self, buf, offset=0, packer=None) -> int:
+        """
+        Packs this object like `pack_bytes`, but writes the bytes straight
+        into the buffer `buf` starting at byte `offset`. `buf` can be a
+        `bytearray`, which is grown as needed, or any writable buffer such as
+        a `memoryview` or a NumPy array.
+
+        To unpack from a buffer without copying it, pass the buffer (or a
+        `memoryview` slice of it) to `unpack_bytes`.
+
+        Args:
+            buf: Writable buffer.
+            offset (int): Byte offset into `buf`.
+            packer (UVMPacker):
+        Returns:
+            int: Packed size in bits
+        """
+        packer = self.m_pack(packer)
+        packer.get_bytes_into(buf, offset)
+        return packer.get_packed_size()
+
+
+    @classmethod
+    def pack_batch(cls, items, buf=None, packer=None, as_numpy=False):
+        """
+        Packs a list of items of the same type back to back into one
+        contiguous buffer, as `pack_bytes` would pack each of them. Every item
+        takes `stride` bytes, its packed size rounded up to whole bytes, so
+        all items must have the same packed size.
+
+        Args:
+            items (list): Items to pack.
+            buf: Writable buffer to pack into. If None, a `bytearray` is
+                allocated.
+            packer (UVMPacker):
+            as_numpy (bool): Return a NumPy `uint8` array of shape
+                (len(items), stride) viewing the buffer. Requires NumPy.
+        Returns:
+            tuple: (buf, stride)
+        """
+        stride = 0
+        offset = 0
+        for item in items:
+            packer = item.m_pack(packer)
+            nbytes = (packer.get_packed_size() + 7) >> 3
+            if offset == 0:
+                stride = nbytes
+                if buf is None:
+                    buf = bytearray(stride * len(items))
+            elif nbytes != stride:
+                uvm_report_error("BDPACK", sv.sformatf(
+                    "Item %s packs into %0d bytes, expected %0d bytes",
+                    item.get_name(), nbytes, stride), UVM_NONE)
+                break
+            packer.get_bytes_into(buf, offset)
+            offset += stride
+        if buf is None:
+            buf = bytearray()
+        if as_numpy:
+            import numpy
+            buf = numpy.frombuffer(buf, dtype=numpy.uint8,
+                count=stride * len(items)).reshape(len(items), stride)
+        return buf, stride
+
+
+    @classmethod
+    def unpack_batch(cls, items, buf, stride, packer=None) -> int:
+        """
+        Unpacks the items from a buffer created by `pack_batch`. With
+        little-endian packing the buffer is read in place, without copying.
+
+        Args:
+            items (list): Items to unpack into.
+            buf: Buffer with `stride` bytes per item.
+            stride (int): Number of bytes per item.
+            packer (UVMPacker):
+        Returns:
+            int: Total number of bits unpacked
+        """
+        num_bits = 0
+        with memoryview(buf).cast('B') as view:
+            for i, item in enumerate(items):
+                num_bits += item.unpack_bytes(view[i * stride:(i + 1) * stride],
+                    packer)
+        return num_bits
+
+
     def do_pack(self, packer) -> None:
         """
         Function: do_pack
@@ -815,7 +945,11 @@ class UVMObject(sv_obj):
     def unpack_bytes(self, bytestream, packer=None) -> Any:
         packer = self.m_unpack_pre(packer)
         packer.put_bytes(bytestream)
-        self.m_unpack_post(packer)
+        try:
+            self.m_unpack_post(packer)
+        finally:
+            # Do not keep the caller's buffer pinned
+            packer.m_release_buf()
         packer.set_packed_size()
         return packer.get_packed_size()
 
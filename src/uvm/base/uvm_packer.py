@@ -27,11 +27,32 @@ from .uvm_scope_stack import UVMScopeStack
 from .sv import sv
 from ..macros.uvm_message_defines import uvm_error, uvm_warning
 from typing import List
+import keyword
+import struct
 
 
 SIZEOF_INT = 32
 MASK_INT = 0xFFFFFFFF
 
+# Bit-reversed value of each byte
+REV_BYTE = bytes(int('{:08b}'.format(i)[::-1], 2) for i in range(256))
+
+# Pending bits are moved from the accumulator int to the byte buffer once
+# there are this many of them, so that appends stay O(size)
+PACK_FLUSH_BITS = 1024
+
+
+def uvm_flip_bits(value: int, size: int) -> int:
+    """
+    Reverses the order of the `size` lowest bits of `value`, which must be
+    less than 2**size.
+    """
+    if size <= 8:
+        return REV_BYTE[value] >> (8 - size)
+    nbytes = (size + 7) >> 3
+    return int.from_bytes(value.to_bytes(nbytes, 'little').translate(REV_BYTE),
+        'big') >> ((nbytes << 3) - size)
+
 
 class UVMPacker(object):
     """
@@ -142,7 +163,16 @@ class UVMPacker(object):
         self.word_size     = 16  # set up worksize for endianess
         self.nopack = 0          # only count packable bits
         self.policy = UVM_DEFAULT_POLICY
-        self.m_bits = 0x0  # uvm_pack_bitstream_t
+        # The bitstream: bits [0, 8*len(m_buf)) are stored in m_buf, LSB of
+        # each byte first, followed by m_acc_bits pending bits in m_acc.
+        # m_nbits is the total number of stored bits. After m_flush, the last
+        # byte of m_buf can be partial. m_buf is a memoryview of the caller's
+        # buffer after put_bytes, until something is packed into it or
+        # m_release_buf is called.
+        self.m_buf = bytearray()
+        self.m_acc = 0
+        self.m_acc_bits = 0
+        self.m_nbits = 0
         self.m_packed_size = 0
 
 
@@ -153,14 +183,7 @@ class UVMPacker(object):
     #
     #  extern def pack_field(self,uvm_bitstream_t value, int size):
     def pack_field(self, value, size) -> None:
-        #  for (int i=0; i<size; i++)
-        if self.big_endian == 1:
-            flipped = self.flip_bit_order(value, size)
-            self.m_bits |= flipped << self.count
-            # self.m_bits[count+i] = value[size-1-i]
-        else:
-            self.m_bits |= value << self.count
-        self.count += size
+        self.pack_field_int(value, size)
 
 
     #  // Function: pack_field_int
@@ -171,13 +194,10 @@ class UVMPacker(object):
     #  // to 64 bits.
     def pack_field_int(self, value: int, size: int) -> None:
         if self.big_endian == 1:
-            flipped = self.flip_bit_order(value, size)
-            self.m_bits |= flipped << self.count
-            #self.m_bits[self.count+i] = value[size-1-i]
-        else:
-            self.m_bits |= value << self.count
-            #self.m_bits[self.count+i] = value[i]
-        self.count += size
+            value = self.flip_bit_order(value, size)
+        elif value >> size:
+            value &= (1 << size) - 1
+        self.m_put(value, size)
 
 
     #  // Function: pack_bits
@@ -206,12 +226,12 @@ class UVMPacker(object):
                 size, max_size))
             return
         else:
-            for i in range(len(value)):
-                byte = value[i]
-                if self.big_endian == 1:
-                    byte = self.flip_bit_order(value[len(value)-1-i], 8)
-                self.m_bits |= byte << self.count
-                self.count += 8
+            # In big-endian mode, the whole array is bit-reversed
+            if self.big_endian == 1:
+                bits = int.from_bytes(bytes(value).translate(REV_BYTE), 'big')
+            else:
+                bits = int.from_bytes(bytes(value), 'little')
+            self.m_put(bits, max_size)
 
 
     #  // Function: pack_ints
@@ -254,13 +274,12 @@ class UVMPacker(object):
                     size, max_size))
             return
         else:
-            for i in range(len(value)):
-                int_num = value[i]
-                if self.big_endian == 1:
-                    int_num = self.flip_bit_order(value[len(value)-1-i],
-                        SIZEOF_INT)
-                self.m_bits |= int_num << self.count
-                self.count += SIZEOF_INT
+            data = struct.pack('<%dI' % len(value), *value)
+            if self.big_endian == 1:
+                bits = int.from_bytes(data.translate(REV_BYTE), 'big')
+            else:
+                bits = int.from_bytes(data, 'little')
+            self.m_put(bits, max_size)
 
 
     #  // Function: pack_string
@@ -278,11 +297,10 @@ class UVMPacker(object):
         bytearr = value.encode()
 
         size = 8 * len(bytearr)
-        bits = int(bytearr.hex(), 16)
+        bits = int.from_bytes(bytearr, 'big')
         if self.big_endian == 1:
             bits = self.flip_bit_order(bits, -1)
-        self.m_bits |= bits << self.count
-        self.count += size
+        self.m_put(bits, size)
         if self.use_metadata == 1:
             pass
             # TODO self.m_bits |= 0 << self.count
@@ -408,19 +426,9 @@ class UVMPacker(object):
     #  extern def unpack_field_int(self,int size):
     def unpack_field_int(self, size) -> int:
         unpack_field_int = 0x0
-        count_before = self.count
         if self.enough_bits(size,"integral"):
+            unpack_field_int = self.m_get(self.count, size)
             self.count += size
-            for i in range(size):
-                if self.big_endian:
-                    bit_sel = self.count-i-1
-                    bit_sel = (1 << bit_sel)
-                    unpack_field_int |= self.m_bits & bit_sel
-                else:
-                    bit_sel = self.count-size+i
-                    bit_sel = (1 << bit_sel)
-                    unpack_field_int |= self.m_bits & bit_sel
-        unpack_field_int >>= count_before
         if self.big_endian:
             unpack_field_int = self.flip_bit_order(unpack_field_int, size)
         return unpack_field_int
@@ -450,14 +458,13 @@ class UVMPacker(object):
             return []
         else:
             if self.enough_bits(size, "integral"):
+                data = self.m_get(self.count, max_size).to_bytes(len(value), 'little')
                 self.count += size
-                for b in range(len(value)):
-                    byte = (self.m_bits >> b * 8) & 0xFF
-                    if self.big_endian == 1:
-                        byte = self.flip_bit_order(byte, 8)
-                        value[len(value)-1-b] = byte
-                    else:
-                        value[b] = byte
+                # In big-endian mode, the whole array is bit-reversed
+                if self.big_endian == 1:
+                    value[:] = data[::-1].translate(REV_BYTE)
+                else:
+                    value[:] = data
             return value
 
 
@@ -501,14 +508,13 @@ class UVMPacker(object):
             return
         else:
             if self.enough_bits(size, "integral"):
+                data = self.m_get(self.count, max_size).to_bytes(4 * len(value), 'little')
                 self.count += size
-                for i in range(len(value)):
-                    int_num = (self.m_bits >> i * SIZEOF_INT) & 0xFFFFFFFF
-                    if self.big_endian == 1:
-                        int_num = self.flip_bit_order(int_num, SIZEOF_INT)
-                        value[len(value)-1-i] = int_num
-                    else:
-                        value[i] = int_num
+                if self.big_endian == 1:
+                    value[:] = struct.unpack('<%dI' % len(value),
+                        data[::-1].translate(REV_BYTE))
+                else:
+                    value[:] = struct.unpack('<%dI' % len(value), data)
             return value
 
 
@@ -532,27 +538,18 @@ class UVMPacker(object):
         # We'll use bytearray to decode this, so need to find the num of bytes
 
         byte_arr = bytearray()
-        #unpack_string = 0
-        curr_byte = (self.m_bits >> self.count) & 0xFF
+        curr_byte = self.m_get(self.count, 8)
         while (self.enough_bits(8,"string", is_error=False) and
               ((curr_byte != 0) or (is_null_term == 0)) and
               ((i < num_chars) or (is_null_term == 1))):
-            # silly, because cannot append byte/char to string
-            #unpack_string = unpack_string + " "
-            #if self.big_endian == 0:
-            #    unpack_string[i] = self.m_bits[count +: 8]
-            #else:
-            #    for(int j=0; j<8; ++j)
-            #        b[7-j] = self.m_bits[count+j]
-            #  unpack_string[i] = b
             i += 1
-            byte_arr.insert(0, curr_byte)
+            byte_arr.append(curr_byte)
             self.count += 8
-            curr_byte = (self.m_bits >> self.count) & 0xFF
+            curr_byte = self.m_get(self.count, 8)
         if self.enough_bits(8,"string", is_error=False):
             self.count += 8
+        byte_arr.reverse()
         return byte_arr.decode()
-        #return unpack_string
 
 
     #  // Function: unpack_time
@@ -598,7 +595,7 @@ class UVMPacker(object):
         value._m_uvm_status_container.cycle_check[value] = 1
 
         if self.use_metadata == 1:
-            is_non_null = get_bits(self.m_bits, self.count, 4) != 0  # [count +: 4]
+            is_non_null = self.m_get(self.count, 4) != 0  # [count +: 4]
             self.count += 4
 
         # NOTE- policy is a ~pack~ policy, not unpack policy;
@@ -638,7 +635,7 @@ class UVMPacker(object):
     def get_bit(self, index) -> int:
         if index >= self.m_packed_size:
             self.index_error(index, "bit",1)
-        return (self.m_bits >> index) & 0x1
+        return self.m_get(index, 1)
 
 
     #  extern def byte unsigned get_byte (self,int unsigned index):
@@ -650,38 +647,47 @@ class UVMPacker(object):
 
     #  extern def get_bytes(self,ref byte unsigned bytes[]):
     def get_bytes(self) -> List[int]:
-        sz = 0
-        v = 0x00
-        sz = int((self.m_packed_size+7) / 8)
-        bytes = [0] * sz
-        for i in range(sz):
-            if (i != sz-1 or (self.m_packed_size % 8) == 0):
-                v = (self.m_bits >> (i * 8)) & 0xFF
-            else:
-                sel = (0xFF >> (8-(self.m_packed_size % 8)))
-                v = (self.m_bits >> (i * 8)) & sel
-            if self.big_endian:
-                v = self.flip_bit_order(v, 8)
-            bytes[i] = v
-        return bytes
+        return list(self.m_get_stream_bytes())
+
+    def get_bytes_into(self, buf, offset=0) -> int:
+        """
+        Writes the packed bytes into the buffer `buf` starting at byte
+        `offset`, without building an intermediate list. A `bytearray` is
+        grown as needed, other writable buffers (`memoryview`, `array`,
+        NumPy arrays) must have room for the packed bytes.
+
+        Args:
+            buf: Writable buffer.
+            offset (int): Byte offset into `buf`.
+        Returns:
+            int: Number of bytes written.
+        """
+        data = self.m_get_stream_bytes()
+        nbytes = len(data)
+        if isinstance(buf, bytearray):
+            if offset > len(buf):
+                buf.extend(bytes(offset - len(buf)))
+            buf[offset:offset + nbytes] = data
+            return nbytes
+        view = memoryview(buf).cast('B')
+        if offset + nbytes > len(view):
+            uvm_error("PCKBUF", sv.sformatf(
+                "%0d bytes needed at offset %0d, but the buffer has only %0d bytes.",
+                nbytes, offset, len(view)))
+            return 0
+        view[offset:offset + nbytes] = data
+        return nbytes
 
 
     #  extern def get_ints(self):
     def get_ints(self) -> List[int]:
-        sz = 0
-        v = 0
-        sz = int((self.m_packed_size+31) / SIZEOF_INT)
-        ints = [0] * sz
-        for i in range(sz):
-            if i != sz-1 or (self.m_packed_size % 32) == 0:
-                v = (self.m_bits >> (i * SIZEOF_INT)) & 0xFFFFFFFF
-            else:
-                sel = (0xFFFFFFFF >> (32-(self.m_packed_size % 32)))
-                v = (self.m_bits >> (i * SIZEOF_INT)) & sel
-            if self.big_endian:
-                v = self.flip_bit_order(v, SIZEOF_INT)
-            ints[i] = v
-        return ints
+        sz = (self.m_packed_size + 31) >> 5
+        data = self.m_get_packed_bytes(4 * sz)
+        if self.big_endian:
+            # Flipping the bits of each byte and reading the ints as
+            # big-endian flips the bits of each int
+            return list(struct.unpack('>%dI' % sz, data.translate(REV_BYTE)))
+        return list(struct.unpack('<%dI' % sz, data))
 
 
     #  extern def put_bits(self,ref bit unsigned bitstream[]):
@@ -697,11 +703,37 @@ class UVMPacker(object):
         #      self.m_bits[i] = bitstream[i]
         #
         self.m_bits = bitstream
-        self.m_packed_size = len(bin(self.m_bits)) - 2
+        self.m_packed_size = len(bin(bitstream)) - 2
         self.count = 0
 
     #  extern def put_bytes(self,ref byte unsigned bytestream[]):
+    def put_bytes(self, bytestream):
+        """
+        Sets the bitstream to be unpacked from a list of bytes or any object
+        supporting the buffer protocol (`bytes`, `bytearray`, `memoryview`,
+        NumPy arrays). With little-endian packing a buffer is used in place,
+        without copying, so it must not be modified until unpacking is done.
+        The unpack methods of `UVMObject` release the buffer when done.
+        """
+        try:
+            data = memoryview(bytestream).cast('B')
+        except TypeError:
+            data = bytes(bytestream)
+        if self.big_endian:
+            data = bytearray(data).translate(REV_BYTE)
+        self.m_set_buf(data, 8 * len(data))
+        self.m_packed_size = 8 * len(data)
+        self.count = 0
+
     #  extern def put_ints(self,ref int unsigned intstream[]):
+    def put_ints(self, intstream):
+        if self.big_endian:
+            data = struct.pack('>%dI' % len(intstream), *intstream).translate(REV_BYTE)
+        else:
+            data = struct.pack('<%dI' % len(intstream), *intstream)
+        self.m_set_buf(bytearray(data), 32 * len(intstream))
+        self.m_packed_size = 32 * len(intstream)
+        self.count = 0
 
 
     def set_packed_size(self):
@@ -727,24 +759,121 @@ class UVMPacker(object):
 
     def reset(self):
         self.count = 0
-        self.m_bits = 0
+        self.m_set_buf(bytearray(), 0)
         self.m_packed_size = 0
 
     def flip_bit_order(self, value, size: int) -> int:
-        flipped = 0x0
-        num_bits = len(bin(value)) - 2
-        while value:
-            flipped = (flipped << 1) + (value & 0x1)  # Choose LSB
-            value = value >> 1
-        # For packing, need to add some right-padding
-        if size != -1:
-            rem_bits = size - num_bits
-            if rem_bits >= 0:
-                flipped <<= rem_bits
-            else:
-                raise Exception("rem_bits negative. size: {}, value: {}".format(
-                    size, hex(value)))
-        return flipped
+        """
+        Reverses the order of the lowest `size` bits of `value`. If `size` is
+        -1, reverses all bits up to the most significant 1 of `value`.
+        """
+        num_bits = value.bit_length() or 1
+        if size == -1:
+            size = num_bits
+        elif size < num_bits:
+            raise Exception("rem_bits negative. size: {}, value: {}".format(
+                size, hex(value)))
+        return uvm_flip_bits(value, size)
+
+    #  // Bitstream storage, do not use directly
+
+    @property
+    def m_bits(self) -> int:
+        self.m_flush()
+        return int.from_bytes(self.m_buf, 'little')
+
+    @m_bits.setter
+    def m_bits(self, bits: int) -> None:
+        nbits = bits.bit_length()
+        self.m_set_buf(bytearray(bits.to_bytes((nbits + 7) >> 3, 'little')), nbits)
+
+    def m_set_buf(self, buf: bytearray, nbits: int) -> None:
+        self.m_buf = buf
+        self.m_acc = 0
+        self.m_acc_bits = 0
+        self.m_nbits = nbits
+
+    def m_release_buf(self) -> None:
+        """
+        Releases the caller's buffer given to `put_bytes`, so that it can be
+        resized again (a `bytearray` cannot be while a view of it exists).
+        """
+        if type(self.m_buf) is memoryview:
+            self.m_buf.release()
+            self.m_set_buf(bytearray(), 0)
+
+    def m_put(self, value: int, size: int) -> None:
+        """
+        Writes `size` bits of `value` at `count` and advances `count`.
+        Writes at the end of the bitstream go to the accumulator in O(size),
+        others are OR-ed into the bitstream.
+        """
+        if self.count == self.m_nbits:
+            if self.m_acc_bits == 0 and type(self.m_buf) is not bytearray:
+                # Buffer given to put_bytes
+                self.m_buf = bytearray(self.m_buf)
+            if self.m_acc_bits == 0 and (len(self.m_buf) << 3) > self.m_nbits:
+                # Continue the partial last byte left by m_flush
+                self.m_acc = self.m_buf.pop()
+                self.m_acc_bits = self.m_nbits & 7
+            self.m_acc |= value << self.m_acc_bits
+            self.m_acc_bits += size
+            self.m_nbits += size
+            if self.m_acc_bits >= PACK_FLUSH_BITS:
+                nbytes = self.m_acc_bits >> 3
+                self.m_buf += (self.m_acc & ((1 << (nbytes << 3)) - 1)).to_bytes(
+                    nbytes, 'little')
+                self.m_acc >>= nbytes << 3
+                self.m_acc_bits &= 7
+        else:
+            nbits = max(self.m_nbits, self.count + size)
+            bits = self.m_bits | (value << self.count)
+            self.m_set_buf(bytearray(bits.to_bytes((nbits + 7) >> 3, 'little')), nbits)
+        self.count += size
+
+    def m_flush(self) -> None:
+        """
+        Moves the pending bits of the accumulator into `m_buf`.
+        """
+        if self.m_acc_bits:
+            self.m_buf += self.m_acc.to_bytes((self.m_acc_bits + 7) >> 3, 'little')
+            self.m_acc = 0
+            self.m_acc_bits = 0
+
+    def m_get(self, pos: int, size: int) -> int:
+        """
+        Returns `size` bits of the bitstream starting at bit `pos` in O(size).
+        Bits beyond the end of the bitstream are 0.
+        """
+        self.m_flush()
+        value = int.from_bytes(self.m_buf[pos >> 3:(pos + size + 7) >> 3], 'little')
+        return (value >> (pos & 7)) & ((1 << size) - 1)
+
+    def m_get_packed_bytes(self, nbytes: int) -> bytearray:
+        """
+        Returns the first `nbytes` bytes of the bitstream, with the bits
+        beyond `m_packed_size` cleared.
+        """
+        self.m_flush()
+        data = self.m_buf[:nbytes]
+        if type(data) is not bytearray:
+            data = bytearray(data)
+        if len(data) < nbytes:
+            data += bytes(nbytes - len(data))
+        full = self.m_packed_size >> 3
+        if full < nbytes:
+            data[full] &= 0xFF >> (8 - (self.m_packed_size & 7))
+            data[full + 1:] = bytes(nbytes - full - 1)
+        return data
+
+    def m_get_stream_bytes(self) -> bytearray:
+        """
+        Returns the packed bytes in the order of `get_bytes`.
+        """
+        data = self.m_get_packed_bytes((self.m_packed_size + 7) >> 3)
+        if self.big_endian:
+            data = data.translate(REV_BYTE)
+        return data
 
 
 #//------------------------------------------------------------------------------
@@ -958,3 +1087,156 @@ def get_bits(bits, count, nbits):  # [count +: 4]
         val |= (1 << (nbits - idx)) & (bits >> (i-idx))
         idx += 1
     return val
+
+
+class UVMPackLayout(object):
+    """
+    A fixed bit layout of an item, compiled into one shift/mask codec.
+
+    The layout is declared as a list of (field_name, width) tuples in packing
+    order. Packing an item with the layout gives the same bits as calling
+    `UVMPacker.pack_field_int(getattr(item, name), width)` for each field in
+    order, but in one step. Values wider than their field are truncated.
+
+    .. code-block:: python
+
+      class BusItem(UVMSequenceItem):
+          ...
+          layout = UVMPackLayout([("addr", 32), ("data", 16), ("kind", 4)])
+
+          def do_pack(self, packer):
+              BusItem.layout.pack(self, packer)
+
+          def do_unpack(self, packer):
+              BusItem.layout.unpack(self, packer)
+
+    `to_bytes`/`from_bytes` and `pack_array`/`unpack_array` encode and decode
+    items directly, without a packer. They match `pack_bytes`/`pack_batch`
+    of an object which packs only the layout.
+    """
+
+    def __init__(self, fields):
+        self.fields = tuple((name, width) for name, width in fields)
+        for name, width in self.fields:
+            if not isinstance(name, str) or not name.isidentifier() or keyword.iskeyword(name):
+                raise ValueError("UVMPackLayout: invalid field name " + repr(name))
+            if not isinstance(width, int) or width <= 0:
+                raise ValueError("UVMPackLayout: invalid width {} for field {}".format(
+                    width, name))
+        self.size = sum(width for _, width in self.fields)
+        self.nbytes = (self.size + 7) >> 3
+        self.m_pad = (self.nbytes << 3) - self.size
+        self.m_mask = (1 << self.size) - 1
+        self.m_compile()
+
+    def get_packed_size(self) -> int:
+        """
+        Returns:
+            int: Number of bits packed by the layout.
+        """
+        return self.size
+
+    def m_compile(self):
+        """
+        Generates the codec functions. Little-endian packing puts the first
+        field at bit 0 of the stream. For big-endian packing the codec works on
+        the bit-reversed stream, where the first field is at the most
+        significant bits and each field keeps its own bit order.
+        """
+        enc_le = []
+        enc_be = []
+        dec_le = []
+        dec_be = []
+        offset = 0
+        for name, width in self.fields:
+            mask = hex((1 << width) - 1)
+            shift_be = self.size - offset - width
+            enc_le.append("((item.{} & {}) << {})".format(name, mask, offset))
+            enc_be.append("((item.{} & {}) << {})".format(name, mask, shift_be))
+            dec_le.append("    item.{} = (value >> {}) & {}".format(name, offset, mask))
+            dec_be.append("    item.{} = (value >> {}) & {}".format(name, shift_be, mask))
+            offset += width
+        src = ["def m_encode_le(item):",
+            "    return " + (" | ".join(enc_le) or "0"),
+            "def m_encode_be(item):",
+            "    return " + (" | ".join(enc_be) or "0"),
+            "def m_decode_le(item, value):"] + dec_le + ["    pass",
+            "def m_decode_be(item, value):"] + dec_be + ["    pass"]
+        ns = {}
+        exec(compile("\n".join(src) + "\n", "<uvm_pack_layout>", "exec"), ns)
+        self.m_encode_le = ns["m_encode_le"]
+        self.m_encode_be = ns["m_encode_be"]
+        self.m_decode_le = ns["m_decode_le"]
+        self.m_decode_be = ns["m_decode_be"]
+
+    def pack(self, item, packer: UVMPacker) -> None:
+        """
+        Packs the fields of `item` into `packer`.
+        """
+        if packer.big_endian:
+            packer.m_put(uvm_flip_bits(self.m_encode_be(item), self.size), self.size)
+        else:
+            packer.m_put(self.m_encode_le(item), self.size)
+
+    def unpack(self, item, packer: UVMPacker) -> None:
+        """
+        Unpacks the fields of `item` from `packer`.
+        """
+        if packer.enough_bits(self.size, "layout"):
+            value = packer.m_get(packer.count, self.size)
+            packer.count += self.size
+            if packer.big_endian:
+                self.m_decode_be(item, uvm_flip_bits(value, self.size))
+            else:
+                self.m_decode_le(item, value)
+
+    def to_bytes(self, item, big_endian=1) -> bytes:
+        """
+        Returns the `nbytes` bytes of `item`, as `pack_bytes` would give them.
+        """
+        if big_endian:
+            return (self.m_encode_be(item) << self.m_pad).to_bytes(self.nbytes, 'big')
+        return self.m_encode_le(item).to_bytes(self.nbytes, 'little')
+
+    def from_bytes(self, item, data, big_endian=1) -> None:
+        """
+        Sets the fields of `item` from the first `nbytes` bytes of `data`.
+        """
+        if big_endian:
+            self.m_decode_be(item, int.from_bytes(data[:self.nbytes], 'big') >> self.m_pad)
+        else:
+            self.m_decode_le(item, int.from_bytes(data[:self.nbytes], 'little')
+                & self.m_mask)
+
+    def pack_array(self, items, big_endian=1) -> bytearray:
+        """
+        Packs `items` back to back, `nbytes` bytes per item.
+        """
+        nbytes = self.nbytes
+        if big_endian:
+            encode = self.m_encode_be
+            pad = self.m_pad
+            return bytearray(b''.join([(encode(item) << pad).to_bytes(nbytes, 'big')
+                for item in items]))
+        encode = self.m_encode_le
+        return bytearray(b''.join([encode(item).to_bytes(nbytes, 'little')
+            for item in items]))
+
+    def unpack_array(self, items, buf, big_endian=1) -> None:
+        """
+        Unpacks `items` from a buffer created by `pack_array`.
+        """
+        nbytes = self.nbytes
+        with memoryview(buf).cast('B') as view:
+            if big_endian:
+                decode = self.m_decode_be
+                pad = self.m_pad
+                for i, item in enumerate(items):
+                    decode(item, int.from_bytes(view[i * nbytes:(i + 1) * nbytes],
+                        'big') >> pad)
+            else:
+                decode = self.m_decode_le
+                mask = self.m_mask
+                for i, item in enumerate(items):
+                    decode(item, int.from_bytes(view[i * nbytes:(i + 1) * nbytes],
+                        'little') & mask)
@@ -26,7 +26,9 @@
 #------------------------------------------------------------------------------
 
 
-from typing import Union, Generic, TypeVar, List, Optional, Any
+from collections import deque
+from itertools import islice
+from typing import Union, Generic, TypeVar, List, Optional, Any, Deque, Iterator
 
 from .uvm_object import UVMObject
 from .uvm_globals import uvm_report_warning
@@ -37,6 +39,9 @@ T = TypeVar('T')
 class UVMQueue(UVMObject, Generic[T]):
     """
     Implements a class-based dynamic queue.
+
+    The items are stored in a `collections.deque`, so that pushing and
+    popping at either end are O(1).
     """
 
     type_name = "uvm_queue"
@@ -44,7 +49,7 @@ class UVMQueue(UVMObject, Generic[T]):
 
     def __init__(self, name=""):
         UVMObject.__init__(self, name)
-        self.queue: List[T] = list()
+        self.queue: Deque[T] = deque()
 
     @classmethod
     def get_global_queue(cls) -> 'UVMQueue':
@@ -113,6 +118,14 @@ class UVMQueue(UVMObject, Generic[T]):
         """
         return self.size()
 
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over a snapshot of the items, so the queue can be modified
+        while iterating.
+        Returns:
+        """
+        return iter(list(self.queue))
+
     def __setitem__(self, i: int, value):
         """
         Implements aa[x] = y
@@ -137,11 +150,10 @@ class UVMQueue(UVMObject, Generic[T]):
         Raises:
         """
         if isinstance(i, slice):
-            # TODO should handle slices like [:] and [:-1]
-            res = []
-            for i in range(slice.start, slice.stop):
-                res.append(self.queue[i])
-            return res
+            start, stop, step = i.indices(len(self.queue))
+            if step == 1:
+                return list(islice(self.queue, start, stop))
+            return list(self.queue)[i]
         elif i < self.size():
             return self.queue[i]
         else:
@@ -179,9 +191,9 @@ class UVMQueue(UVMObject, Generic[T]):
                 .format(self.size()))
             return
         if index == -1:
-            self.queue = list()
+            self.queue = deque()
         else:
-            self.queue.pop(index)
+            del self.queue[index]
 
     def pop_front(self) -> T:
         """
@@ -193,9 +205,7 @@ class UVMQueue(UVMObject, Generic[T]):
         Raises:
         """
         if self.size() > 0:
-            val = self.queue[0]
-            del self.queue[0]
-            return val
+            return self.queue.popleft()
         else:
             raise Exception('pop_front() called on empty queue')
 
@@ -206,7 +216,7 @@ class UVMQueue(UVMObject, Generic[T]):
 
     def back(self) -> Optional[T]:
         if self.size() > 0:
-            return self.queue[len(self.queue) - 1]
+            return self.queue[-1]
         return None
 
     def pop_back(self) -> Optional[T]:
@@ -227,7 +237,7 @@ class UVMQueue(UVMObject, Generic[T]):
         Args:
             item:
         """
-        self.queue.insert(0, item)
+        self.queue.appendleft(item)
 
     def push_back(self, item: T) -> None:
         """
@@ -253,7 +263,7 @@ class UVMQueue(UVMObject, Generic[T]):
         self.queue = rhs.queue
 
     def convert2string(self) -> str:
-        return str(self.queue)
+        return str(list(self.queue))
 
     def __str__(self) -> str:
         return self.convert2string()
@@ -274,8 +284,7 @@ class UVMQueue(UVMObject, Generic[T]):
 
     def find_first_index(self, find_func) -> int:
         idx = -1
-        for i in range(len(self.queue)):
-            ee = self.queue[i]
+        for i, ee in enumerate(self.queue):
             if find_func(ee):
                 idx = i
                 break
@@ -37,7 +37,8 @@ the proxy to create the object it represents.
 
 
 from .uvm_factory import UVMObjectWrapper
-from .uvm_globals import uvm_report_warning, uvm_report_fatal
+from .uvm_globals import uvm_report_warning, uvm_report_fatal, uvm_report_error
+from .uvm_exceptions import UVMReleasedObjectError
 from .uvm_object_globals import UVM_NONE
 # from .uvm_component import UVMComponent
 from .uvm_object import UVMObject
@@ -50,6 +51,11 @@ def get_factory():
     return cs.get_factory()
 
 
+def _m_released_access(obj, name, *args):
+    raise UVMReleasedObjectError("Access to '" + name + "' of an object after"
+        + " it has been released")
+
+
 class UVMComponentRegistry(UVMObjectWrapper):
     """
     CLASS: UVMComponentRegistry #(T,Tname)
@@ -245,6 +251,10 @@ class UVMObjectRegistry(UVMObjectWrapper):
         UVMObjectRegistry.objs[tname] = Constr
         UVMObjectRegistry.registered[tname] = False
         UVMObjectRegistry.registry_db[tname] = self.get()
+        # Free list of released objects, None when pooling is off
+        self.m_free_list = None
+        self.m_pool_size = 0
+        self.m_released_type = None
 
     @staticmethod
     def reset() -> None:
@@ -262,8 +272,82 @@ class UVMObjectRegistry(UVMObjectWrapper):
         `UVMObject`. This is an override of the method in `UVMObjectWrapper`.
         It is called by the factory after determining the type of object to create.
         You should not call this method directly. Call <create> instead.
+
+        If pooling is enabled with `set_pool_size`, a released object is taken
+        from the free list and re-initialized with `UVMObject.reinit` instead.
+        """
+        free_list = self.m_free_list
+        if free_list is None:
+            return UVMObjectRegistry.objs[self.tname](name)
+        if free_list:
+            obj = free_list.pop()
+            if self.m_released_type is not None:
+                object.__setattr__(obj, "__class__", self.Constr)
+            obj.m_released = False
+            obj.reinit(name)
+            return obj
+        obj = UVMObjectRegistry.objs[self.tname](name)
+        obj.m_pool = self
+        return obj
+
+    def set_pool_size(self, size: int, debug=False) -> None:
+        """
+        Function: set_pool_size
+
+        Enables pooling for objects of type ~T~. Up to `size` objects released
+        with `UVMObject.release` are kept in a free list, from which
+        `create_object` reuses them. Released objects beyond `size` are left to
+        the garbage collector. A `size` of 0 turns pooling off.
+
+        If `debug` is set, released objects raise `UVMReleasedObjectError` on
+        any attribute access until they are reused, which catches objects used
+        after they have been released.
+
+        Args:
+            size (int): Maximum number of objects in the free list.
+            debug (bool): Detect the use of released objects.
+        """
+        self.m_pool_size = size
+        if size <= 0:
+            self.m_free_list = None
+            self.m_released_type = None
+            return
+        if self.m_free_list is None:
+            self.m_free_list = []
+        del self.m_free_list[size:]
+        if debug:
+            self.m_released_type = type("Released" + self.Constr.__name__,
+                (self.Constr,), {"__getattribute__": _m_released_access,
+                    "__setattr__": _m_released_access})
+        elif self.m_released_type is not None:
+            # Restore the objects released while debug was on
+            for obj in self.m_free_list:
+                object.__setattr__(obj, "__class__", self.Constr)
+            self.m_released_type = None
+
+    def get_pool_size(self) -> int:
+        """
+        Function: get_pool_size
+
+        Returns the maximum size of the free list, or 0 if pooling is off.
+
+        Returns:
+            int: Pool size.
         """
-        return UVMObjectRegistry.objs[self.tname](name)
+        return self.m_pool_size
+
+    def m_release(self, obj) -> None:
+        if obj.m_released:
+            uvm_report_error("OBJREL", "Object '" + obj.get_name() + "' of type '"
+                + self.tname + "' has already been released", UVM_NONE)
+            return
+        free_list = self.m_free_list
+        if free_list is None or len(free_list) >= self.m_pool_size:
+            return
+        obj.m_released = True
+        free_list.append(obj)
+        if self.m_released_type is not None:
+            object.__setattr__(obj, "__class__", self.m_released_type)
 
     def get_type_name(self) -> str:
         """
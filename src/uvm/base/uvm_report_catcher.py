@@ -28,7 +28,8 @@ from .sv import sv
 from ..macros import uvm_info_context
 from ..uvm_macros import UVM_STRING_QUEUE_STREAMING_PACK
 from .uvm_report_message import UVMReportMessage
-from .uvm_globals import uvm_report_enabled
+from .uvm_globals import uvm_report_enabled, uvm_format_message, uvm_is_match
+from typing import Dict, Tuple, Any
 
 
 class sev_id_struct:
@@ -146,13 +147,26 @@ class UVMReportCatcher(UVMCallback):
 
     do_report = False
 
+    # Number of catchers created. While zero, the report server skips
+    # catcher processing altogether.
+    m_num_catchers = 0
+
+    # report object -> all catchers registered for it, in order
+    m_obj_catchers: Dict[Any, Tuple['UVMReportCatcher', ...]] = {}
+    # (report object, severity, id) -> positions of interested catchers
+    m_index: Dict[Tuple[Any, int, str], Tuple[int, ...]] = {}
+    # UVMCallbacksBase.m_generation when the index was built
+    m_index_generation = -1
+
     #// Function: new
     #//
     #// Create a new report catcher. The name argument is optional, but
     #// should generally be provided to aid in debugging.
     def __init__(self, name="uvm_report_catcher"):
         super().__init__(name)
+        self.m_catch_filters = []
         UVMReportCatcher.do_report = True
+        UVMReportCatcher.m_num_catchers += 1
 
     #// Group: Current Message State
     #
@@ -332,6 +346,43 @@ class UVMReportCatcher(UVMCallback):
         self.m_modified_report_message.add_object(name, obj, action)
 
 
+    #// Group: Message Filtering
+
+    def add_catch_filter(self, severity=None, id=None):
+        """
+        Declares that this catcher is interested in messages with the given
+        `severity` and `id`. The `id` can contain the wildcards '*' and '?'.
+        None matches any severity or id. Several filters can be added, and
+        a message matching any of them is passed to `catch`.
+
+        A catcher without any filters sees all messages. Catchers which are
+        not interested in a message are skipped without calling `catch`.
+
+        Args:
+            severity: Severity of the messages to catch.
+            id (str): Id (or a pattern) of the messages to catch.
+        """
+        self.m_catch_filters.append((severity, id))
+        UVMReportCatcher.m_index.clear()
+
+    def is_interested(self, severity, id) -> bool:
+        """
+        Args:
+            severity: Severity of the message.
+            id (str): Id of the message.
+        Returns:
+            bool: True if a message with given `severity` and `id` matches
+            the filters of this catcher.
+        """
+        if len(self.m_catch_filters) == 0:
+            return True
+        for (f_sev, f_id) in self.m_catch_filters:
+            if f_sev is not None and f_sev != severity:
+                continue
+            if f_id is None or uvm_is_match(f_id, id):
+                return True
+        return False
+
     #// Group: Debug
 
     cb_iter = None  # static variable for get_report_catcher iterator
@@ -410,10 +461,10 @@ class UVMReportCatcher(UVMCallback):
     # // This message will bypass any message catching callbacks.
     #
     def uvm_report_fatal(self, id, message, verbosity, fname="", line=0,
-            context_name="", report_enabled_checked=0):
+            context_name="", report_enabled_checked=0, args=()):
 
         self.uvm_report(UVM_FATAL, id, message, UVM_NONE, fname, line,
-            context_name, report_enabled_checked)
+            context_name, report_enabled_checked, args)
 
 
     # // Function: uvm_report_error
@@ -422,9 +473,9 @@ class UVMReportCatcher(UVMCallback):
     # // This message will bypass any message catching callbacks.
     #
     def uvm_report_error(self, id, message, verbosity, fname="", line=0,
-            context_name="", report_enabled_checked=0):
+            context_name="", report_enabled_checked=0, args=()):
         self.uvm_report(UVM_ERROR, id, message, UVM_NONE, fname, line,
-            context_name, report_enabled_checked)
+            context_name, report_enabled_checked, args)
 
     # // Function: uvm_report_warning
     # //
@@ -432,9 +483,9 @@ class UVMReportCatcher(UVMCallback):
     # // This message will bypass any message catching callbacks.
     #
     def uvm_report_warning(self, id, message, verbosity, fname="", line=0,
-            context_name="", report_enabled_checked=0):
+            context_name="", report_enabled_checked=0, args=()):
         self.uvm_report(UVM_WARNING, id, message, UVM_NONE, fname, line,
-            context_name, report_enabled_checked)
+            context_name, report_enabled_checked, args)
 
 
     # // Function: uvm_report_info
@@ -443,9 +494,9 @@ class UVMReportCatcher(UVMCallback):
     # // This message will bypass any message catching callbacks.
     #
     def uvm_report_info(self, id, message, verbosity, fname="", line=0,
-            context_name="", report_enabled_checked=0):
+            context_name="", report_enabled_checked=0, args=()):
         self.uvm_report(UVM_INFO, id, message, verbosity, fname, line,
-            context_name, report_enabled_checked)
+            context_name, report_enabled_checked, args)
 
 
     # // Function: uvm_report
@@ -460,13 +511,15 @@ class UVMReportCatcher(UVMCallback):
         fname="",
         line=0,
         context_name="",
-        report_enabled_checked=0):
+        report_enabled_checked=0,
+        args=()):
 
         l_report_message = None
         if report_enabled_checked == 0:
             if not uvm_report_enabled(verbosity, severity, id):
                 return
 
+        message = uvm_format_message(message, args)
         l_report_message = UVMReportMessage.new_report_message()
         l_report_message.set_report_message(severity, id, message,
                             verbosity, fname, line, context_name)
@@ -517,8 +570,6 @@ class UVMReportCatcher(UVMCallback):
     #//
     @classmethod
     def process_all_report_catchers(cls, rm):
-        _iter = UVMCallback("_iter")
-        catcher = None  # uvm_report_catcher
         thrown = 1
         orig_severity = 0  # uvm_severity
         #cls.in_catcher = 0  # static bit in_catcher
@@ -527,33 +578,37 @@ class UVMReportCatcher(UVMCallback):
         if cls.in_catcher == 1:
             return 1
 
+        orig_severity = rm.get_severity()  # cast to 'uvm_severity' removed
+        curr_id = rm.get_id()
+        catchers, positions = cls.m_get_catchers(l_report_object,
+            orig_severity, curr_id)
+        if len(positions) == 0:
+            return 1
+
         cls.in_catcher = 1
         UVMCallbacksBase.m_tracing = 0  # turn off cb tracing so catcher stuff doesn't print
-
-        orig_severity = rm.get_severity()  # cast to 'uvm_severity' removed
         cls.m_modified_report_message = rm
 
-        catcher = UVMReportCb.get_first(_iter, l_report_object)
-        if catcher is not None:
-            if cls.m_debug_flags & cls.DO_NOT_MODIFY:
-                #process p = process::self(); // Keep random stability
-                p = None
-                randstate = ""
-                if p is not None:
-                    randstate = p.get_randstate()
-                cls.m_orig_report_message = rm.clone()
-                #sv.cast(m_orig_report_message, rm.clone()) # have to clone, rm can be extended type
-                if p is not None:
-                    p.set_randstate(randstate)
-
-        while catcher is not None:
-            prev_sev = 0  # uvm_severity
-
+        if cls.m_debug_flags & cls.DO_NOT_MODIFY:
+            #process p = process::self(); // Keep random stability
+            p = None
+            randstate = ""
+            if p is not None:
+                randstate = p.get_randstate()
+            cls.m_orig_report_message = rm.clone()
+            #sv.cast(m_orig_report_message, rm.clone()) # have to clone, rm can be extended type
+            if p is not None:
+                p.set_randstate(randstate)
+
+        curr_sev = orig_severity
+        i = 0
+        while i < len(positions):
+            pos = positions[i]
+            i += 1
+            catcher = catchers[pos]
             if catcher.callback_mode() is False:
-                catcher = UVMReportCb.get_next(_iter, l_report_object)
                 continue
 
-
             prev_sev = cls.m_modified_report_message.get_severity()
             cls.m_set_action_called = False
             thrown = catcher.process_report_catcher()
@@ -577,7 +632,16 @@ class UVMReportCatcher(UVMCallback):
                 elif orig_severity == UVM_WARNING:
                     cls.m_caught_warning += 1
                 break
-            catcher = UVMReportCb.get_next(_iter,l_report_object)
+
+            # If the catcher changed the severity or id, the remaining
+            # catchers are selected using the new values
+            new_sev = cls.m_modified_report_message.get_severity()
+            new_id = cls.m_modified_report_message.get_id()
+            if new_sev != curr_sev or new_id != curr_id:
+                curr_sev, curr_id = new_sev, new_id
+                positions = [p for p in cls.m_get_catchers(l_report_object,
+                    curr_sev, curr_id)[1] if p > pos]
+                i = 0
 
         # update counters if message was returned with demoted severity
         if orig_severity == UVM_FATAL:
@@ -594,6 +658,35 @@ class UVMReportCatcher(UVMCallback):
         UVMCallbacksBase.m_tracing = 1  # turn tracing stuff back on
         return thrown
 
+    @classmethod
+    def m_get_catchers(cls, obj, severity, id):
+        """
+        Returns the catchers registered for the report object `obj` (in
+        registration order), and the positions of the catchers interested in
+        the given `severity` and `id`. Both are cached until a callback
+        is added or a catch filter is changed.
+        """
+        if cls.m_index_generation != UVMCallbacksBase.m_generation:
+            UVMReportCatcher.m_obj_catchers.clear()
+            UVMReportCatcher.m_index.clear()
+            UVMReportCatcher.m_index_generation = UVMCallbacksBase.m_generation
+
+        catchers = cls.m_obj_catchers.get(obj)
+        if catchers is None:
+            UVMReportCb.get()
+            cbs = UVMReportCb._get_typed_cbs(obj, UVMReportCatcher)
+            catchers = tuple(cb for cb in cbs.m_get_q(obj, UVMReportCatcher)
+                if isinstance(cb, UVMReportCatcher))
+            cls.m_obj_catchers[obj] = catchers
+
+        key = (obj, severity, id)
+        positions = cls.m_index.get(key)
+        if positions is None:
+            positions = tuple(i for i in range(len(catchers))
+                if catchers[i].is_interested(severity, id))
+            cls.m_index[key] = positions
+        return catchers, positions
+
 
     #//process_report_catcher
     #//internal method to call user <catch()> method
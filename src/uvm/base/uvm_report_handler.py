@@ -30,7 +30,7 @@ from .uvm_object_globals import (UVM_CALL_HOOK, UVM_COUNT, UVM_DISPLAY, UVM_ERRO
 from .uvm_globals import uvm_report_enabled
 from ..macros.uvm_object_defines import uvm_object_utils
 
-from typing import TextIO, Dict, Union
+from typing import TextIO, Dict, Union, Tuple, Any
 
 
 
@@ -54,6 +54,9 @@ class UVMReportHandler(UVMObject):
 
     def __init__(self, name=""):
         UVMObject.__init__(self, name)
+        # Resolved (verbosity, action, file) for each (severity, id). Cleared
+        # by every set_* method, see `_m_invalidate`.
+        self.m_decisions: Dict[Tuple[Any, str], Tuple[int, Any, Any]] = {}
         self.m_max_verbosity_level = 0
 
         # id verbosity settings : default and severity
@@ -315,9 +318,12 @@ class UVMReportHandler(UVMObject):
             if self.sev_overrides.exists(severity):
                 severity = self.sev_overrides.get(severity)
                 report_message.set_severity(severity)
-        report_message.set_file(self.get_file_handle(severity, id))
+        decision = self.m_decisions.get((severity, id))
+        if decision is None:
+            decision = self._m_resolve(severity, id)
+        report_message.set_file(decision[2])
         report_message.set_report_handler(self)
-        report_message.set_action(self.get_action(severity, id))
+        report_message.set_action(decision[1])
         srvr.process_report_message(report_message)
 
     #  //----------------------------------------------------------------------------
@@ -403,6 +409,7 @@ class UVMReportHandler(UVMObject):
             verbosity_level:
         """
         self.m_max_verbosity_level = verbosity_level
+        self._m_invalidate()
 
     def get_verbosity_level(self, severity=UVM_INFO, id="") -> int:
         """
@@ -417,6 +424,12 @@ class UVMReportHandler(UVMObject):
         Returns:
             int: Verbosity level of this handler.
         """
+        try:
+            return self.m_decisions[(severity, id)][0]
+        except KeyError:
+            return self._m_resolve(severity, id)[0]
+
+    def _m_get_verbosity_level(self, severity, id) -> int:
         if severity in self.severity_id_verbosities:
             array = self.severity_id_verbosities[severity]
             if array.exists(id):
@@ -442,6 +455,12 @@ class UVMReportHandler(UVMObject):
             id:
         Returns:
         """
+        try:
+            return self.m_decisions[(severity, id)][1]
+        except KeyError:
+            return self._m_resolve(severity, id)[1]
+
+    def _m_get_action(self, severity, id):
         if severity in self.severity_id_actions:
             array = self.severity_id_actions[severity]
             if array.exists(id):
@@ -466,6 +485,12 @@ class UVMReportHandler(UVMObject):
             id:
         Returns:
         """
+        try:
+            return self.m_decisions[(severity, id)][2]
+        except KeyError:
+            return self._m_resolve(severity, id)[2]
+
+    def _m_get_file_handle(self, severity, id):
         _file = self.get_severity_id_file(severity, id)
         if _file != 0:
             return _file
@@ -481,6 +506,23 @@ class UVMReportHandler(UVMObject):
                 return _file
         return self.default_file_handle
 
+    def _m_resolve(self, severity, id):
+        """
+        Resolves the verbosity, action and file for the ~(severity,id)~ pair,
+        and memoizes them until the next set_* call.
+        """
+        decision = (self._m_get_verbosity_level(severity, id),
+            self._m_get_action(severity, id),
+            self._m_get_file_handle(severity, id))
+        self.m_decisions[(severity, id)] = decision
+        return decision
+
+    def _m_invalidate(self):
+        """
+        Clears the memoized decisions. Must be called whenever the verbosity,
+        action or file settings change.
+        """
+        self.m_decisions.clear()
 
     def set_severity_action(self, severity, action):
         """
@@ -490,6 +532,7 @@ class UVMReportHandler(UVMObject):
             action:
         """
         self.severity_actions.add(severity, action)
+        self._m_invalidate()
 
     def set_id_action(self, id, action):
         """
@@ -499,6 +542,7 @@ class UVMReportHandler(UVMObject):
             action:
         """
         self.id_actions.add(id, action)
+        self._m_invalidate()
 
     def set_severity_id_action(self, severity, id, action):
         """
@@ -511,6 +555,7 @@ class UVMReportHandler(UVMObject):
         if severity not in self.severity_id_actions:
             self.severity_id_actions[severity] = UVMPool()
         self.severity_id_actions[severity].add(id, action)
+        self._m_invalidate()
 
     def set_id_verbosity(self, id, verbosity):
         """
@@ -520,6 +565,7 @@ class UVMReportHandler(UVMObject):
             verbosity:
         """
         self.id_verbosities.add(id, verbosity)
+        self._m_invalidate()
 
     def set_severity_id_verbosity(self, severity, id, verbosity):
         """
@@ -532,6 +578,7 @@ class UVMReportHandler(UVMObject):
         if severity not in self.severity_id_verbosities:
             self.severity_id_verbosities[severity] = UVMPool()
         self.severity_id_verbosities[severity].add(id,verbosity)
+        self._m_invalidate()
 
     def set_default_file(self, file):
         """
@@ -540,6 +587,7 @@ class UVMReportHandler(UVMObject):
             file:
         """
         self.default_file_handle = file
+        self._m_invalidate()
 
     def set_severity_file(self, severity, file):
         """
@@ -549,6 +597,7 @@ class UVMReportHandler(UVMObject):
             file:
         """
         self.severity_file_handles[severity] = file
+        self._m_invalidate()
 
     def set_id_file(self, id, file):
         """
@@ -558,6 +607,7 @@ class UVMReportHandler(UVMObject):
             file:
         """
         self.id_file_handles.add(id, file)
+        self._m_invalidate()
 
     def set_severity_id_file(self, severity, id, file):
         """
@@ -570,6 +620,7 @@ class UVMReportHandler(UVMObject):
         if severity not in self.severity_id_file_handles:
             self.severity_id_file_handles[severity] = UVMPool()
         self.severity_id_file_handles[severity].add(id, file)
+        self._m_invalidate()
 
     def set_severity_override(self, cur_severity, new_severity):
         self.sev_overrides.add(cur_severity, new_severity)
@@ -0,0 +1,347 @@
+"""
+Title: Structured Report Log
+
+A compact, structured alternative to the text log. `UVMReportLogWriter`
+stores each message as a record with the fields `UVM_REPORT_LOG_FIELDS`.
+The records are written in zlib-compressed chunks. Each chunk starts with
+an uncompressed index, which holds the message count for each
+(severity, id) pair and the time range of the chunk. This means the log
+can be counted, and chunks without any matching messages can be skipped,
+without decompressing them.
+
+The log is installed with `UVMReportServer.set_report_log`::
+
+    log = UVMReportLogWriter("sim_messages.uvmlog")
+    UVMReportServer.get_server().set_report_log(log, text=False)
+
+With `text=False`, the messages are not composed or written as text at
+all. The logs can be queried with `UVMReportLogReader`, or from the
+command line::
+
+    python -m uvm.base.uvm_report_log --count -s UVM_ERROR run*/sim_messages.uvmlog
+    python -m uvm.base.uvm_report_log -i "AXI/*" -g timeout sim_messages.uvmlog
+
+This module does not import anything from uvm, so it can also be run
+directly as a script, which avoids initializing the UVM library.
+
+File format: The file starts with `UVM_REPORT_LOG_MAGIC`. It is followed by
+any number of chunks, each consisting of:
+
+- a header: b"CHNK", index length (u32) and data length (u32), little-endian
+- the index as JSON: {"n": num records, "t": [first time, last time],
+  "counts": [[severity, id, count], ...]}
+- the data: zlib-compressed JSON lines, one list per record
+
+If the simulation dies while a chunk is being written, the reader ignores
+the incomplete chunk at the end of the file.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import struct
+import sys
+import zlib
+from typing import Any, Dict, Iterator, List, Tuple
+
+UVM_REPORT_LOG_MAGIC = b"UVMRLOG1"
+UVM_REPORT_LOG_FIELDS = ("time", "severity", "id", "verbosity", "name",
+    "filename", "line", "message")
+
+_CHUNK_MAGIC = b"CHNK"
+_CHUNK_HEADER = struct.Struct("<4sII")
+
+# Same as UVM_SEVERITY_NAMES. Duplicated here so that this module can be
+# used without importing uvm.
+_SEVERITY_NAMES = ["UVM_INFO", "UVM_WARNING", "UVM_ERROR", "UVM_FATAL"]
+
+
+def _severity_name(severity) -> str:
+    if isinstance(severity, int) and 0 <= severity < len(_SEVERITY_NAMES):
+        return _SEVERITY_NAMES[severity]
+    return str(severity)
+
+
+def _parse_severity(severity: str) -> int:
+    name = severity.upper()
+    if not name.startswith("UVM_"):
+        name = "UVM_" + name
+    if name not in _SEVERITY_NAMES:
+        raise ValueError("Unknown severity " + severity)
+    return _SEVERITY_NAMES.index(name)
+
+
+class UVMReportLogWriter:
+    """
+    Writes report messages into a structured log file. Records are
+    buffered and written out as one compressed chunk once `chunk_size`
+    records have been collected, or when `flush` is called.
+
+    Args:
+        filename (str): Name of the log file, overwritten if it exists.
+        chunk_size (int): Max number of records per chunk.
+        compress_level (int): zlib compression level (0-9).
+    """
+
+    def __init__(self, filename: str, chunk_size=4096, compress_level=6):
+        self.filename = filename
+        self.chunk_size = chunk_size
+        self.compress_level = compress_level
+        self.m_file = open(filename, "wb")
+        self.m_file.write(UVM_REPORT_LOG_MAGIC)
+        self.m_records: List[list] = []
+        self.m_counts: Dict[Tuple[int, str], int] = {}
+        self.m_num_written = 0
+
+    def write_message(self, report_message, time=0) -> None:
+        """
+        Adds a record for the given message.
+
+        Args:
+            report_message (UVMReportMessage): Message to log.
+            time (int): Simulation time of the message.
+        """
+        ro = report_message.get_report_object()
+        if ro is not None:
+            name = ro.get_full_name()
+        else:
+            rh = report_message.get_report_handler()
+            name = rh.get_full_name() if rh is not None else ""
+        context = report_message.get_context()
+        if context != "":
+            name = name + "@@" + context
+        self.write_record(time, report_message.get_severity(),
+            report_message.get_id(), report_message.get_verbosity(), name,
+            report_message.get_filename(), report_message.get_line(),
+            report_message.get_message())
+
+    def write_record(self, time, severity, id, verbosity, name, filename,
+            line, message) -> None:
+        """
+        Adds a record with the given fields. See `UVM_REPORT_LOG_FIELDS`.
+        """
+        self.m_records.append([time, severity, id, verbosity, name,
+            filename, line, message])
+        key = (severity, id)
+        self.m_counts[key] = self.m_counts.get(key, 0) + 1
+        if len(self.m_records) >= self.chunk_size:
+            self._m_write_chunk()
+
+    def get_num_written(self) -> int:
+        """
+        Returns:
+            int: Number of records written to the file so far. Records in
+            the current, unfinished chunk are not included.
+        """
+        return self.m_num_written
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records as a chunk, and flushes the file.
+        """
+        self._m_write_chunk()
+        self.m_file.flush()
+
+    def close(self) -> None:
+        """
+        Flushes and closes the log file.
+        """
+        if not self.m_file.closed:
+            self.flush()
+            self.m_file.close()
+
+    def _m_write_chunk(self) -> None:
+        records = self.m_records
+        if len(records) == 0:
+            return
+        data = "\n".join(json.dumps(r, separators=(",", ":")) for r in records)
+        data_bytes = zlib.compress(data.encode("utf-8"), self.compress_level)
+        index = {
+            "n": len(records),
+            "t": [records[0][0], records[-1][0]],
+            "counts": [[sev, id, n] for (sev, id), n in self.m_counts.items()],
+        }
+        index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        self.m_file.write(_CHUNK_HEADER.pack(_CHUNK_MAGIC, len(index_bytes),
+            len(data_bytes)))
+        self.m_file.write(index_bytes)
+        self.m_file.write(data_bytes)
+        self.m_num_written += len(records)
+        self.m_records = []
+        self.m_counts = {}
+
+
+class UVMReportLogReader:
+    """
+    Reads a log written by `UVMReportLogWriter`. Counting uses only the
+    chunk indices, and `messages` decompresses only the chunks which can
+    contain matching messages.
+
+    Args:
+        filename (str): Name of the log file.
+    Raises:
+        ValueError: If the file is not a report log.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            if f.read(len(UVM_REPORT_LOG_MAGIC)) != UVM_REPORT_LOG_MAGIC:
+                raise ValueError(filename + " is not a UVM report log")
+
+    def chunks(self) -> Iterator[Tuple[Dict[str, Any], int, int]]:
+        """
+        Iterates over the chunks without reading their data.
+
+        Returns:
+            Iterator: (index, data offset, data length) for each chunk.
+        """
+        with open(self.filename, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(len(UVM_REPORT_LOG_MAGIC))
+            while True:
+                header = f.read(_CHUNK_HEADER.size)
+                if len(header) < _CHUNK_HEADER.size:
+                    return
+                magic, index_len, data_len = _CHUNK_HEADER.unpack(header)
+                if magic != _CHUNK_MAGIC:
+                    return
+                index_bytes = f.read(index_len)
+                offset = f.tell()
+                if len(index_bytes) < index_len or size < offset + data_len:
+                    return  # Truncated chunk
+                f.seek(offset + data_len)
+                yield json.loads(index_bytes), offset, data_len
+
+    def count(self, severity=None, id=None) -> Dict[Tuple[int, str], int]:
+        """
+        Counts the messages from the chunk indices.
+
+        Args:
+            severity (int): Count only this severity, None for any.
+            id (str): Count only ids matching this pattern, None for any.
+        Returns:
+            dict: Number of messages for each (severity, id) pair.
+        """
+        counts: Dict[Tuple[int, str], int] = {}
+        for index, _, _ in self.chunks():
+            for sev, msg_id, n in index["counts"]:
+                if _match(sev, msg_id, severity, id):
+                    counts[(sev, msg_id)] = counts.get((sev, msg_id), 0) + n
+        return counts
+
+    def messages(self, severity=None, id=None, text=None, start=None,
+            end=None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over the matching messages in the order they were written.
+
+        Args:
+            severity (int): Severity of the messages, None for any.
+            id (str): Id pattern (with '*' and '?'), None for any.
+            text (str): Substring of the message, None for any.
+            start (int): Skip messages before this time.
+            end (int): Skip messages after this time.
+        Returns:
+            Iterator: Messages as dicts with the keys `UVM_REPORT_LOG_FIELDS`.
+        """
+        with open(self.filename, "rb") as f:
+            for index, offset, data_len in self.chunks():
+                t_first, t_last = index["t"]
+                if start is not None and t_last < start:
+                    continue
+                if end is not None and t_first > end:
+                    continue
+                if not any(_match(sev, msg_id, severity, id) for sev, msg_id, _
+                        in index["counts"]):
+                    continue
+                f.seek(offset)
+                data = zlib.decompress(f.read(data_len)).decode("utf-8")
+                for line in data.split("\n"):
+                    rec = json.loads(line)
+                    if not _match(rec[1], rec[2], severity, id):
+                        continue
+                    if text is not None and text not in rec[7]:
+                        continue
+                    if start is not None and rec[0] < start:
+                        continue
+                    if end is not None and rec[0] > end:
+                        continue
+                    yield dict(zip(UVM_REPORT_LOG_FIELDS, rec))
+
+
+def _match(sev, msg_id, severity, id) -> bool:
+    if severity is not None and sev != severity:
+        return False
+    return id is None or fnmatch.fnmatchcase(msg_id, id)
+
+
+def format_record(rec: Dict[str, Any]) -> str:
+    """
+    Formats a record like `UVMReportServer.compose_report_message`.
+
+    Args:
+        rec (dict): Record returned by `UVMReportLogReader.messages`.
+    Returns:
+        str: Message as a string.
+    """
+    file_line = ""
+    if rec["filename"] != "":
+        file_line = "{}({}) ".format(rec["filename"], rec["line"])
+    return "{} {}@ {}NS: {} [{}] {}".format(_severity_name(rec["severity"]),
+        file_line, rec["time"], rec["name"], rec["id"], rec["message"])
+
+
+def main(argv=None) -> int:
+    """
+    Command line interface for querying report logs.
+
+    Args:
+        argv (list): Arguments, sys.argv[1:] if None.
+    Returns:
+        int: Exit status.
+    """
+    parser = argparse.ArgumentParser(prog="uvm_report_log",
+        description="Filter and count messages in UVM report logs")
+    parser.add_argument("files", nargs="+", help="Report log files")
+    parser.add_argument("-s", "--severity",
+        help="Severity, ie. UVM_ERROR or error")
+    parser.add_argument("-i", "--id", help="Message id, can contain * and ?")
+    parser.add_argument("-g", "--grep", help="Substring of the message")
+    parser.add_argument("--start", type=int, help="Start time")
+    parser.add_argument("--end", type=int, help="End time")
+    parser.add_argument("-c", "--count", action="store_true",
+        help="Print message counts per severity and id")
+    args = parser.parse_args(argv)
+
+    severity = None
+    if args.severity is not None:
+        try:
+            severity = _parse_severity(args.severity)
+        except ValueError as e:
+            parser.error(str(e))
+
+    counts: Dict[Tuple[int, str], int] = {}
+    for filename in args.files:
+        reader = UVMReportLogReader(filename)
+        if args.count and args.grep is None and args.start is None and args.end is None:
+            for key, n in reader.count(severity, args.id).items():
+                counts[key] = counts.get(key, 0) + n
+            continue
+        for rec in reader.messages(severity, args.id, args.grep, args.start, args.end):
+            if args.count:
+                key = (rec["severity"], rec["id"])
+                counts[key] = counts.get(key, 0) + 1
+            else:
+                prefix = filename + ": " if len(args.files) > 1 else ""
+                print(prefix + format_record(rec))
+
+    if args.count:
+        for (sev, msg_id), n in sorted(counts.items()):
+            print("{:<12} {:<32} {}".format(_severity_name(sev), msg_id, n))
+        print("Total: {}".format(sum(counts.values())))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -27,6 +27,7 @@ from .uvm_object import UVMObject
 from .uvm_object_globals import (UVM_WARNING, UVM_INFO, UVM_ERROR, UVM_FATAL, UVM_LOW, UVM_NONE,
         UVM_MEDIUM)
 from .uvm_report_message import UVMReportMessage
+from .uvm_globals import uvm_format_message
 
 
 def get_verbosity(severity):
@@ -129,16 +130,34 @@ class UVMReportObject(UVMObject):
             filename="",
             line=0,
             context_name="",
-            report_enabled_checked=False):
+            report_enabled_checked=False,
+            args=()):
+        """
+        Issues a message with the given `severity`. The `message` can be a
+        string, a SV-style format string with its arguments given in `args`,
+        or a callable returning the message. Format strings and callables are
+        evaluated only if the message is enabled.
 
-        rng_state = random.getstate()  # tpoikela: Added to ensure logging does
-        # not affect Random Stability
+        Args:
+            severity (int): Severity of the message.
+            id (str): Message ID/tag.
+            message (str|callable): Message string, format or callable.
+            verbosity (int): Verbosity of the message.
+            filename (str): Filename of the caller.
+            line (int): Line from where this is called.
+            context_name (str): Name of the calling context.
+            report_enabled_checked (bool): Checks report enabled.
+            args (tuple): Arguments for the format string in `message`.
+        """
         if verbosity == -1:
             verbosity = get_verbosity(severity)
         l_report_message = None
         if report_enabled_checked is False:
             if not self.uvm_report_enabled(verbosity, severity, id):
                 return
+        rng_state = random.getstate()  # tpoikela: Added to ensure logging does
+        # not affect Random Stability
+        message = uvm_format_message(message, args)
         l_report_message = UVMReportMessage.new_report_message()
         l_report_message.set_report_message(severity, id, message,
                                             verbosity, filename, line, context_name)
@@ -146,7 +165,7 @@ class UVMReportObject(UVMObject):
         random.setstate(rng_state)
 
     def uvm_report_info(self, id, message, verbosity=UVM_MEDIUM, filename="",
-            line=0, context_name="", report_enabled_checked=False):
+            line=0, context_name="", report_enabled_checked=False, args=()):
         """
         Function: uvm_report_info
 
@@ -158,12 +177,13 @@ class UVMReportObject(UVMObject):
             line (int): Line from where this is called.
             context_name (str): Name of the calling context.
             report_enabled_checked (bool): Checks report enabled.
+            args (tuple): Arguments for the format string in `message`.
         """
         self.uvm_report(UVM_INFO, id, message, verbosity,
-                  filename, line, context_name, report_enabled_checked)
+                  filename, line, context_name, report_enabled_checked, args)
 
     def uvm_report_warning(self, id, message, verbosity=UVM_MEDIUM, filename="",
-            line=0, context_name="", report_enabled_checked=False):
+            line=0, context_name="", report_enabled_checked=False, args=()):
         """
         Function: uvm_report_warning
         Args:
@@ -174,12 +194,13 @@ class UVMReportObject(UVMObject):
             line:
             context_name:
             report_enabled_checked:
+            args:
         """
         self.uvm_report(UVM_WARNING, id, message, verbosity,
-                filename, line, context_name, report_enabled_checked)
+                filename, line, context_name, report_enabled_checked, args)
 
     def uvm_report_error(self, id, message, verbosity = UVM_LOW, filename = "",
-            line = 0, context_name = "", report_enabled_checked = False):
+            line = 0, context_name = "", report_enabled_checked = False, args=()):
         """
         Function: uvm_report_error
         Args:
@@ -190,12 +211,13 @@ class UVMReportObject(UVMObject):
             line:
             context_name:
             report_enabled_checked:
+            args:
         """
         self.uvm_report (UVM_ERROR, id, message, verbosity,
-                filename, line, context_name, report_enabled_checked)
+                filename, line, context_name, report_enabled_checked, args)
 
     def uvm_report_fatal(self, id, message, verbosity = UVM_NONE, filename = "",
-            line = 0, context_name = "", report_enabled_checked = False):
+            line = 0, context_name = "", report_enabled_checked = False, args=()):
         """
         Function: uvm_report_fatal
         Args:
@@ -206,9 +228,10 @@ class UVMReportObject(UVMObject):
             line:
             context_name:
             report_enabled_checked:
+            args:
         """
         self.uvm_report(UVM_FATAL, id, message, verbosity,
-                filename, line, context_name, report_enabled_checked)
+                filename, line, context_name, report_enabled_checked, args)
 
     def uvm_process_report_message(self, report_message):
         """
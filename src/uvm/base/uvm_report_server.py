@@ -12,7 +12,8 @@ from .uvm_global_vars import uvm_default_printer
 from .sv import sv
 from ..macros.uvm_message_defines import uvm_info
 from .uvm_tr_database import UVMTrDatabase, UVMTextTrDatabase
-from typing import List, Any, Callable
+from .uvm_report_catcher import UVMReportCatcher
+from typing import List, Any, Callable, Dict
 
 
 
@@ -40,6 +41,55 @@ def ename(sever) -> str:
     return "UNKNOWN_SEVERITY: {}".format(sever)
 
 
+class UVMReportRateLimit:
+    """
+    Rate limit for messages, see `UVMReportServer.set_id_rate_limit`.
+    Messages are counted separately for each key, and a message is shown
+    only if it passes all the limits which are set (non-zero).
+
+    Args:
+        first (int): Show the first `first` messages.
+        every (int): After the first ones, show every `every`th message.
+        max_per_us (int): Show at most `max_per_us` messages per simulated
+            microsecond.
+    """
+
+    def __init__(self, first=0, every=0, max_per_us=0):
+        self.first = first
+        self.every = every
+        self.max_per_us = max_per_us
+        # key -> [num messages, current microsecond, num shown in it]
+        self.m_state: Dict[Any, List[int]] = {}
+
+    def allow(self, key) -> bool:
+        """
+        Counts a message with the given key.
+
+        Args:
+            key: Key to count the message with, ie. message id.
+        Returns:
+            bool: True if the message should be shown, False if suppressed.
+        """
+        state = self.m_state.get(key)
+        if state is None:
+            state = [0, -1, 0]
+            self.m_state[key] = state
+        state[0] += 1
+        if self.first or self.every:
+            num_after_first = state[0] - self.first
+            if num_after_first > 0 and (self.every == 0 or
+                    num_after_first % self.every != 0):
+                return False
+        if self.max_per_us:
+            curr_us = uvm_sim_time('NS') // 1000
+            if curr_us != state[1]:
+                state[1] = curr_us
+                state[2] = 0
+            if state[2] >= self.max_per_us:
+                return False
+            state[2] += 1
+        return True
+
 
 class UVMReportServer(UVMObject):
     """
@@ -71,6 +121,12 @@ class UVMReportServer(UVMObject):
         self.set_max_quit_count(0)
         self.print_on_closed_file = True
         self.logger = print  # By default, use print to emit the messages
+        self.m_sink = None  # UVMReportSink, if set, writes all messages
+        self.m_report_log = None  # UVMReportLogWriter for structured records
+        self.m_text_output = True  # If False, messages are not composed
+        self.m_id_rate_limits: Dict[str, UVMReportRateLimit] = {}
+        self.m_sev_rate_limits: Dict[int, UVMReportRateLimit] = {}
+        self.m_suppressed_count: Dict[str, int] = {}  # id -> num suppressed
 
     def get_type_name(self) -> str:
         return "uvm_report_server"
@@ -95,6 +151,62 @@ class UVMReportServer(UVMObject):
         """
         self.logger = logger
 
+    def set_report_sink(self, sink) -> None:
+        """
+        Sets a report sink, which then receives all displayed (UVM_DISPLAY)
+        and logged (UVM_LOG) messages instead of the logger and the file
+        handles. For example, `UVMAsyncReportSink` writes the messages from a
+        background thread. The previous sink is flushed before replacing it.
+        Use None to remove the sink.
+
+        Args:
+            sink (UVMReportSink): Sink for the messages, or None.
+        """
+        if self.m_sink is not None:
+            self.m_sink.flush()
+        self.m_sink = sink
+
+    def get_report_sink(self):
+        """
+        Returns:
+            UVMReportSink: Report sink of this server, or None if not set.
+        """
+        return self.m_sink
+
+    def set_report_log(self, log, text=True) -> None:
+        """
+        Sets a structured report log, which receives all displayed
+        (UVM_DISPLAY) and logged (UVM_LOG) messages as records. See
+        `UVMReportLogWriter`. Use None to remove the log.
+
+        Args:
+            log (UVMReportLogWriter): Structured log, or None.
+            text (bool): If False, messages are written only to the log, and
+                are not composed into text at all.
+        """
+        if self.m_report_log is not None:
+            self.m_report_log.flush()
+        self.m_report_log = log
+        self.m_text_output = text or log is None
+
+    def get_report_log(self):
+        """
+        Returns:
+            UVMReportLogWriter: Structured report log, or None if not set.
+        """
+        return self.m_report_log
+
+    def flush(self) -> None:
+        """
+        Waits until all messages given to the report sink have been written
+        out, and writes out buffered records of the report log. Called in the
+        report and final phases, and on `UVMRoot.die`.
+        """
+        if self.m_sink is not None:
+            self.m_sink.flush()
+        if self.m_report_log is not None:
+            self.m_report_log.flush()
+
     # Function: print
     #
     # The uvm_report_server implements the `UVMObject.do_print()` such that
@@ -314,6 +426,80 @@ class UVMReportServer(UVMObject):
         else:
             self.m_id_count.add(id, 1)
 
+    #----------------------------------------------------------------------------
+    # Group: Rate Limits
+    #
+    # Rate limits suppress repeated messages before they are composed and
+    # written out. Suppressed messages are still counted by severity and id,
+    # and they still apply their UVM_COUNT, UVM_EXIT and UVM_STOP actions.
+    # The number of suppressed messages per id is printed in the report
+    # summary.
+    #----------------------------------------------------------------------------
+
+    def set_id_rate_limit(self, id, first=0, every=0, max_per_us=0) -> None:
+        """
+        Limits the displayed and logged messages with the given `id`. For
+        example, `first=10, every=100` shows the first 10 messages, and after
+        that every 100th message. Id limits have precedence over severity
+        limits. Use all zeros to remove the limit.
+
+        Args:
+            id (str): Message id.
+            first (int): Show the first `first` messages.
+            every (int): After the first ones, show every `every`th message.
+            max_per_us (int): Show at most this many messages per simulated
+                microsecond.
+        """
+        if first or every or max_per_us:
+            self.m_id_rate_limits[id] = UVMReportRateLimit(first, every, max_per_us)
+        elif id in self.m_id_rate_limits:
+            del self.m_id_rate_limits[id]
+
+    def set_severity_rate_limit(self, severity, first=0, every=0,
+            max_per_us=0) -> None:
+        """
+        Limits the displayed and logged messages with the given `severity`.
+        The messages of each id are counted separately. See
+        `set_id_rate_limit` for the arguments.
+
+        Args:
+            severity (int): Message severity.
+            first (int): Show the first `first` messages of each id.
+            every (int): After the first ones, show every `every`th message.
+            max_per_us (int): Show at most this many messages of each id per
+                simulated microsecond.
+        """
+        if first or every or max_per_us:
+            self.m_sev_rate_limits[severity] = UVMReportRateLimit(first, every,
+                max_per_us)
+        elif severity in self.m_sev_rate_limits:
+            del self.m_sev_rate_limits[severity]
+
+    def get_suppressed_count(self, id=None) -> int:
+        """
+        Args:
+            id (str): Message id, or None for all ids.
+        Returns:
+            int: Number of messages suppressed by the rate limits.
+        """
+        if id is None:
+            return sum(self.m_suppressed_count.values())
+        return self.m_suppressed_count.get(id, 0)
+
+    def m_is_suppressed(self, report_message) -> bool:
+        id = report_message.get_id()
+        if id in self.m_id_rate_limits:
+            allow = self.m_id_rate_limits[id].allow(id)
+        else:
+            severity = report_message.get_severity()
+            if severity not in self.m_sev_rate_limits:
+                return False
+            allow = self.m_sev_rate_limits[severity].allow(id)
+        if allow:
+            return False
+        self.m_suppressed_count[id] = self.m_suppressed_count.get(id, 0) + 1
+        return True
+
     #----------------------------------------------------------------------------
     # Group: message recording
     #
@@ -360,7 +546,12 @@ class UVMReportServer(UVMObject):
             file:
             _str:
         """
-        if file == 0:
+        if self.m_sink is not None:
+            if file == 0:
+                self.m_sink.display(_str)
+            else:
+                self.m_sink.write(file, _str)
+        elif file == 0:
             self.logger(_str)
             # print(_str)
         else:
@@ -378,8 +569,8 @@ class UVMReportServer(UVMObject):
         # Set the report server for this message
         report_message.set_report_server(self)
 
-        if report_ok is True:
-            from .uvm_report_catcher import UVMReportCatcher
+        # Catchers are only processed if any have been created
+        if report_ok is True and UVMReportCatcher.m_num_catchers > 0:
             report_ok = UVMReportCatcher.process_all_report_catchers(report_message)
 
         if report_message.get_action() == UVM_NO_ACTION:
@@ -391,8 +582,16 @@ class UVMReportServer(UVMObject):
             # give the global server a chance to intercept the calls
             svr = cs.get_report_server()
 
+            # Suppressed messages are only counted
+            if ((svr.m_id_rate_limits or svr.m_sev_rate_limits) and
+                    report_message.get_action() & (UVM_LOG | UVM_DISPLAY) and
+                    svr.m_is_suppressed(report_message)):
+                report_message.set_action(report_message.get_action() &
+                    ~(UVM_LOG | UVM_DISPLAY | UVM_RM_RECORD))
+
             # no need to compose when neither UVM_DISPLAY nor UVM_LOG is set
-            if report_message.get_action() & (UVM_LOG | UVM_DISPLAY):
+            if (report_message.get_action() & (UVM_LOG | UVM_DISPLAY) and
+                    svr.m_text_output):
                 m = svr.compose_report_message(report_message)
             svr.execute_report_message(report_message, m)
 
@@ -451,15 +650,23 @@ class UVMReportServer(UVMObject):
                     report_message.record(recorder)
                     recorder.free()
 
+        # Structured log gets all displayed and logged messages
+        if (self.m_report_log is not None and
+                report_message.get_action() & (UVM_LOG | UVM_DISPLAY)):
+            self.m_report_log.write_message(report_message, uvm_sim_time('NS'))
+
         # DISPLAY action
-        if report_message.get_action() & UVM_DISPLAY:
-            self.logger(composed_message)
+        if report_message.get_action() & UVM_DISPLAY and self.m_text_output:
+            if self.m_sink is not None:
+                self.m_sink.display(composed_message)
+            else:
+                self.logger(composed_message)
 
         # LOG action
         # if log is set we need to send to the file but not resend to the
         # display. So, we need to mask off stdout for an mcd or we need
         # to ignore the stdout file handle for a file handle.
-        if report_message.get_action() & UVM_LOG:
+        if report_message.get_action() & UVM_LOG and self.m_text_output:
             if report_message.get_file() == 0 or report_message.get_file() != 0x80000001: #ignore stdout handle
                 tmp_file = report_message.get_file()
                 #if report_message.get_file() & 0x80000000 == 0: # is an mcd so mask off stdout
@@ -596,6 +803,11 @@ class UVMReportServer(UVMObject):
             q.append("** Report counts by id\n")
             for id in self.m_id_count.keys():
                 q.append("[{}] {}\n".format(id, self.m_id_count.get(id)))
+
+        if len(self.m_suppressed_count) > 0:
+            q.append("** Suppressed report counts by id (rate limits)\n")
+            for id in self.m_suppressed_count:
+                q.append("[{}] {}\n".format(id, self.m_suppressed_count[id]))
         return "".join(q)
 
 
@@ -0,0 +1,257 @@
+"""
+Title: Report Sinks
+
+Report sinks receive the composed messages from `UVMReportServer` and
+write them out. A sink is installed with `UVMReportServer.set_report_sink`.
+Without a sink, the server writes each message synchronously using its
+logger (UVM_DISPLAY) or the message file handle (UVM_LOG).
+"""
+
+import sys
+import threading
+import queue
+from typing import Callable, Optional, Any, List, Dict
+
+# Marks the messages which go to the display (logger) instead of a file
+_DISPLAY = None
+# Sentinel for stopping the writer thread
+_STOP = object()
+
+
+class UVMReportSink:
+    """
+    Base class for report sinks. This sink writes every message
+    synchronously, and behaves exactly like the report server does
+    without any sink.
+
+    Args:
+        logger (callable): Function used for displayed messages. If None,
+            messages are written to `sys.stdout`.
+    """
+
+    def __init__(self, logger: Optional[Callable] = None):
+        self.logger = logger
+        self.print_on_closed_file = True
+
+    def display(self, msg: str) -> None:
+        """
+        Emits a message with UVM_DISPLAY action.
+
+        Args:
+            msg (str): Composed message.
+        """
+        if self.logger is None:
+            sys.stdout.write(msg + "\n")
+        else:
+            self.logger(msg)
+
+    def write(self, file, msg: str) -> None:
+        """
+        Emits a message with UVM_LOG action to the given file.
+
+        Args:
+            file: File object to write to.
+            msg (str): Composed message.
+        """
+        if not file.closed:
+            file.write(msg + "\n")
+        elif self.print_on_closed_file:
+            self.display('UVM_WARNING. File already closed for msg ' + msg)
+
+    def flush(self) -> None:
+        """
+        Blocks until all messages given to the sink have been written out.
+        """
+        if self.logger is None:
+            sys.stdout.flush()
+
+    def close(self) -> None:
+        """
+        Flushes the sink and releases its resources.
+        """
+        self.flush()
+
+
+class UVMAsyncReportSink(UVMReportSink):
+    """
+    Report sink which writes the messages from a background thread, so that
+    the simulation does not block on I/O. The messages are put into a
+    bounded queue, and the writer thread drains it in batches, doing one
+    write per file (or display) for each batch.
+
+    When the queue is full, the sink either blocks the caller until there is
+    space (`block=True`, the default) or drops the message (`block=False`).
+    Both cases are counted, see `get_num_backpressured` and
+    `get_num_dropped`.
+
+    An exception raised while writing a batch is reported to `sys.stderr`,
+    and the messages of that batch which were not written are counted as
+    dropped. If the writer thread is no longer running, messages are written
+    synchronously.
+
+    The report server flushes its sink in the report and final phases, and
+    in `UVMRoot.die`.
+
+    Args:
+        logger (callable): Function used for displayed messages. If None,
+            messages are written to `sys.stdout` with one write per batch.
+        max_queue_size (int): Max number of messages waiting to be written.
+        batch_size (int): Max number of messages written out in one batch.
+        block (bool): Block when the queue is full instead of dropping.
+    """
+
+    def __init__(self, logger: Optional[Callable] = None, max_queue_size=65536,
+            batch_size=1024, block=True):
+        UVMReportSink.__init__(self, logger)
+        self.m_queue: queue.Queue = queue.Queue(max_queue_size)
+        self.batch_size = batch_size
+        self.block = block
+        self.m_num_written = 0
+        self.m_num_dropped = 0
+        self.m_num_backpressured = 0
+        # Guards the counters updated by both the caller and writer threads
+        self.m_count_lock = threading.Lock()
+        self.m_closed = False
+        self.m_files: Dict[Any, bool] = {}  # Files written by the writer thread
+        self.m_thread = threading.Thread(target=self._m_writer,
+            name="uvm_report_sink", daemon=True)
+        self.m_thread.start()
+
+    def display(self, msg: str) -> None:
+        self._m_put((_DISPLAY, msg))
+
+    def write(self, file, msg: str) -> None:
+        self._m_put((file, msg))
+
+    def flush(self) -> None:
+        if self.m_thread.is_alive():
+            self.m_queue.join()
+        self._m_flush_files()
+        UVMReportSink.flush(self)
+
+    def close(self) -> None:
+        if self.m_closed:
+            return
+        self.m_closed = True
+        if self.m_thread.is_alive():
+            self.m_queue.put(_STOP)
+            self.m_thread.join()
+        self._m_flush_files()
+        UVMReportSink.flush(self)
+
+    def get_num_written(self) -> int:
+        """
+        Returns:
+            int: Number of messages written out so far.
+        """
+        return self.m_num_written
+
+    def get_num_dropped(self) -> int:
+        """
+        Returns:
+            int: Number of messages dropped because the queue was full, or
+            because the sink was already closed.
+        """
+        return self.m_num_dropped
+
+    def get_num_backpressured(self) -> int:
+        """
+        Returns:
+            int: Number of messages for which the caller had to wait for
+            space in the queue.
+        """
+        return self.m_num_backpressured
+
+    def _m_put(self, item) -> None:
+        if self.m_closed:
+            with self.m_count_lock:
+                self.m_num_dropped += 1
+            return
+        if not self.m_thread.is_alive():
+            self._m_write_sync(item)
+            return
+        try:
+            self.m_queue.put_nowait(item)
+        except queue.Full:
+            if self.block:
+                self.m_num_backpressured += 1
+                # Wake up periodically in case the writer thread has died
+                while True:
+                    try:
+                        self.m_queue.put(item, timeout=0.1)
+                        return
+                    except queue.Full:
+                        if not self.m_thread.is_alive():
+                            self._m_write_sync(item)
+                            return
+            else:
+                with self.m_count_lock:
+                    self.m_num_dropped += 1
+
+    def _m_write_sync(self, item) -> None:
+        dest, msg = item
+        if dest is _DISPLAY:
+            UVMReportSink.display(self, msg)
+        else:
+            UVMReportSink.write(self, dest, msg)
+        with self.m_count_lock:
+            self.m_num_written += 1
+
+    def _m_writer(self) -> None:
+        q = self.m_queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            if batch[-1] is _STOP:
+                batch.pop()
+                stop = True
+            num_written = self.m_num_written
+            try:
+                self._m_write_batch(batch)
+            except Exception as e:
+                # Keep the writer running, so that later messages are not lost
+                num_lost = len(batch) - (self.m_num_written - num_written)
+                with self.m_count_lock:
+                    self.m_num_dropped += num_lost
+                sys.stderr.write("UVM_ERROR uvm_report_sink: {} message(s) lost, "
+                    "writing failed with {!r}\n".format(num_lost, e))
+            finally:
+                for _ in range(len(batch) + stop):
+                    q.task_done()
+            if stop:
+                return
+
+    def _m_write_batch(self, batch: List[Any]) -> None:
+        # Group the messages per destination, preserving their order
+        dests: Dict[Any, List[str]] = {}
+        for dest, msg in batch:
+            if dest in dests:
+                dests[dest].append(msg)
+            else:
+                dests[dest] = [msg]
+        for dest, msgs in dests.items():
+            if dest is _DISPLAY:
+                if self.logger is None:
+                    sys.stdout.write("\n".join(msgs) + "\n")
+                else:
+                    for msg in msgs:
+                        self.logger(msg)
+            elif not dest.closed:
+                dest.write("\n".join(msgs) + "\n")
+                self.m_files[dest] = True
+            elif self.print_on_closed_file:
+                for msg in msgs:
+                    UVMReportSink.display(self, 'UVM_WARNING. File already closed for msg '
+                        + msg)
+            with self.m_count_lock:
+                self.m_num_written += len(msgs)
+
+    def _m_flush_files(self) -> None:
+        for file in list(self.m_files):
+            if not file.closed:
+                file.flush()
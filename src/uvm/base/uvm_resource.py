@@ -97,12 +97,13 @@ class object.
 from cocotb.triggers import Event
 
 from .uvm_object import UVMObject
-from .sv import sv, uvm_re_match, uvm_glob_to_re, wait
+from .sv import (sv, uvm_glob_to_re, uvm_glob_literal, uvm_glob_matcher,
+    wait)
 from ..uvm_macros import uvm_typename
 from ..macros import uvm_info
 from .uvm_globals import (uvm_report_error, uvm_report_warning)
 from .uvm_object_globals import UVM_NONE
-from .uvm_spell_chkr import UVMSpellChkr
+from .uvm_spell_chkr import UVMSpellChkr, UVMSpellIndex
 from .uvm_pool import UVMPool
 from .uvm_printer import UVMLinePrinter
 from .uvm_queue import UVMQueue
@@ -180,10 +181,19 @@ class UVMResourceOptions:
        spent collecting and storing auditing information.  Of course,
        during the period when auditing is off no audit trail information
        is available
+
+     * compact auditing:  on/off
+
+       Stores the audit trail as counters per interned accessor id,
+       instead of a record per accessor name. See
+       `turn_on_compact_auditing`. The default is off.
     """
 
 
     auditing = True
+    compact_auditing = False
+    # Only every audit_sample'th read is recorded in compact mode
+    audit_sample = 1
 
     @classmethod
     def turn_on_auditing(cls):
@@ -193,6 +203,39 @@ class UVMResourceOptions:
     def turn_off_auditing(cls):
         UVMResourceOptions.auditing = False
 
+    @classmethod
+    def turn_on_compact_auditing(cls, sample=1):
+        """
+        Turns on auditing in compact mode. Each accessor gets an integer
+        id when it first accesses a resource, and the resources count the
+        reads and writes per id. The accessor's full name is looked up
+        only once, so renaming an accessor later does not show up in the
+        audit trail. Get records (`push_get_record`) are not stored.
+
+        With `sample` > 1, only every `sample`'th read is recorded, and it
+        is counted `sample` times, so read counts are estimates. Writes are
+        always recorded.
+
+        Args:
+            sample (int): Sampling interval for reads.
+        """
+        UVMResourceOptions.auditing = True
+        UVMResourceOptions.compact_auditing = True
+        UVMResourceOptions.audit_sample = max(1, sample)
+
+    @classmethod
+    def turn_off_compact_auditing(cls):
+        """
+        Switches auditing back to the full mode. Records collected in
+        compact mode are kept, and included in the audit trail.
+        """
+        UVMResourceOptions.compact_auditing = False
+        UVMResourceOptions.audit_sample = 1
+
+    @classmethod
+    def is_compact_auditing(cls):
+        return UVMResourceOptions.compact_auditing
+
     @classmethod
     def is_auditing(cls):
         return UVMResourceOptions.auditing
@@ -224,6 +267,11 @@ class UVMResourceBase(UVMObject):
     #//
     default_precedence = 1000
 
+    # Interned accessor names of the compact audit trail, see
+    # m_get_accessor_id. Id 0 is used for reads without an accessor.
+    m_accessor_names = ["<empty>"]
+    m_accessor_ids = {"<empty>": 0}
+
     def __init__(self, name="", s="*"):
         """
         Function: new
@@ -241,10 +289,16 @@ class UVMResourceBase(UVMObject):
             raise TypeError('s/scope must be string (or use "*" default) '
                     + ', got: ' + str(s))
         #self.scope = ""
+        # Incremented on every write which changes the value
+        self.m_version = 0
         self.set_scope(s)
         self.modified = False
         self.read_only = False
         self.access = {}  # uvm_resource_types::access_t access[string]
+        # Compact audit trail, accessor id -> read/write count
+        self.m_audit_reads = {}
+        self.m_audit_writes = {}
+        self.m_audit_tick = 0
         # variable: precedence
         #
         # This variable is used to associate a precedence that a resource
@@ -409,8 +463,11 @@ class UVMResourceBase(UVMObject):
         Args:
             s:
         """
-        scope = uvm_glob_to_re(s)
-        self.scope = scope
+        self.scope = uvm_glob_to_re(s)
+        # Matcher is shared between resources with the same scope
+        self.m_scope_match = uvm_glob_matcher(s)
+        self.m_scope_literal = uvm_glob_literal(s)
+        UVMResourcePool.m_changed(self.get_name())
 
     def get_scope(self):
         """
@@ -434,8 +491,7 @@ class UVMResourceBase(UVMObject):
             s:
         Returns:
         """
-        err = uvm_re_match(self.scope, s)
-        return (err == 0)
+        return self.m_scope_match(s)
 
     #//----------------
     #// Group: Priority
@@ -524,7 +580,23 @@ class UVMResourceBase(UVMObject):
         #  // Otherwise create a new access record.  In either case populate
         #  // the access record with information about this access.  Check
         #  // first to make sure that auditing is turned on.
-        if not UVMResourceOptions.is_auditing():
+        if not UVMResourceOptions.auditing:
+            return
+        if UVMResourceOptions.compact_auditing:
+            sample = UVMResourceOptions.audit_sample
+            if sample > 1:
+                self.m_audit_tick += 1
+                if self.m_audit_tick % sample != 0:
+                    return
+            if accessor is None:
+                aid = 0
+            else:
+                try:
+                    aid = accessor.m_audit_id
+                except AttributeError:
+                    aid = UVMResourceBase.m_get_accessor_id(accessor)
+            reads = self.m_audit_reads
+            reads[aid] = reads.get(aid, 0) + sample
             return
 
         # If an accessor is supplied, then use its name
@@ -559,7 +631,10 @@ class UVMResourceBase(UVMObject):
         # the access record with information about this access.  Check
         # first that auditing is turned on
         if UVMResourceOptions.is_auditing():
-            if accessor is not None:
+            if accessor is not None and UVMResourceOptions.compact_auditing:
+                aid = UVMResourceBase.m_get_accessor_id(accessor)
+                self.m_audit_writes[aid] = self.m_audit_writes.get(aid, 0) + 1
+            elif accessor is not None:
                 access_record = None  # uvm_resource_types::access_t
                 _str = accessor.get_full_name()
                 if _str in self.access:
@@ -572,32 +647,74 @@ class UVMResourceBase(UVMObject):
                 self.access[_str] = access_record
 
 
-    #// Function: print_accessors
-    #//
-    #// Dump the access records for this resource
-    #//
-    #virtual function void print_accessors()
+    @classmethod
+    def m_get_accessor_id(cls, accessor):
+        """
+        Returns the interned id of the accessor's full name, used by the
+        compact audit trail. The id is stored in the accessor, so the name
+        is looked up only on its first access.
 
-    #  string str
-    #  uvm_component comp
-    #  uvm_resource_types::access_t access_record
-    #  string qs[$]
-    #
-    #  if(access.num() == 0)
-    #    return
+        Args:
+            accessor (UVMObject): Object accessing a resource.
+        Returns:
+            int: Accessor id, index into `m_accessor_names`.
+        """
+        try:
+            return accessor.m_audit_id
+        except AttributeError:
+            pass
+        name = accessor.get_full_name()
+        aid = UVMResourceBase.m_accessor_ids.get(name)
+        if aid is None:
+            aid = len(UVMResourceBase.m_accessor_names)
+            UVMResourceBase.m_accessor_names.append(name)
+            UVMResourceBase.m_accessor_ids[name] = aid
+        accessor.m_audit_id = aid
+        return aid
+
+    def get_access_records(self):
+        """
+        Returns the audit trail of this resource, collected in both full
+        and compact mode.
 
-    #  foreach (access[i]):
-    #    str = i
-    #    access_record = access[str]
-    #    qs.push_back($sformatf("%s reads: %0d @ %0t  writes: %0d @ %0t\n",str,
-    #             access_record.read_count,
-    #             access_record.read_time,
-    #             access_record.write_count,
-    #             access_record.write_time))
-    #  end
-    #  `uvm_info("UVM/RESOURCE/ACCESSOR",`UVM_STRING_QUEUE_STREAMING_PACK(qs),UVM_NONE)
+        Returns:
+            dict: Accessor name -> `Access_t`.
+        """
+        records = {}
+        for name, rec in self.access.items():
+            acc = Access_t()
+            acc.read_count = rec.read_count
+            acc.write_count = rec.write_count
+            acc.read_time = rec.read_time
+            acc.write_time = rec.write_time
+            records[name] = acc
+        names = UVMResourceBase.m_accessor_names
+        for counts, attr in ((self.m_audit_reads, "read_count"),
+                (self.m_audit_writes, "write_count")):
+            for aid, n in counts.items():
+                acc = records.get(names[aid])
+                if acc is None:
+                    acc = Access_t()
+                    records[names[aid]] = acc
+                setattr(acc, attr, getattr(acc, attr) + n)
+        return records
+
+    def print_accessors(self):
+        """
+        Function: print_accessors
 
-    #endfunction
+        Dump the access records for this resource
+        """
+        records = self.get_access_records()
+        if len(records) == 0:
+            return
+        qs = []
+        for name in sorted(records):
+            acc = records[name]
+            qs.append(sv.sformatf("%s reads: %0d @ %0t  writes: %0d @ %0t\n",
+                name, acc.read_count, acc.read_time, acc.write_count,
+                acc.write_time))
+        uvm_info("UVM/RESOURCE/ACCESSOR", "".join(qs), UVM_NONE)
 
     def init_access_record(self, access_record):
         """
@@ -786,7 +903,8 @@ class UVMResource(UVMResourceBase):
 
     def read(self, accessor=None):
         """ Return the object stored in the resource container """
-        self.record_read_access(accessor)
+        if UVMResourceOptions.auditing:
+            self.record_read_access(accessor)
         return self.val
 
     def write(self, t, accessor=None):
@@ -821,6 +939,7 @@ class UVMResource(UVMResourceBase):
 
         # set the value and set the dirty bit
         self.val = t
+        self.m_version += 1
         self.modified = True
         self.event_modified.set()
 
@@ -968,10 +1087,40 @@ class UVMResourcePool:
 
     rp = None
 
+    # Incremented whenever lookup results can change: when a resource is
+    # set, its scope changes, or its priority is changed.
+    m_generation = 0
+    # Like m_generation, but counted separately for each resource name
+    m_name_generation = {}
+
+    # Max number of cached lookup results, the cache is cleared when full
+    m_lookup_cache_size = 100000
+
     def __init__(self):
         self.rtab = UVMPool()
         self.ttab = {}
         self.get_record = []  # History of gets
+        # (scope, name, type_handle) -> list of matching resources
+        self.m_lookup_cache = {}
+        self.m_lookup_generation = UVMResourcePool.m_generation
+        # Index of resource scopes for lookup_scope, see _m_get_scope_index
+        self.m_scope_index = None
+        self.m_scope_index_generation = -1
+        # Resource names for spell_check, names are added to it on the
+        # first misspelled lookup after they are set
+        self.m_spell_index = UVMSpellIndex()
+
+    @classmethod
+    def m_changed(cls, name):
+        """
+        Marks lookups of resources with the given name as changed.
+
+        Args:
+            name (str): Name of the changed resource.
+        """
+        UVMResourcePool.m_generation += 1
+        gens = UVMResourcePool.m_name_generation
+        gens[name] = gens.get(name, 0) + 1
 
     @classmethod
     def get(cls):
@@ -996,7 +1145,8 @@ class UVMResourcePool:
             s:
         Returns:
         """
-        return UVMSpellChkr.check(self.rtab, s)
+        return UVMSpellChkr.check(self.rtab, s, self.m_spell_index,
+            UVMResourcePool.m_generation)
 
     #-----------
     # Group: Set
@@ -1066,6 +1216,7 @@ class UVMResourcePool:
         else:
             rq.append(rsrc)
         self.ttab[type_handle] = rq
+        UVMResourcePool.m_changed(name)
 
 
     #// Function: set_override
@@ -1115,7 +1266,8 @@ class UVMResourcePool:
 
         #  // if auditing is turned off then there is no reason
         #  // to save a get record
-        if not UVMResourceOptions.is_auditing():
+        if (not UVMResourceOptions.is_auditing() or
+                UVMResourceOptions.compact_auditing):
             return
 
         impt = get_t()
@@ -1210,6 +1362,15 @@ class UVMResourcePool:
                 self.spell_check(name)
             return q
 
+        # Results are cached until the pool is modified
+        if self.m_lookup_generation != UVMResourcePool.m_generation:
+            self.m_lookup_cache.clear()
+            self.m_lookup_generation = UVMResourcePool.m_generation
+        key = (scope, name, type_handle)
+        cached = self.m_lookup_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         rq = self.rtab[name]
         for i in range(0, len(rq)):
             r = rq[i]
@@ -1218,6 +1379,9 @@ class UVMResourcePool:
             if handle_ok and r.match_scope(scope):
                 q.append(r)
 
+        if len(self.m_lookup_cache) >= UVMResourcePool.m_lookup_cache_size:
+            self.m_lookup_cache.clear()
+        self.m_lookup_cache[key] = list(q)
         return q
 
     def get_highest_precedence(self, q):
@@ -1273,22 +1437,8 @@ class UVMResourcePool:
             q:
         Returns:
         """
-        #  uvm_resource_types::rsrc_q_t all[int]
-        _all = {}
-        r = None  # uvm_resource_base
-
-        for i in range(len(q)):
-            r = q[i]
-            if r.precedence not in _all:
-                _all[r.precedence] = UVMQueue()
-            _all[r.precedence].push_front(r)  # since we will push_front in the final
-        qq = []
-        for key in _all:
-            for j in range(len(_all[key])):
-                r = _all[key].get(j)
-                #qq.push_front(r)
-                qq.insert(0, r)
-        return qq
+        # Stable sort, so resources with the same precedence keep their order
+        return sorted(q, key=lambda r: r.precedence, reverse=True)
         #endfunction
 
     def get_by_name(self, scope, name, type_handle, rpterr=True):
@@ -1435,35 +1585,78 @@ class UVMResourcePool:
 
         This is a utility function that answers the question: For a given
         `scope`, what resources are visible to it?  Locate all the resources
-        that are visible to a particular scope.  This operation could be
-        quite expensive, as it has to traverse all of the resources in the
-        database.
+        that are visible to a particular scope. The resources are found
+        using an index of their scopes, which is rebuilt when the pool
+        changes, so only resources with general regex scopes are matched
+        one by one.
         #function uvm_resource_types::rsrc_q_t lookup_scope(string scope)
         Args:
             scope:
         Returns:
         """
-        rq = None  # uvm_resource_types::rsrc_q_t rq
-        r = None  # uvm_resource_base r
-        i = 0
+        index = self._m_get_scope_index()
+        found = list(index[0])
+        # Find all literals which are substrings of the scope
+        trie = index[1]
+        seen = set()
+        for i in range(len(scope)):
+            node = trie
+            for c in scope[i:]:
+                node = node.get(c)
+                if node is None:
+                    break
+                if None in node and id(node) not in seen:
+                    seen.add(id(node))
+                    found.extend(node[None])
+        for k, r in index[2]:
+            if r.match_scope(scope):
+                found.append((k, r))
+        found.sort(key=lambda kr: kr[0])
         q = UVMQueue()  # uvm_resource_types::rsrc_q_t q = new()
+        for _, r in found:
+            q.push_back(r)
+        return q
+
+    def _m_get_scope_index(self):
+        """
+        Returns the scope index, and rebuilds it if the pool has changed.
+        The index is a tuple (always, trie, regex) of resources matching
+        all scopes, a character trie of scope literals (see
+        `uvm_glob_literal`), and resources with general regex scopes. Each
+        resource is stored as (k, r), where k is its position in the
+        full traversal order of `lookup_scope`.
+
+        Returns:
+            tuple: The scope index.
+        """
+        if (self.m_scope_index is not None and
+                self.m_scope_index_generation == UVMResourcePool.m_generation):
+            return self.m_scope_index
+        always = []
+        trie = {}
+        regex = []
+        k = 0
         # iterate in reverse order for the special case of autoconfig
         # of arrays. The array name with no [] needs to be higher priority.
         # This has no effect an manual accesses.
-        name = ""
-        if self.rtab.has_last():
-            name = self.rtab.last()
-            while True:
-                rq = self.rtab[name]
-                for i in range(len(rq)):
-                    r = rq[i]
-                    if r.match_scope(scope):
-                        q.push_back(r)
-                if self.rtab.has_prev():
-                    name = self.rtab.prev()
+        for name in reversed(self.rtab.key_list()):
+            rq = self.rtab[name]
+            for i in range(len(rq)):
+                r = rq[i]
+                literal = r.m_scope_literal
+                if literal is None:
+                    regex.append((k, r))
+                elif literal == "":
+                    always.append((k, r))
                 else:
-                    break
-        return q
+                    node = trie
+                    for c in literal:
+                        node = node.setdefault(c, {})
+                    node.setdefault(None, []).append((k, r))
+                k += 1
+        self.m_scope_index = (always, trie, regex)
+        self.m_scope_index_generation = UVMResourcePool.m_generation
+        return self.m_scope_index
 
     #//--------------------
     #// Group: Set Priority
@@ -1512,9 +1705,10 @@ class UVMResourcePool:
             return
 
         q.pop(i)
+        UVMResourcePool.m_changed(name)
 
         if pri == PRI_HIGH:
-            q.append(rsrc)
+            q.insert(0, rsrc)
         elif pri == PRI_LOW:
             q.append(rsrc)
 
@@ -191,12 +191,16 @@ class UVMRoot(UVMComponent):
     def get_type_name(self):
         return "uvm_root"
 
+    def report_phase(self, phase):
+        get_report_server().flush()
+
     def final_phase(self, phase):
         from .uvm_coreservice import UVMCoreService
         cs = UVMCoreService.get()
         tr_db = cs.get_default_tr_database()
         if tr_db.is_open():
             tr_db.close_db()
+        get_report_server().flush()
 
 
     @classmethod
@@ -328,6 +332,7 @@ class UVMRoot(UVMComponent):
         #phase_runner_proc.kill()
         l_rs = get_report_server()
         l_rs.report_summarize()
+        l_rs.flush()
         if self.finish_on_completion:
             # TODO should be linked to cocotb somehow
             self.uvm_report_info('FINISH', '$finish was reached in run_test()', UVM_NONE)
@@ -354,6 +359,7 @@ class UVMRoot(UVMComponent):
         # do the pre_abort callbacks
         self.m_do_pre_abort()
         l_rs.report_summarize()
+        l_rs.flush()
         if UVMRoot.raise_exception_on_die:
             raise UVMFinishError('die(): $finish from UVMRoot')
 
@@ -646,6 +652,7 @@ class UVMRoot(UVMComponent):
         Processes config value options set from cmdline:
           +uvm_set_config_int=
           +uvm_set_config_string=
+          +uvm_set_config_file=
         """
         args = []
 
@@ -657,6 +664,10 @@ class UVMRoot(UVMComponent):
         for i in range(len(args)):
             self.m_process_config(args[i][23:len(args[i])], 0)
 
+        self.clp.get_arg_matches("/^\\+(UVM_SET_CONFIG_FILE|uvm_set_config_file)=/", args)
+        for i in range(len(args)):
+            self.m_process_config_file(args[i][21:len(args[i])])
+
         # TODO might not be needed, ever
         #self.clp.get_arg_matches("/^\\+(UVM_SET_DEFAULT_SEQUENCE|uvm_set_default_sequence)=/", args)
         #for i in range(len(args)):
@@ -775,6 +786,29 @@ class UVMRoot(UVMComponent):
             UVMConfigDb.set(m_uvm_top, split_val[0], split_val[1], split_val[2])
 
 
+    def m_process_config_file(self, filename):
+        """
+        Applies the settings in a JSON or TOML file given with
+        +uvm_set_config_file=, see `UVMConfigDb.load_settings`.
+
+        Args:
+            filename (str): Name of the settings file.
+        """
+        from .uvm_coreservice import UVMCoreService
+        cs = UVMCoreService.get()
+        m_uvm_top = cs.get_root()
+        try:
+            settings = UVMConfigDb.m_read_settings(filename)
+        except (OSError, ValueError, ImportError) as e:
+            uvm_report_error("UVM_CMDLINE_PROC", ("Invalid +uvm_set_config_file="
+                + filename + ": " + str(e)), UVM_NONE)
+            return
+        self.uvm_report_info("UVM_CMDLINE_PROC", sv.sformatf(
+            "Applying %0d config settings from the command line: "
+            + "+uvm_set_config_file=%s", len(settings), filename), UVM_NONE)
+        UVMConfigDb.set_many(m_uvm_top, settings)
+
+
     #  extern local function void m_process_default_sequence(string cfg)
 
     def m_check_verbosity(self):
@@ -21,20 +21,114 @@
 #   permissions and limitations under the License.
 #------------------------------------------------------------------------------
 
-from typing import List
+import sys
+from typing import Dict, List, Tuple
 from ..macros.uvm_message_defines import uvm_info
 from .uvm_object_globals import UVM_NONE
 
 
+class UVMSpellIndex:
+    """
+    BK-tree of the strings in a string table, used by `UVMSpellChkr.check`
+    to find the strings nearest to a misspelled one without computing the
+    levenshtein distance to every string. Strings are added incrementally
+    with `add`, for example when new names are added to the table.
+
+    Each node is a list [string, insertion number, children], where
+    children maps a distance to the child node. All strings in the
+    subtree of a child are at that distance from the node's string.
+    """
+
+    def __init__(self):
+        self.m_root = None
+        self.m_keys: Dict[str, int] = {}
+        # Generation of the string table given to the last update
+        self.m_generation = None
+
+    def add(self, key: str) -> None:
+        """
+        Adds a string to the index. Empty and already added strings are
+        ignored.
+
+        Args:
+            key (str): String to add.
+        """
+        if key == "" or key in self.m_keys:
+            return
+        seq = len(self.m_keys)
+        self.m_keys[key] = seq
+        if self.m_root is None:
+            self.m_root = [key, seq, {}]
+            return
+        dist = UVMSpellChkr.levenshtein_distance
+        node = self.m_root
+        while True:
+            d = dist(node[0], key)
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [key, seq, {}]
+                return
+            node = child
+
+    def update(self, strtab, generation=None) -> None:
+        """
+        Adds all the keys of `strtab` which are not in the index yet.
+
+        Args:
+            strtab: Table of strings (dict or `UVMPool`).
+            generation: Generation of `strtab`, see `UVMSpellChkr.check`.
+        """
+        for key in strtab.keys():
+            if key not in self.m_keys:
+                self.add(key)
+        self.m_generation = generation
+
+    def size(self) -> int:
+        return len(self.m_keys)
+
+    def nearest(self, s: str) -> Tuple[int, List[str]]:
+        """
+        Finds the strings with the minimum levenshtein distance to `s`.
+
+        Args:
+            s (str): String to check.
+        Returns:
+            tuple: (distance, strings in insertion order). The distance is
+            -1 if there are no strings to suggest.
+        """
+        if self.m_root is None or s == "":
+            return (-1, [])
+        dist = UVMSpellChkr.levenshtein_distance
+        best = sys.maxsize
+        found = []
+        stack = [self.m_root]
+        while stack:
+            node = stack.pop()
+            d = dist(node[0], s)
+            if d < best:
+                best = d
+                found = [node]
+            elif d == best:
+                found.append(node)
+            # By the triangle inequality, only children at distance
+            # d - best ... d + best from this node can be within best of s
+            for k, child in node[2].items():
+                if d - best <= k <= d + best:
+                    stack.append(child)
+        found.sort(key=lambda n: n[1])
+        return (best, [n[0] for n in found])
+
+
 class UVMSpellChkr:
 
-    max_val = 1
+    #static const int unsigned max = '1;
+    max_val = sys.maxsize
 
     #typedef T tab_t[string];
     #static const int unsigned max = '1;
 
     @classmethod
-    def check(cls, strtab, s):
+    def check(cls, strtab, s, index=None, generation=None):
         """
         Primary interface to the spell checker.  The function takes two
         arguments, a table of strings and a string to check.  The table is
@@ -68,11 +162,20 @@ class UVMSpellChkr:
         If, on average, that proves to be an invalid assumption then we'll
         have to find ways to optimize this algorithm.
 
+        If a `UVMSpellIndex` of the table is given as `index`, it is used
+        to find the same alternatives without traversing the whole table.
+        Keys missing from the index are added to it first, unless
+        `generation` is given and equals the generation of the table when
+        the index was last updated.
+
         note: strtab should not be modified inside check()
 
         Args:
             strtab:
             s:
+            index (UVMSpellIndex): Index of the strings in `strtab`.
+            generation: Counter which changes whenever keys are added to
+                `strtab`.
         Returns:
             bool: True if check matches, False otherwise
         """
@@ -85,25 +188,33 @@ class UVMSpellChkr:
             return True
 
         min_val = UVMSpellChkr.max_val
-        for key in strtab:
-            distance = UVMSpellChkr.levenshtein_distance(key, s)
-
-            # A distance < 0 means either key, s, or both are empty.  This
-            # should never happen here but we check for that condition just
-            # in case.
-            if distance < 0:
-                continue
-
-            if distance < min_val:
-                # set a new minimum.  Clean out the queue since previous
-                # alternatives are now invalidated.
+        if index is not None:
+            if generation is None or index.m_generation != generation:
+                index.update(strtab, generation)
+            distance, min_key = index.nearest(s)
+            min_key = [key for key in min_key if key in strtab]
+            if distance >= 0 and len(min_key) > 0:
                 min_val = distance
-                min_key = []
-                min_key.append(key)
-                continue
-
-            if distance == min_val:
-                min_key.append(key)
+        else:
+            for key in strtab.keys():
+                distance = UVMSpellChkr.levenshtein_distance(key, s)
+
+                # A distance < 0 means either key, s, or both are empty.  This
+                # should never happen here but we check for that condition just
+                # in case.
+                if distance < 0:
+                    continue
+
+                if distance < min_val:
+                    # set a new minimum.  Clean out the queue since previous
+                    # alternatives are now invalidated.
+                    min_val = distance
+                    min_key = []
+                    min_key.append(key)
+                    continue
+
+                if distance == min_val:
+                    min_key.append(key)
 
         # if (min == max) then the string table is empty
         if min_val == UVMSpellChkr.max_val:
@@ -111,15 +222,9 @@ class UVMSpellChkr:
                 "{} not located, no alternatives to suggest".format(s), UVM_NONE)
         else:
             # dump all the alternatives with the minimum distance
-            q = []
-            for i in range(0, len(min_key)):
-                q.append(min_key[i])
-                q.append("|")
-                if len(q) > 0:
-                    q.pop()
-                    uvm_info("UVM/CONFIGDB/SPELLCHK",
-                            "{} not located, did you mean {}".format(s,
-                                "".join(q)),UVM_NONE)
+            uvm_info("UVM/CONFIGDB/SPELLCHK",
+                    "{} not located, did you mean {}".format(s,
+                        "|".join(min_key)),UVM_NONE)
         return False
 
     @classmethod
@@ -137,51 +242,50 @@ class UVMSpellChkr:
         http:#www.codeproject.com/KB/recipes/Levenshtein.aspx.  Use google
         to find others.
 
-        This implementation of the Levenshtein
-        distance computation algorithm is a SystemVerilog adaptation of the
-        C implementatiion located at http:#www.merriampark.com/ldc.htm.
+        This implementation skips the common prefix and suffix of the
+        strings, and keeps only two rows of the distance matrix.
 
         Args:
             s:
             t:
         Returns:
         """
-        k        = 0
-        i        = 0
-        j        = 0
-        n        = 0
-        m        = 0
-        cost     = 0
-        distance = 0
-        d: List[int] = []
-
-        #Step 1
-        n = len(s) + 1
-        m = len(t) + 1
-
-        if n == 1 or m == 1:
+        n = len(s)
+        m = len(t)
+        if n == 0 or m == 0:
             return -1  # negative return value means that one or both strings are empty.
-
-        d = m*n * [0]
-
-        #Step 2
-        for k in range(0, n):
-            d[k] = k
-
-        for k in range(0, m):
-            d[k*n] = k
-
-        #Steps 3 and 4
-        for i in range(1, n):
-            for j in range(1, m):
-                #Step 5
-                cost = s[i-1] != t[j-1]
-
-                #Step 6
-                d[j*n+i] = UVMSpellChkr.minimum(d[(j-1)*n+i]+1, d[j*n+i-1]+1, d[(j-1)*n+i-1]+cost)
-
-        distance = d[n*m-1]
-        return distance
+        if s == t:
+            return 0
+
+        # Common prefix and suffix do not change the distance
+        start = 0
+        while start < n and start < m and s[start] == t[start]:
+            start += 1
+        while n > start and m > start and s[n-1] == t[m-1]:
+            n -= 1
+            m -= 1
+        s = s[start:n]
+        t = t[start:m]
+        n -= start
+        m -= start
+        if n == 0 or m == 0:
+            return n + m
+
+        # Only two rows of the distance matrix are kept, and reused
+        prev = list(range(m + 1))
+        curr = [0] * (m + 1)
+        for i in range(n):
+            sc = s[i]
+            curr[0] = i + 1
+            for j in range(m):
+                cost = prev[j] + (sc != t[j])
+                if prev[j+1] + 1 < cost:
+                    cost = prev[j+1] + 1
+                if curr[j] + 1 < cost:
+                    cost = curr[j] + 1
+                curr[j+1] = cost
+            prev, curr = curr, prev
+        return prev[m]
 
     @classmethod
     def minimum(cls, a: int, b: int, c: int) -> int:
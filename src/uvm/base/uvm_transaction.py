@@ -185,6 +185,19 @@ class UVMTransaction(UVMObject):
         self.end_time = -1
         self.accept_time = -1
 
+    def reinit(self, name):
+        super().reinit(name)
+        self.initiator = None
+        self.m_transaction_id = -1
+        for event in self.events.pool.values():
+            event.reset()
+        self.stream_handle = None
+        self.tr_recorder = None
+
+        self.begin_time = -1
+        self.end_time = -1
+        self.accept_time = -1
+
 
     #  // Function: accept_tr
     #  //
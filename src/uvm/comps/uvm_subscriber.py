@@ -56,3 +56,15 @@ class UVMSubscriber(UVMComponent):  # (type T=int) extends uvm_component
     #  // analysis_export.
     def write(self, t):
         raise Exception("Pure virtual function. Must be implemented")
+
+    def write_batch(self, ts):
+        """
+        Receives a batch of transactions sent with `UVMAnalysisPort.write_many`.
+        By default calls `write` for each transaction; subscribers can override
+        it to process the whole batch at once.
+
+        Args:
+            ts (list): Transactions
+        """
+        for t in ts:
+            self.write(t)
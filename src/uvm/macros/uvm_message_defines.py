@@ -22,12 +22,14 @@
 
 from ..base.uvm_globals import (UVM_ERROR, UVM_FATAL, UVM_INFO, UVM_NONE, UVM_WARNING,
                                 uvm_report_enabled, uvm_report_error, uvm_report_fatal,
-                                uvm_report_info, uvm_report_warning)
+                                uvm_report_info, uvm_report_warning,
+                                uvm_get_caller_file_line, uvm_report_disable_file_line,
+                                uvm_format_message)
 
 from ..base.uvm_exceptions import UVMFinishError
 
-import inspect
-from inspect import getframeinfo, stack
+import sys
+from typing import Any, Dict
 
 
 
@@ -55,6 +57,23 @@ if UVM_REPORT_DISABLE_LINE:
     def uvm_line():
         return 0
 
+
+# Caches, per code object, whether 'self' can be found from its locals
+_m_code_has_self: Dict[Any, bool] = {}
+
+
+def _m_caller_self(frame):
+    """ Returns 'self' of the given frame, or None if the frame has no self """
+    code = frame.f_code
+    has_self = _m_code_has_self.get(code)
+    if has_self is None:
+        has_self = ('self' in code.co_varnames or 'self' in code.co_cellvars
+            or 'self' in code.co_freevars)
+        _m_code_has_self[code] = has_self
+    if has_self:
+        return frame.f_locals.get('self')
+    return None
+
 #//------------------------------------------------------------------------------
 #//
 #// Title: Report Macros
@@ -71,7 +90,9 @@ if UVM_REPORT_DISABLE_LINE:
 #//   underlying uvm_report_* call. Having the file and line number from where
 #//   a report was issued aides in debug. You can disable display of file and
 #//   line information in reports by defining UVM_REPORT_DISABLE_FILE_LINE on
-#//   the command line.
+#//   the command line. In uvm-python, call uvm_report_disable_file_line()
+#//   instead. The caller file/line is looked up from a single frame and
+#//   cached per call site, so it is cheap even when enabled.
 #//
 #// The macros also enforce a verbosity setting of UVM_NONE for warnings, errors
 #// and fatals so that they cannot be mistakenly turned off by setting the
@@ -97,6 +118,15 @@ if UVM_REPORT_DISABLE_LINE:
 #//
 #// Macros represent text substitutions, not statements, so they should not be
 #// terminated with semi-colons.
+#
+#// In uvm-python, the message can also be given lazily, so that filtered
+#// messages cost nothing to format. Extra arguments after the message (or
+#// after the verbosity for `uvm_info) are treated as $sformatf arguments for
+#// the ~MSG~ format string, and a callable ~MSG~ is called to produce the
+#// message. Both are evaluated only if the message is enabled:
+#//
+#//| uvm_info("MYINFO1", "val: %0d", UVM_HIGH, val)
+#//| uvm_info("MYINFO2", lambda: "item: " + item.convert2string(), UVM_FULL)
 
 
 #//----------------------------------------------------------------------------
@@ -112,14 +142,12 @@ if UVM_REPORT_DISABLE_LINE:
 #//
 #// |`uvm_info(ID, MSG, VERBOSITY)
 
-def uvm_info(ID, MSG, VERBOSITY):
+def uvm_info(ID, MSG, VERBOSITY, *args):
     if uvm_report_enabled(VERBOSITY, UVM_INFO, ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
-        f_locals = inspect.currentframe().f_back.f_locals  # type: ignore
-        if 'self' in f_locals:
-            parent_self = f_locals['self']
+        MSG = uvm_format_message(MSG, args)
+        fname, lineno = uvm_get_caller_file_line(1)
+        parent_self = _m_caller_self(sys._getframe(1))
+        if parent_self is not None:
             if hasattr(parent_self, 'uvm_report_info'):
                 parent_self.uvm_report_info(ID, MSG, VERBOSITY, fname, lineno, "", 1)
             else:
@@ -138,14 +166,12 @@ def uvm_info(ID, MSG, VERBOSITY):
 #//
 #// |`uvm_warning(ID, MSG)
 
-def uvm_warning(ID, MSG):
+def uvm_warning(ID, MSG, *args):
     if uvm_report_enabled(UVM_NONE, UVM_WARNING,ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
-        f_locals = inspect.currentframe().f_back.f_locals  # type: ignore
-        if 'self' in f_locals:
-            parent_self = f_locals['self']
+        MSG = uvm_format_message(MSG, args)
+        fname, lineno = uvm_get_caller_file_line(1)
+        parent_self = _m_caller_self(sys._getframe(1))
+        if parent_self is not None:
             if hasattr(parent_self, 'uvm_report_warning'):
                 parent_self.uvm_report_warning(ID, MSG, UVM_NONE, fname, lineno, "", 1)
             else:
@@ -163,14 +189,12 @@ def uvm_warning(ID, MSG):
 #//
 #// |`uvm_error(ID, MSG)
 
-def uvm_error(ID, MSG):
+def uvm_error(ID, MSG, *args):
     if uvm_report_enabled(UVM_NONE, UVM_ERROR,ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
-        f_locals = inspect.currentframe().f_back.f_locals  # type: ignore
-        if 'self' in f_locals:
-            parent_self = f_locals['self']
+        MSG = uvm_format_message(MSG, args)
+        fname, lineno = uvm_get_caller_file_line(1)
+        parent_self = _m_caller_self(sys._getframe(1))
+        if parent_self is not None:
             if hasattr(parent_self, 'uvm_report_error'):
                 parent_self.uvm_report_error(ID, MSG, UVM_NONE, fname, lineno, "", 1)
             else:
@@ -189,14 +213,12 @@ def uvm_error(ID, MSG):
 #// |`uvm_fatal(ID, MSG)
 
 
-def uvm_fatal(ID, MSG):
+def uvm_fatal(ID, MSG, *args):
     if uvm_report_enabled(UVM_NONE, UVM_FATAL,ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
-        f_locals = inspect.currentframe().f_back.f_locals  # type: ignore
-        if 'self' in f_locals:
-            parent_self = f_locals['self']
+        MSG = uvm_format_message(MSG, args)
+        fname, lineno = uvm_get_caller_file_line(1)
+        parent_self = _m_caller_self(sys._getframe(1))
+        if parent_self is not None:
             if hasattr(parent_self, 'uvm_report_fatal'):
                 parent_self.uvm_report_fatal(ID, MSG, UVM_NONE, fname, lineno, "", 1)
             else:
@@ -205,16 +227,15 @@ def uvm_fatal(ID, MSG):
             uvm_report_fatal(ID, MSG, UVM_NONE, fname, lineno, "", True)
 
 
-def uvm_info_context(ID, MSG, VERBOSITY, RO):
+def uvm_info_context(ID, MSG, VERBOSITY, RO, *args):
     """
     Operates identically to uvm_info but requires that the
     context, or <UVMReportObject>, in which the message is printed be
     explicitly supplied as a macro argument.
     """
     if RO.uvm_report_enabled(VERBOSITY, UVM_INFO, ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
+        MSG = uvm_format_message(MSG, args)
+        fname, lineno = uvm_get_caller_file_line(1)
         RO.uvm_report_info(ID, MSG, VERBOSITY, fname, lineno, "", 1)
 
 
@@ -246,11 +267,10 @@ def uvm_info_context(ID, MSG, VERBOSITY, RO):
 #     if (RO.uvm_report_enabled(UVM_NONE,UVM_ERROR,ID)) \
 #       RO.uvm_report_error (ID, MSG, UVM_NONE, uvm_file(), uvm_line(), "", 1); \
 #   end
-def uvm_error_context(ID, MSG, RO):
+def uvm_error_context(ID, MSG, RO, *args):
     if RO.uvm_report_enabled(UVM_NONE, UVM_ERROR, ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
+        MSG = uvm_format_message(MSG, args)
+        fname, lineno = uvm_get_caller_file_line(1)
         RO.uvm_report_error(ID, MSG, UVM_NONE, fname, lineno, "", 1)
 
 
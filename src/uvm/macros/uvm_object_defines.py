@@ -9,6 +9,7 @@ from ..base.uvm_object_globals import (UVM_CHECK_FIELDS, UVM_COMPARE, UVM_COPY,
                                        UVM_SETOBJ, UVM_SETSTR, UVM_UNPACK)
 from ..base.uvm_globals import uvm_report_info
 from ..base.uvm_globals import uvm_is_match
+import keyword
 
 
 def uvm_object_utils(T):
@@ -120,10 +121,12 @@ def uvm_object_utils_end(T):
 
 
 def uvm_field_utils_start(T):
-    # Create static member containers for var names and masks
-    if not hasattr(T, "_m_uvm_field_names"):
+    # Create static member containers for var names and masks. Each class
+    # gets its own, the fields of the base classes are handled by calling
+    # their _m_uvm_field_automation
+    if "_m_uvm_field_names" not in T.__dict__:
         setattr(T, "_m_uvm_field_names", [])
-    if not hasattr(T, "_m_uvm_field_masks"):
+    if "_m_uvm_field_masks" not in T.__dict__:
         setattr(T, "_m_uvm_field_masks", {})
 
     def _m_uvm_field_automation(self, rhs, what__, str__):
@@ -167,7 +170,7 @@ def uvm_field_utils_start(T):
                                 v_attr_self, v_attr_rhs, 0)
                         elif isinstance(v_attr_self, str):
                             T_cont.comparer.compare_string(v,
-                                v_attr_self, v_attr_rhs, 0)
+                                v_attr_self, v_attr_rhs)
                         elif hasattr(v_attr_self, "compare"):
                             T_cont.comparer.compare_object(v,
                                 v_attr_self, v_attr_rhs)
@@ -317,7 +320,121 @@ def uvm_field_utils_start(T):
 
 
 def uvm_field_utils_end(T):
-    pass
+    m_uvm_field_automation_gen(T)
+
+
+def m_uvm_field_automation_gen(T):
+    """
+    Replaces the `_m_uvm_field_automation` of `T` installed by
+    uvm_field_utils_start with a function generated from the field names and
+    masks registered for `T`. Copy, compare, print, pack and unpack run
+    straight-line code per field, with the masks resolved when the class is
+    defined. Other operations are passed to the generic implementation.
+    Fields with names that cannot be used as attributes in Python source are
+    left to the generic implementation as well.
+    """
+    from ..base.uvm_object import UVMObject
+    vals = T._m_uvm_field_names
+    masks = T._m_uvm_field_masks
+    for v in vals:
+        if not v.isidentifier() or keyword.iskeyword(v):
+            return
+
+    ns = {"T": T, "UVMObject": UVMObject, "sv": sv,
+        "_m_generic": T._m_uvm_field_automation}
+    src = ["def _m_uvm_field_automation(self, rhs, what__, str__):"]
+    src.append("    if what__ not in _m_generated:")
+    src.append("        return _m_generic(self, rhs, what__, str__)")
+    for i, Base in enumerate(T.__bases__):
+        base_auto = getattr(Base, "_m_uvm_field_automation", None)
+        if base_auto is not None and base_auto is not UVMObject._m_uvm_field_automation:
+            ns["_m_base" + str(i)] = Base
+            src.append("    _m_base{}._m_uvm_field_automation(self, rhs, what__, str__)".format(i))
+    src.append("    T_cont = T._m_uvm_status_container")
+
+    src.append("    if what__ == UVM_COPY:")
+    src.append("        pass")
+    for v in vals:
+        if not(masks[v] & UVM_NOCOPY) and (masks[v] & UVM_COPY != 0):
+            src.append("        x = rhs.{}".format(v))
+            src.append("        if type(x) is int or type(x) is str or not hasattr(x, 'clone'):")
+            src.append("            self.{} = x".format(v))
+            src.append("        else:")
+            src.append("            self.{} = x.clone()".format(v))
+
+    src.append("    elif what__ == UVM_COMPARE:")
+    src.append("        comparer = T_cont.comparer")
+    for v in vals:
+        if not(masks[v] & UVM_NOCOMPARE) and (masks[v] & UVM_COMPARE != 0):
+            src.append("        x = self.{}".format(v))
+            src.append("        y = rhs.{}".format(v))
+            src.append("        if x != y:")
+            src.append("            if isinstance(x, int):")
+            src.append("                comparer.compare_field({!r}, x, y, 0)".format(v))
+            src.append("            elif isinstance(x, str):")
+            src.append("                comparer.compare_string({!r}, x, y)".format(v))
+            src.append("            elif hasattr(x, 'compare'):")
+            src.append("                comparer.compare_object({!r}, x, y)".format(v))
+            src.append("            if comparer.result and comparer.show_max <= comparer.result:")
+            src.append("                return")
+
+    src.append("    elif what__ == UVM_PRINT:")
+    src.append("        printer = T_cont.printer")
+    for v in vals:
+        if not(masks[v] & UVM_NOPRINT) and (masks[v] & UVM_PRINT != 0):
+            print_obj = "print_object"
+            if masks[v] & UVM_REFERENCE:
+                print_obj = "print_object_header"
+            src.append("        x = self.{}".format(v))
+            src.append("        if x is None:")
+            src.append("            pass")
+            src.append("        elif isinstance(x, int):")
+            src.append("            printer.print_field({!r}, x, sv.bits(x), {})".format(v,
+                UVM_PRINT & UVM_RADIX))
+            src.append("        elif isinstance(x, UVMObject):")
+            src.append("            printer.{}({!r}, x)".format(print_obj, v))
+            src.append("        elif isinstance(x, str):")
+            src.append("            printer.print_string({!r}, x)".format(v))
+            src.append("        else:")
+            src.append("            raise Exception('Print not implemented yet with field macros. val: ' + str(x))")
+
+    src.append("    elif what__ == UVM_PACK:")
+    src.append("        packer = T_cont.packer")
+    for v in vals:
+        if not(masks[v] & UVM_NOPACK):
+            src.append("        x = self.{}".format(v))
+            src.append("        if isinstance(x, int):")
+            src.append("            packer.pack_field_int(x, sv.bits(x))")
+            src.append("        elif isinstance(x, UVMObject):")
+            src.append("            packer.pack_object(x)")
+            src.append("        elif isinstance(x, str):")
+            src.append("            packer.pack_string(x)")
+            src.append("        else:")
+            src.append("            raise TypeError('Unsupported type ' + str(type(x)) + ' for field automation')")
+
+    src.append("    elif what__ == UVM_UNPACK:")
+    src.append("        packer = T_cont.packer")
+    for v in vals:
+        if not(masks[v] & UVM_NOPACK):
+            src.append("        x = self.{}".format(v))
+            src.append("        if isinstance(x, int):")
+            src.append("            self.{} = packer.unpack_field_int(sv.bits(x))".format(v))
+            src.append("        elif isinstance(x, UVMObject):")
+            src.append("            packer.unpack_object(x)")
+            src.append("            self.{} = x".format(v))
+            src.append("        elif isinstance(x, str):")
+            src.append("            self.{} = packer.unpack_string()".format(v))
+            src.append("        else:")
+            src.append("            raise TypeError('Unsupported type ' + str(type(x)) + ' for field automation')")
+
+    ns.update({"UVM_COPY": UVM_COPY, "UVM_COMPARE": UVM_COMPARE,
+        "UVM_PRINT": UVM_PRINT, "UVM_PACK": UVM_PACK, "UVM_UNPACK": UVM_UNPACK})
+    ns["_m_generated"] = frozenset([UVM_COPY, UVM_COMPARE, UVM_PRINT, UVM_PACK,
+        UVM_UNPACK])
+    code = "\n".join(src) + "\n"
+    exec(compile(code, "<uvm_field_automation " + T.__name__ + ">", "exec"), ns)
+    ns["_m_uvm_field_automation"].m_uvm_source = code
+    setattr(T, "_m_uvm_field_automation", ns["_m_uvm_field_automation"])
 
 
 def uvm_field_val(name, mask):
@@ -349,3 +466,34 @@ def uvm_field_aa(name, mask=UVM_DEFAULT):
 
 def uvm_field_aa_string_string(name, mask=UVM_DEFAULT):
     uvm_field_aa(name, mask)
+
+
+def uvm_pack_layout(T, fields):
+    """
+    Declares a fixed bit layout for packing `T`, as a list of
+    (field_name, width) tuples in packing order. Installs `do_pack` and
+    `do_unpack` methods which call the existing ones and then pack/unpack the
+    layout with one precompiled `UVMPackLayout`, stored as `T.pack_layout`.
+    Fields of the layout which are also registered with `uvm_field_*` should
+    have `UVM_NOPACK` set, so that they are not packed twice.
+
+    Returns:
+        UVMPackLayout: The layout of `T`.
+    """
+    from ..base.uvm_packer import UVMPackLayout
+    layout = UVMPackLayout(fields)
+    base_do_pack = T.do_pack
+    base_do_unpack = T.do_unpack
+
+    def do_pack(self, packer):
+        base_do_pack(self, packer)
+        layout.pack(self, packer)
+
+    def do_unpack(self, packer):
+        base_do_unpack(self, packer)
+        layout.unpack(self, packer)
+
+    setattr(T, "pack_layout", layout)
+    setattr(T, "do_pack", do_pack)
+    setattr(T, "do_unpack", do_unpack)
+    return layout
@@ -834,7 +834,7 @@ class UVMMem(UVMObject):
 
         status.append(rw.status)
 
-        uvm_info("RegModel", sv.sformatf("Poked memory '%s[%0d]' with value 'h%h",
+        uvm_info("RegModel", lambda: sv.sformatf("Poked memory '%s[%0d]' with value 'h%h",
             self.get_full_name(), offset, value), UVM_HIGH)
 
 
@@ -893,7 +893,7 @@ class UVMMem(UVMObject):
         status.append(rw.status)
         value.append(rw.value[0])
 
-        uvm_info("RegModel", sv.sformatf("Peeked memory '%s[%0d]' has value '%s'",
+        uvm_info("RegModel", lambda: sv.sformatf("Peeked memory '%s[%0d]' has value '%s'",
             self.get_full_name(), offset, str(value)), UVM_HIGH)
 
 
@@ -1436,7 +1436,7 @@ class UVMMem(UVMObject):
             for i in range(len(paths)):
                 hdl_concat = paths[i]  # uvm_hdl_path_concat
                 for j in range(len(hdl_concat.slices)):
-                    uvm_info("RegModel", sv.sformatf("backdoor_write to %s ", hdl_concat.slices[j].path),UVM_DEBUG)
+                    uvm_info("RegModel", "backdoor_write to %s ", UVM_DEBUG, hdl_concat.slices[j].path)
 
                     if (hdl_concat.slices[j].offset < 0):
                         ok &= uvm_hdl.uvm_hdl_deposit(hdl_concat.slices[j].path
@@ -912,7 +912,8 @@ class UVMReg(UVMObject):
         await self.do_write(rw)
         status.append(rw.status)
         await self.XatomicX(0)
-        return rw.status
+        rw.release()
+        return status[-1]
 
 
     async def read(self, status, value, path=UVM_DEFAULT_PATH, _map=None,
@@ -1247,6 +1248,7 @@ class UVMReg(UVMObject):
         # TODO change arg passing
         status.append(rw.status)
         value.append(rw.value[0])
+        rw.release()
         #endtask: XreadX
 
     async def XatomicX(self, on, rw=None):
@@ -2165,8 +2167,7 @@ class UVMReg(UVMObject):
                       val, uvm_hdl_concat2string(paths[i])))
                 return UVM_NOT_OK
 
-            uvm_info("RegMem",
-                sv.sformatf("returned backdoor value 0x%0x",rw.value[0]),UVM_DEBUG)
+            uvm_info("RegMem", "returned backdoor value 0x%0x", UVM_DEBUG, rw.value[0])
 
         rw.status = UVM_NOT_OK
         if ok:
@@ -153,6 +153,24 @@ class UVMRegItem(UVMSequenceItem):
 
         self.local_map = None
 
+    def reinit(self, name) -> None:
+        super().reinit(name)
+        self.value = [0]
+        self.path = UVM_FRONTDOOR
+        self.status = 0
+        self.fname = ""
+        self.lineno = 0
+        self.bd_kind = ""
+        self.prior = -1
+        self.extension = None
+        self.parent = None
+        self.offset = 0
+        self.kind = UVM_READ
+        self.element = None
+        self.element_kind = -1
+        self.map = None
+        self.local_map = None
+
     def convert2string(self) -> str:
         """
         Function: convert2string
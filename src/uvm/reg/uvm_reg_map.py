@@ -1381,7 +1381,7 @@ class UVMRegMap(UVMObject):
                 data = (value >> (curr_byte*8)) & ((1 << (bus_width * 8))-1)
 
                 uvm_info(self.get_type_name(),
-                   sv.sformatf("Writing 0x%0h at 0x%0h via map %s...",
+                   lambda: sv.sformatf("Writing 0x%0h at 0x%0h via map %s...",
                         data, addrs[i], rw.map.get_full_name()), UVM_VERB_MEM_MAP)
 
                 if rw.element_kind == UVM_FIELD:
@@ -1444,6 +1444,9 @@ class UVMRegMap(UVMObject):
                     #        adapter.get_name(),
                     #        bus_req.convert2string())
                     #    )
+                # The bus item is not used after bus2reg, so it can be reused
+                # if pooling is enabled for its type
+                bus_req.release()
 
                 if (rw.parent is not None and i == len(addrs)-1):
                     rw.parent.post_do(rw)
@@ -1451,7 +1454,7 @@ class UVMRegMap(UVMObject):
                 rw.status = rw_access.status
 
                 uvm_info(self.get_type_name(),
-                   sv.sformatf("Wrote 0x%0h at 0x%0h via map %s: %s...",
+                   lambda: sv.sformatf("Wrote 0x%0h at 0x%0h via map %s: %s...",
                       rw_access.data, addrs[i], rw.map.get_full_name(), rw.status), UVM_VERB_MEM_MAP)
 
                 if rw.status == UVM_NOT_OK:
@@ -1530,7 +1533,7 @@ class UVMRegMap(UVMObject):
                 rw_access = UVMRegBusOp()
 
                 uvm_info(self.get_type_name(),
-                   sv.sformatf("Reading address 'h%0h via map \"%s\"...",
+                   lambda: sv.sformatf("Reading address 'h%0h via map \"%s\"...",
                              addrs[i], self.get_full_name()), UVM_VERB_MEM_MAP)
 
                 if rw.element_kind == UVM_FIELD:
@@ -1585,6 +1588,7 @@ class UVMRegMap(UVMObject):
                     adapter.bus2reg(bus_rsp, rw_access)
                 else:
                     adapter.bus2reg(bus_req,rw_access)
+                bus_req.release()
 
                 data = rw_access.data & ((1 << bus_width*8)-1)  # mask the upper bits
                 rw.status = rw_access.status
@@ -1593,7 +1597,7 @@ class UVMRegMap(UVMObject):
                 #if (rw.status == UVM_IS_OK && (^data) === 1'bx):
 
                 uvm_info(self.get_type_name(),
-                   sv.sformatf("Read 0x%h at 0x%h via map %s: %s...", data,
+                   lambda: sv.sformatf("Read 0x%h at 0x%h via map %s: %s...", data,
                        addrs[i], self.get_full_name(), str(rw.status)), UVM_VERB_MEM_MAP)
 
                 if rw.status == UVM_NOT_OK:
@@ -145,7 +145,7 @@ class UVMRegPredictor(UVMComponent):
         if self.adapter is None:
             uvm_fatal("REG/WRITE/None","write: adapter handle is None")
 
-        uvm_info("REG_PREDICTOR", "write(): Received " + tr.convert2string(),
+        uvm_info("REG_PREDICTOR", lambda: "write(): Received " + tr.convert2string(),
             UVM_MEDIUM)
 
         # In case they forget to set byte_en
@@ -167,7 +167,7 @@ class UVMRegPredictor(UVMComponent):
             ir = None  # uvm_reg
 
             if not self.m_pending.exists(rg):
-                item = UVMRegItem()
+                item = UVMRegItem.type_id.create("predict_item")
                 predict_info = UVMPredictS()
                 item.element_kind = UVM_REG
                 item.element      = rg
@@ -224,17 +224,20 @@ class UVMRegPredictor(UVMComponent):
 
                         rg.do_predict(reg_item, predict_kind, rw.byte_en)
                         if reg_item.kind == UVM_WRITE:
-                            uvm_info("REG_PREDICT", "Observed WRITE transaction to register "
+                            uvm_info("REG_PREDICT", lambda: "Observed WRITE transaction to register "
                                      + ir.get_full_name() + ": value='h"
                                      + sv.sformatf("%0h",reg_item.value[0]) + " : updated value = 'h"
                                      + sv.sformatf("%0h",ir.get()), UVM_HIGH)
                         else:
-                            uvm_info("REG_PREDICT", "Observed READ transaction to register "
+                            uvm_info("REG_PREDICT", lambda: "Observed READ transaction to register "
                                      + ir.get_full_name() + ": value='h" +
                                      sv.sformatf("%0h", reg_item.value[0]),UVM_HIGH)
 
                         self.reg_ap.write(reg_item)
                         self.m_pending.delete(rg)
+                        # Subscribers of reg_ap must clone the item to keep it
+                        # when pooling is enabled for UVMRegItem
+                        reg_item.release()
 
                     break
 
@@ -243,8 +246,7 @@ class UVMRegPredictor(UVMComponent):
                        + rg.get_full_name() + "'")
         else:
             uvm_info("REG_PREDICT_NOT_FOR_ME",
-               "Observed transaction does not target a register: " +
-                 sv.sformatf("%p",tr), UVM_FULL)
+               "Observed transaction does not target a register: %p", UVM_FULL, tr)
 
 
     #  // Function: check_phase
@@ -183,13 +183,12 @@ class UVMRegSequence(UVMSequence):
         Args:
             rw: 
         """
-        rws = rw.convert2string()
         if self.m_sequencer is None:
             uvm_fatal("REG/DO_ITEM/NULL","do_reg_item: m_sequencer is null")
         if self.adapter is None:
             uvm_fatal("REG/DO_ITEM/NULL","do_reg_item: adapter handle is null")
 
-        uvm_info("DO_RW_ACCESS","Doing transaction: " + rws, UVM_HIGH)
+        uvm_info("DO_RW_ACCESS", lambda: "Doing transaction: " + rw.convert2string(), UVM_HIGH)
 
         if (self.parent_select == LOCAL):
             self.upstream_parent = rw.parent
@@ -694,8 +694,8 @@ class UVMSequencerBase(UVMComponent):
                 #item, [{request: SEQ_TYPE_LOCK}, {'process_id.status':
                 #    [process::KILLED, process::FINISHED])
         for idx in range(len(q)):
-            uvm_error("SEQLCKZMB", sv.sformatf(SEQ_ERR1_MSG, self.get_full_name(),
-                q.get(idx).sequence_ptr.get_full_name()))
+            uvm_error("SEQLCKZMB", SEQ_ERR1_MSG, self.get_full_name(),
+                q.get(idx).sequence_ptr.get_full_name())
             self.remove_sequence_from_queues(q.get(idx).sequence_ptr)
 
         # now move all self.is_blocked() into self.lock_list
@@ -786,8 +786,8 @@ class UVMSequencerBase(UVMComponent):
         while i < self.arb_sequence_q.size():
             if ((self.arb_sequence_q.get(i).process_id.status == process.KILLED) or
                     (self.arb_sequence_q.get(i).process_id.status == process.FINISHED)):
-                uvm_error("SEQREQZMB", sv.sformatf(SEQ_ERR2_MSG, self.get_full_name(),
-                   self.arb_sequence_q.get(i).sequence_ptr.get_full_name()))
+                uvm_error("SEQREQZMB", SEQ_ERR2_MSG, self.get_full_name(),
+                   self.arb_sequence_q.get(i).sequence_ptr.get_full_name())
                 self.remove_sequence_from_queues(self.arb_sequence_q.get(i).sequence_ptr)
                 continue
 
@@ -949,8 +949,8 @@ class UVMSequencerBase(UVMComponent):
                 if ((self.arb_sequence_q.get(i).sequence_id == seq_id) or
                       (self.is_child(sequence_ptr, self.arb_sequence_q.get(i).sequence_ptr))):
                     if (sequence_ptr.get_sequence_state() == UVM_FINISHED):
-                        uvm_error("SEQFINERR", sv.sformatf(SEQ_ERR3_MSG, sequence_ptr.get_full_name(),
-                            self.arb_sequence_q.get(i).sequence_ptr.get_full_name()))
+                        uvm_error("SEQFINERR", SEQ_ERR3_MSG, sequence_ptr.get_full_name(),
+                            self.arb_sequence_q.get(i).sequence_ptr.get_full_name())
                     self.arb_sequence_q.delete(i)
                     self.m_update_lists()
                 else:
@@ -965,8 +965,8 @@ class UVMSequencerBase(UVMComponent):
                 if ((self.lock_list.get(i).get_inst_id() == sequence_ptr.get_inst_id()) or
                         (self.is_child(sequence_ptr, self.lock_list.get(i)))):
                     if (sequence_ptr.get_sequence_state() == UVM_FINISHED):
-                        uvm_error("SEQFINERR", sv.sformatf(SEQ_ERR4_MSG,sequence_ptr.get_full_name(),
-                            self.lock_list.get(i).get_full_name()))
+                        uvm_error("SEQFINERR", SEQ_ERR4_MSG, sequence_ptr.get_full_name(),
+                            self.lock_list.get(i).get_full_name())
                     self.lock_list.delete(i)
                     self.m_update_lists()
                 else:
@@ -1142,7 +1142,7 @@ class UVMSequencerBase(UVMComponent):
         else:
             self.m_wait_relevant_count += 1
             if self.m_wait_relevant_count > self.m_max_zero_time_wait_relevant_count:
-                uvm_fatal("SEQRELEVANTLOOP",sv.sformatf(SEQ_FATAL1_MSG, self.m_wait_relevant_count))
+                uvm_fatal("SEQRELEVANTLOOP", SEQ_FATAL1_MSG, self.m_wait_relevant_count)
         self.set_value('m_is_relevant_completed', True)
 
 
@@ -321,7 +321,7 @@ class UVMSequencerParamBase(UVMSequencerBase):
                 return
             sequence_ptr.put_response(t)
         else:
-            self.uvm_report_info("Sequencer", sv.sformatf(INFO_MSG1, t.get_sequence_id()))
+            self.uvm_report_info("Sequencer", INFO_MSG1, args=(t.get_sequence_id(),))
         #endfunction
 
     def build_phase(self, phase):
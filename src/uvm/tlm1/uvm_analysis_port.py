@@ -27,12 +27,29 @@ This section defines the port, export, and imp classes used for transaction
 analysis.
 """
 
-from ..macros.uvm_message_defines import uvm_fatal
 from ..macros.uvm_tlm_defines import UVM_TLM_ANALYSIS_MASK
 from ..base.uvm_port_base import UVM_UNBOUNDED_CONNECTIONS, UVMPortBase
 from .uvm_tlm_imps import UVM_EXPORT, UVM_IMP_COMMON, UVM_PORT
 
 
+def m_write_each(write):
+    def write_batch(ts):
+        for t in ts:
+            write(t)
+    return write_batch
+
+
+def m_resolve_subscribers(port):
+    """
+    Freezes the resolved imps of `port` into tuples of their `write` and
+    `write_batch` methods, used by `write` and `write_many`.
+    """
+    imps = list(port.m_imp_list.values())
+    port.m_write_fns = tuple(imp.write for imp in imps)
+    port.m_write_batch_fns = tuple(getattr(imp, "write_batch", None)
+        or m_write_each(imp.write) for imp in imps)
+
+
 class UVMAnalysisPort(UVMPortBase):
     """
     Broadcasts a value to all subscribers implementing a `UVMAnalysisImp`.
@@ -51,15 +68,23 @@ class UVMAnalysisPort(UVMPortBase):
                 self.ap.write(t)
                 ...
 
+    The subscribers are resolved once in `resolve_bindings`, before the
+    end_of_elaboration phase. Nothing is written before that.
     """
 
     def __init__(self, name, parent):
         UVMPortBase.__init__(self, name, parent, UVM_PORT, 0, UVM_UNBOUNDED_CONNECTIONS)
         self.m_if_mask = UVM_TLM_ANALYSIS_MASK
+        self.m_write_fns = ()
+        self.m_write_batch_fns = ()
 
     def get_type_name(self):
         return "uvm_analysis_port"
 
+    def resolve_bindings(self):
+        UVMPortBase.resolve_bindings(self)
+        m_resolve_subscribers(self)
+
     def write(self, t):
         """
         Send specified value to all connected interface
@@ -67,13 +92,20 @@ class UVMAnalysisPort(UVMPortBase):
         Args:
             t (any): Transaction to broadcast.
         """
-        for i in range(0, self.size()):
-            tif = self.get_if(i)
-            if tif is None:
-                uvm_fatal("NTCONN", ("No uvm_tlm interface is connected to " +
-                    self.get_full_name() + " for executing write()"))
-            else:
-                tif.write(t)
+        for write in self.m_write_fns:
+            write(t)
+
+    def write_many(self, ts):
+        """
+        Broadcasts a batch of transactions. Each subscriber receives the whole
+        batch in one `write_batch` call, see `UVMAnalysisImp.write_batch`,
+        before the next subscriber.
+
+        Args:
+            ts (list): Transactions to broadcast.
+        """
+        for write_batch in self.m_write_batch_fns:
+            write_batch(ts)
 
 
 class UVMAnalysisImp:
@@ -108,6 +140,22 @@ class UVMAnalysisImp:
         """
         self.m_imp.write(t)  # type: ignore
 
+    def write_batch(self, ts):
+        """
+        Invokes `write_batch(ts)` in the parent component if it has one, so
+        that it can process the batch at once, or `write` for each
+        transaction otherwise.
+
+        Args:
+            ts (list): Transactions to write.
+        """
+        write_batch = getattr(self.m_imp, "write_batch", None)  # type: ignore
+        if write_batch is not None:
+            write_batch(ts)
+        else:
+            for t in ts:
+                self.m_imp.write(t)  # type: ignore
+
 
 UVMAnalysisImp = UVM_IMP_COMMON(UVMAnalysisImp, UVM_TLM_ANALYSIS_MASK, "uvm_analysis_imp")
 
@@ -128,10 +176,16 @@ class UVMAnalysisExport(UVMPortBase):
         """
         UVMPortBase.__init__(self, name, parent, UVM_EXPORT, 0, UVM_UNBOUNDED_CONNECTIONS)
         self.m_if_mask = UVM_TLM_ANALYSIS_MASK
+        self.m_write_fns = ()
+        self.m_write_batch_fns = ()
 
     def get_type_name(self):
         return "uvm_analysis_export"
 
+    def resolve_bindings(self):
+        UVMPortBase.resolve_bindings(self)
+        m_resolve_subscribers(self)
+
     def write(self, t):
         """
         Analysis port differs from other ports in that it broadcasts
@@ -141,10 +195,15 @@ class UVMAnalysisExport(UVMPortBase):
         Args:
             t: Transaction to broadcast.
         """
-        for i in range(0, self.size()):
-            tif = self.get_if(i)
-            if tif is None:
-                uvm_fatal("NTCONN", ("No uvm_tlm interface is connected to "
-                    + self.get_full_name() + " for executing write()"))
-            else:
-                tif.write(t)
+        for write in self.m_write_fns:
+            write(t)
+
+    def write_many(self, ts):
+        """
+        Broadcasts a batch of transactions, see `UVMAnalysisPort.write_many`.
+
+        Args:
+            ts (list): Transactions to broadcast.
+        """
+        for write_batch in self.m_write_batch_fns:
+            write_batch(ts)
@@ -209,3 +209,15 @@ class UVMTLMAnalysisFIFO(UVMTLMFIFO):
 
     def write(self, t) -> None:
         self.try_put(t)  # unbounded => must succeed
+
+    def write_batch(self, ts) -> None:
+        """
+        Puts a batch of transactions sent with `UVMAnalysisPort.write_many`
+        into the FIFO, and broadcasts them on `put_ap` as a batch.
+
+        Args:
+            ts (list): Transactions
+        """
+        for t in ts:
+            self.m.try_put(t)  # unbounded => must succeed
+        self.put_ap.write_many(ts)
@@ -52,7 +52,6 @@ from uvm.tlm1.uvm_tlm_imps import UVM_IMP_COMMON
 from uvm.tlm2.uvm_tlm2_defines import UVM_TLM_NB_FW_MASK, UVM_TLM_B_MASK,\
     UVM_TLM_NB_BW_MASK
 from uvm.macros.uvm_message_defines import uvm_error
-from uvm.base.sv import cat
 import cocotb
 
 #// The macro wraps the forward path call function nb_transport_fw()
@@ -71,9 +70,8 @@ import cocotb
 def UVM_TLM_NB_TRANSPORT_FW_IMP(imp, T):
     def nb_transport_fw(self, t, p, delay):
         if delay is None:
-            uvm_error("UVM/TLM/NULLDELAY",
-                cat(self.get_full_name(),
-                   ".nb_transport_fw() called with 'null' delay"))
+            uvm_error("UVM/TLM/NULLDELAY", "%s.nb_transport_fw() called with 'null' delay",
+                self.get_full_name())
             return uvm_tlm_sync_e.UVM_TLM_COMPLETED
 
         return getattr(self, imp).nb_transport_fw(t, p, delay)
@@ -119,9 +117,8 @@ def UVM_TLM_NB_TRANSPORT_FW_IMP(imp, T):
 def UVM_TLM_NB_TRANSPORT_BW_IMP(imp, T):
     def nb_transport_bw(self, t, p, delay):
         if delay is None:
-            uvm_error("UVM/TLM/NULLDELAY",
-                cat(self.get_full_name(),
-                   ".nb_transport_bw() called with 'null' delay"))
+            uvm_error("UVM/TLM/NULLDELAY", "%s.nb_transport_bw() called with 'null' delay",
+                self.get_full_name())
             return uvm_tlm_sync_e.UVM_TLM_COMPLETED
         return getattr(self, imp).nb_transport_bw(t, p, delay)
 
@@ -148,9 +145,8 @@ def UVM_TLM_B_TRANSPORT_IMP(imp, T):
 
     async def b_transport(self, t, delay):
         if delay == None:
-            uvm_error("UVM/TLM/NULLDELAY",
-                  cat(self.get_full_name(),
-                   ".b_transport() called with 'null' delay"))
+            uvm_error("UVM/TLM/NULLDELAY", "%s.b_transport() called with 'null' delay",
+                self.get_full_name())
             return
         await getattr(self, imp).b_transport(t, delay)
     setattr(T, "b_transport", b_transport)
@@ -0,0 +1,80 @@
+"""
+Benchmark for broadcasting through a UVMAnalysisPort.
+
+Broadcasts transactions to 1, 5 and 10 subscribers with the earlier write
+loop (get_if per subscriber per transaction, reproduced below as
+legacy_write), with write, and with write_many in batches of 64 to
+subscribers which implement write_batch.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_analysis_port.py [num_items]
+"""
+
+import sys
+import time
+
+from uvm.base.uvm_component import UVMComponent
+from uvm.comps.uvm_subscriber import UVMSubscriber
+from uvm.tlm1.uvm_analysis_port import UVMAnalysisPort
+
+BATCH = 64
+
+
+class CountSub(UVMSubscriber):
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.count = 0
+
+    def write(self, t):
+        self.count += 1
+
+    def write_batch(self, ts):
+        self.count += len(ts)
+
+
+def legacy_write(port, t):
+    for i in range(0, port.size()):
+        tif = port.get_if(i)
+        if tif is None:
+            raise Exception("No uvm_tlm interface is connected")
+        else:
+            tif.write(t)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    n -= n % BATCH
+    print("{:<14} {:>16} {:>16} {:>16}".format("subscribers", "legacy ns/item",
+        "write ns/item", "write_many ns/item"))
+    for nsubs in [1, 5, 10]:
+        top = UVMComponent("top" + str(nsubs), None)
+        port = UVMAnalysisPort("ap", top)
+        subs = [CountSub("sub" + str(i), top) for i in range(nsubs)]
+        for sub in subs:
+            port.connect(sub.analysis_export)
+        port.resolve_bindings()
+        items = list(range(n))
+
+        start = time.perf_counter()
+        for t in items:
+            legacy_write(port, t)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for t in items:
+            port.write(t)
+        write = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(0, n, BATCH):
+            port.write_many(items[i:i + BATCH])
+        write_many = time.perf_counter() - start
+        assert all(sub.count == 3 * n for sub in subs)
+        print("{:<14} {:>16.0f} {:>16.0f} {:>16.0f}".format(nsubs,
+            1e9 * legacy / n, 1e9 * write / n, 1e9 * write_many / n))
+
+
+if __name__ == '__main__':
+    main()
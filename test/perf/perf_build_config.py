@@ -0,0 +1,117 @@
+"""
+Benchmark for the configuration step of the build phase.
+
+Creates a hierarchy of components with `uvm_field` macros and a set of
+wildcard config_db settings, and then calls apply_config_settings for every
+component, as build_phase does. Compares the indexed
+UVMResourcePool.lookup_scope and the stable sort_by_precedence against the
+previous implementations, which matched every resource against each
+component path.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_build_config.py [num_components]
+"""
+
+import sys
+import time
+
+from uvm.base.uvm_component import UVMComponent
+from uvm.base.uvm_config_db import UVMConfigDb
+from uvm.base.uvm_resource import UVMResourcePool
+from uvm.base.uvm_queue import UVMQueue
+from uvm.macros import (uvm_component_utils_begin, uvm_component_utils_end,
+    uvm_field_int, uvm_field_string)
+
+
+class BenchLeaf(UVMComponent):
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.num_items = 0
+        self.mode = ""
+
+
+uvm_component_utils_begin(BenchLeaf)
+uvm_field_int("num_items")
+uvm_field_string("mode")
+uvm_component_utils_end(BenchLeaf)
+
+
+def legacy_lookup_scope(self, scope):
+    """ UVMResourcePool.lookup_scope before the scope index """
+    q = UVMQueue()
+    if self.rtab.has_last():
+        name = self.rtab.last()
+        while True:
+            rq = self.rtab[name]
+            for i in range(len(rq)):
+                r = rq[i]
+                if r.match_scope(scope):
+                    q.push_back(r)
+            if self.rtab.has_prev():
+                name = self.rtab.prev()
+            else:
+                break
+    return q
+
+
+def legacy_sort_by_precedence(cls, q):
+    """ UVMResourcePool.sort_by_precedence before the stable sort """
+    _all = {}
+    for i in range(len(q)):
+        r = q[i]
+        if r.precedence not in _all:
+            _all[r.precedence] = UVMQueue()
+        _all[r.precedence].push_front(r)
+    qq = []
+    for key in _all:
+        for j in range(len(_all[key])):
+            qq.insert(0, _all[key].get(j))
+    return qq
+
+
+def build(n):
+    top = UVMComponent("top", None)
+    comps = []
+    for i in range(n // 100):
+        env = UVMComponent("env" + str(i), top)
+        for j in range(100):
+            comps.append(BenchLeaf("leaf" + str(j), env))
+    UVMConfigDb.set(None, "top.*", "num_items", 1)
+    UVMConfigDb.set(None, "top.env1*", "num_items", 2)
+    UVMConfigDb.set(None, "*.leaf7", "mode", "fast")
+    UVMConfigDb.set(None, "top.env2.leaf*", "mode", "slow")
+    for i in range(0, n // 100, 10):
+        UVMConfigDb.set(None, "top.env{}.leaf{}".format(i, i % 100),
+            "num_items", i)
+    for i in range(200):
+        UVMConfigDb.set(None, "top.env{}.*".format(i), "unused" + str(i), i)
+    return comps
+
+
+def measure(name, comps):
+    start = time.perf_counter()
+    for comp in comps:
+        comp.apply_config_settings()
+    elapsed = time.perf_counter() - start
+    print("{:<36} {:>8.3f} s".format(name, elapsed))
+    return [(comp.num_items, comp.mode) for comp in comps]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    comps = build(n)
+    lookup_scope = UVMResourcePool.lookup_scope
+    sort_by_precedence = UVMResourcePool.sort_by_precedence
+    UVMResourcePool.lookup_scope = legacy_lookup_scope
+    UVMResourcePool.sort_by_precedence = classmethod(legacy_sort_by_precedence)
+    before = measure("full scan (before)", comps)
+    UVMResourcePool.lookup_scope = lookup_scope
+    UVMResourcePool.sort_by_precedence = sort_by_precedence
+    after = measure("scope index (after)", comps)
+    assert before == after
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark for creating objects and components through the factory.
+
+Creates sequence items and components by type and by name, with a few type
+and instance overrides registered, and compares the resolution cache of
+UVMDefaultFactory against resolving the overrides on every create. The
+construction of the objects dominates a create, so the override resolution
+is also timed on its own.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_factory_create.py [num_creates]
+"""
+
+import sys
+import time
+
+from uvm.base.uvm_component import UVMComponent
+from uvm.base.uvm_factory import UVMDefaultFactory
+from uvm.seq.uvm_sequence_item import UVMSequenceItem
+from uvm.macros import uvm_component_utils, uvm_object_utils
+
+
+class BenchItem(UVMSequenceItem):
+    pass
+
+
+class BenchItemExt(BenchItem):
+    pass
+
+
+class BenchComp(UVMComponent):
+    pass
+
+
+class BenchCompExt(BenchComp):
+    pass
+
+
+uvm_object_utils(BenchItem)
+uvm_object_utils(BenchItemExt)
+uvm_component_utils(BenchComp)
+uvm_component_utils(BenchCompExt)
+
+
+def uncached_resolve_by_type(self, requested_type, full_inst_path):
+    self.m_override_info.clear()
+    return self.find_override_by_type(requested_type, full_inst_path)
+
+
+def uncached_resolve_by_name(self, requested_type_name, full_inst_path):
+    self.m_override_info.clear()
+    wrapper = self.find_override_by_name(requested_type_name, full_inst_path)
+    if wrapper is None and self.m_type_names.exists(requested_type_name):
+        wrapper = self.m_type_names.get(requested_type_name)
+    return wrapper
+
+
+def run(factory, top, n):
+    start = time.perf_counter()
+    for i in range(n):
+        factory.create_object_by_type(BenchItem.get_type(), "seq", "item")
+        factory.create_object_by_name("BenchItem", "seq", "item")
+        if i & 0xf == 0:
+            factory.create_component_by_type(BenchComp.get_type(),
+                top.get_full_name(), "comp" + str(i), top)
+    return time.perf_counter() - start
+
+
+def resolve(factory, n):
+    start = time.perf_counter()
+    for i in range(n):
+        factory.m_resolve_by_type(BenchItem.get_type(), "seq.item")
+        factory.m_resolve_by_name("BenchItem", "seq.item")
+        factory.m_resolve_by_type(BenchComp.get_type(), "top.comp")
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    factory = UVMDefaultFactory()
+    for i in range(20):
+        factory.set_inst_override_by_type(BenchComp.get_type(),
+            BenchCompExt.get_type(), "*.other" + str(i))
+    factory.set_type_override_by_type(BenchItem.get_type(),
+        BenchItemExt.get_type())
+    factory.set_inst_override_by_type(BenchItem.get_type(),
+        BenchItemExt.get_type(), "*.seq.item")
+
+    resolve_by_type = UVMDefaultFactory.m_resolve_by_type
+    resolve_by_name = UVMDefaultFactory.m_resolve_by_name
+    UVMDefaultFactory.m_resolve_by_type = uncached_resolve_by_type
+    UVMDefaultFactory.m_resolve_by_name = uncached_resolve_by_name
+    before = run(factory, UVMComponent("top0", None), n)
+    before_resolve = resolve(factory, n)
+    UVMDefaultFactory.m_resolve_by_type = resolve_by_type
+    UVMDefaultFactory.m_resolve_by_name = resolve_by_name
+    after = run(factory, UVMComponent("top1", None), n)
+    after_resolve = resolve(factory, n)
+    num = 2 * n + n // 16
+    for name, elapsed, resolve_elapsed in [
+            ("resolve on every create", before, before_resolve),
+            ("resolution cache", after, after_resolve)]:
+        print("{:<28} {:>8.0f} creates/s {:>10.0f} resolves/s".format(name,
+            num / elapsed, 3 * n / resolve_elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark for the `uvm_field_*` automation.
+
+Runs copy, compare, pack, unpack and sprint on a transaction with 30 fields
+registered with `uvm_field_int`/`uvm_field_string`, using the generic
+_m_uvm_field_automation installed by uvm_object_utils_begin and the one
+generated by uvm_object_utils_end, and checks that both give the same results.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_field_automation.py [num_iters]
+"""
+
+import sys
+import time
+
+from uvm.base.uvm_object import UVMObject
+from uvm.macros import (uvm_object_utils_begin, uvm_object_utils_end,
+    uvm_field_int, uvm_field_string)
+from uvm.base.uvm_object_globals import UVM_ALL_ON, UVM_NOCOMPARE
+
+NUM_FIELDS = 30
+
+
+class Bench30(UVMObject):
+
+    def __init__(self, name="Bench30"):
+        super().__init__(name)
+        for i in range(NUM_FIELDS - 2):
+            setattr(self, "f" + str(i), i)
+        self.tag = "tag"
+        self.note = "note"
+
+
+uvm_object_utils_begin(Bench30)
+for i in range(NUM_FIELDS - 2):
+    uvm_field_int("f" + str(i))
+uvm_field_string("tag")
+uvm_field_string("note", UVM_ALL_ON | UVM_NOCOMPARE)
+generic = Bench30._m_uvm_field_automation
+uvm_object_utils_end(Bench30)
+generated = Bench30._m_uvm_field_automation
+
+
+def run(n):
+    a = Bench30("a")
+    b = Bench30("b")
+    b.f7 = 700
+    times = {}
+    results = []
+
+    start = time.perf_counter()
+    for i in range(n):
+        b.copy(a)
+    times["copy"] = time.perf_counter() - start
+
+    b.note = "other"
+    start = time.perf_counter()
+    for i in range(n):
+        res = b.compare(a)
+    times["compare"] = time.perf_counter() - start
+    results.append(res)
+
+    start = time.perf_counter()
+    for i in range(n):
+        packed = a.pack()
+    times["pack"] = time.perf_counter() - start
+    results.append(packed)
+
+    start = time.perf_counter()
+    for i in range(n):
+        b.unpack(packed[1])
+    times["unpack"] = time.perf_counter() - start
+    results.append(b.f9)
+
+    start = time.perf_counter()
+    for i in range(n // 10):
+        s = a.sprint()
+    times["sprint"] = 10 * (time.perf_counter() - start)
+    results.append(s.count("\n"))
+    return times, results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    Bench30._m_uvm_field_automation = generic
+    before, before_res = run(n)
+    Bench30._m_uvm_field_automation = generated
+    after, after_res = run(n)
+    assert before_res == after_res
+    print("{:<10} {:>12} {:>12} {:>8}".format("op", "generic us", "generated us",
+        "speedup"))
+    for op in before:
+        print("{:<10} {:>12.2f} {:>12.2f} {:>7.2f}x".format(op,
+            1e6 * before[op] / n, 1e6 * after[op] / n, before[op] / after[op]))
+
+
+if __name__ == '__main__':
+    main()
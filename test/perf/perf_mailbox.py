@@ -0,0 +1,119 @@
+"""
+Benchmark for UVMMailbox producer/consumer throughput.
+
+Runs several producers and consumers through a bounded mailbox with put/get,
+and with put_many/get_many, and counts how many times the processes were
+resumed. The earlier mailbox, which woke every waiter through one Event per
+direction, is reproduced below as LegacyMailbox for comparison.
+
+The processes are run by a minimal scheduler which resumes a coroutine when
+the Event trigger it awaits fires, so no simulator is needed.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_mailbox.py [num_items]
+"""
+
+import sys
+import time
+from collections import deque
+
+from cocotb.triggers import Event
+
+from uvm.base.uvm_mailbox import UVMMailbox
+
+
+class LegacyMailbox(UVMMailbox):
+    """ UVMMailbox as it was, with one Event per direction """
+
+    def __init__(self, size=0, name='mailbox'):
+        UVMMailbox.__init__(self, size, name)
+        self.m_read_event = Event('mailbox_read_event')
+        self.m_write_event = Event('mailbox_write_event')
+
+    async def put(self, item):
+        while not self.can_put():
+            self.m_read_event.clear()
+            await self.m_read_event.wait()
+            self.m_read_event.clear()
+        self.m_queue.push_back(item)
+        self.m_write_event.set()
+
+    async def get(self, itemq=None):
+        while not self.can_get():
+            self.m_write_event.clear()
+            await self.m_write_event.wait()
+            self.m_write_event.clear()
+        item = self.m_queue.pop_front()
+        self.m_read_event.set()
+        return item
+
+    async def put_many(self, items):
+        for item in items:
+            await self.put(item)
+
+    async def get_many(self, num, itemq=None):
+        return [await self.get() for _ in range(num)]
+
+
+def run_procs(procs):
+    ready = deque(procs)
+    resumes = 0
+    while ready:
+        proc = ready.popleft()
+        resumes += 1
+        try:
+            trigger = proc.send(None)
+        except StopIteration:
+            continue
+        trigger.prime(lambda trig, proc=proc: ready.append(proc))
+    return resumes
+
+
+def run(mbox, n, nprod, ncons, batch):
+    per_prod = n // nprod
+    per_cons = n // ncons
+    got = []
+
+    async def producer(base):
+        if batch:
+            for i in range(0, per_prod, batch):
+                await mbox.put_many(range(base + i, base + i + batch))
+        else:
+            for i in range(per_prod):
+                await mbox.put(base + i)
+
+    async def consumer():
+        if batch:
+            for i in range(0, per_cons, batch):
+                got.extend(await mbox.get_many(batch))
+        else:
+            for i in range(per_cons):
+                got.append(await mbox.get())
+
+    procs = [consumer() for _ in range(ncons)]
+    procs += [producer(p * per_prod) for p in range(nprod)]
+    start = time.perf_counter()
+    resumes = run_procs(procs)
+    elapsed = time.perf_counter() - start
+    assert sorted(got) == list(range(n))
+    return elapsed, resumes
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20480
+    n -= n % 256
+    print("{:<28} {:>14} {:>14} {:>14} {:>14}".format("", "legacy items/s",
+        "legacy resumes", "items/s", "resumes"))
+    for nprod, ncons, size, batch in [(1, 1, 1, 0), (4, 4, 8, 0),
+            (1, 16, 8, 0), (16, 1, 1, 0), (16, 16, 8, 0), (16, 16, 8, 16)]:
+        name = "{}p x {}c, size {}{}".format(nprod, ncons, size,
+            ", batch " + str(batch) if batch else "")
+        legacy, legacy_resumes = run(LegacyMailbox(size), n, nprod, ncons, batch)
+        elapsed, resumes = run(UVMMailbox(size), n, nprod, ncons, batch)
+        print("{:<28} {:>14.0f} {:>14} {:>14.0f} {:>14}".format(name,
+            n / legacy, legacy_resumes, n / elapsed, resumes))
+
+
+if __name__ == '__main__':
+    main()
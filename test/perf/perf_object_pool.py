@@ -0,0 +1,69 @@
+"""
+Benchmark for pooling of sequence items.
+
+Creates sequence items through the factory at a high rate and releases each
+of them after use, as a sequence with fire-and-forget items would, with
+pooling off, on, and on with the use-after-release checks. Reports the
+throughput and the number of garbage collections run.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_object_pool.py [num_items]
+"""
+
+import gc
+import sys
+import time
+
+from uvm.base.uvm_factory import UVMFactory
+from uvm.seq.uvm_sequence_item import UVMSequenceItem
+from uvm.macros import uvm_object_utils
+
+
+class BenchItem(UVMSequenceItem):
+
+    def __init__(self, name="BenchItem"):
+        super().__init__(name)
+        self.addr = 0
+        self.data = 0
+
+    def do_reinit(self):
+        self.addr = 0
+        self.data = 0
+
+
+uvm_object_utils(BenchItem)
+
+
+def run(n):
+    factory = UVMFactory.get()
+    item_type = BenchItem.get_type()
+    in_flight = []
+    collections = sum(stat["collections"] for stat in gc.get_stats())
+    start = time.perf_counter()
+    for i in range(n):
+        item = factory.create_object_by_type(item_type, "seq", "item")
+        item.addr = i
+        in_flight.append(item)
+        if len(in_flight) == 8:
+            for item in in_flight:
+                item.release()
+            in_flight = []
+    elapsed = time.perf_counter() - start
+    collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+    return elapsed, collections
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for name, size, debug in [("pooling off", 0, False),
+            ("pooling on", 64, False), ("pooling on, debug", 64, True)]:
+        BenchItem.type_id.set_pool_size(size, debug)
+        elapsed, collections = run(n)
+        print("{:<20} {:>8.3f} s {:>10.0f} items/s {:>6} GCs".format(name,
+            elapsed, n / elapsed, collections))
+    BenchItem.type_id.set_pool_size(0)
+
+
+if __name__ == '__main__':
+    main()
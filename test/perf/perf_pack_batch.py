@@ -0,0 +1,86 @@
+"""
+Benchmark for packing items into a byte buffer for a bus driver.
+
+Packs a list of items with pack_bytes into a list and converts it to bytes,
+as drivers did before, and compares that with pack_into a preallocated
+buffer and with pack_batch. Unpacking is timed from a list of bytes and from
+memoryview slices of the packed buffer. Items have a 1 KB payload so that
+copying the bytes shows up in the timing.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_pack_batch.py [num_items]
+"""
+
+import sys
+import time
+
+from uvm.base.uvm_object import UVMObject
+from uvm.base.uvm_packer import UVMPacker
+
+PAYLOAD_BYTES = 1024
+
+
+class BusItem(UVMObject):
+
+    def __init__(self, name="BusItem", addr=0):
+        super().__init__(name)
+        self.addr = addr
+        self.payload = [addr & 0xFF] * PAYLOAD_BYTES
+
+    def do_pack(self, packer):
+        packer.pack_field_int(self.addr, 32)
+        packer.pack_bytes(self.payload)
+
+    def do_unpack(self, packer):
+        self.addr = packer.unpack_field_int(32)
+        packer.unpack_bytes(self.payload)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    packer = UVMPacker()
+    packer.big_endian = 0
+    items = [BusItem("item" + str(i), i) for i in range(n)]
+    stride = 4 + PAYLOAD_BYTES
+    times = {}
+
+    start = time.perf_counter()
+    frames = []
+    for item in items:
+        stream = []
+        item.pack_bytes(stream, packer)
+        frames.append(bytes(stream))
+    times["pack_bytes + bytes()"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    buf = bytearray(n * stride)
+    view = memoryview(buf)
+    for i, item in enumerate(items):
+        item.pack_into(view, i * stride, packer)
+    times["pack_into"] = time.perf_counter() - start
+    assert b''.join(frames) == buf
+
+    start = time.perf_counter()
+    batch, _ = UVMObject.pack_batch(items, packer=packer)
+    times["pack_batch"] = time.perf_counter() - start
+    assert batch == buf
+
+    copies = [BusItem("copy" + str(i)) for i in range(n)]
+    start = time.perf_counter()
+    for frame, copy in zip(frames, copies):
+        copy.unpack_bytes(list(frame), packer)
+    times["unpack_bytes(list)"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    UVMObject.unpack_batch(copies, buf, stride, packer)
+    times["unpack_batch"] = time.perf_counter() - start
+    assert [c.addr for c in copies] == [i.addr for i in items]
+
+    for name, elapsed in times.items():
+        print("{:<24} {:>8.3f} s {:>10.0f} items/s".format(name, elapsed,
+            n / elapsed))
+
+
+if __name__ == '__main__':
+    main()
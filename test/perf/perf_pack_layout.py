@@ -0,0 +1,107 @@
+"""
+Benchmark for fixed-layout packing with UVMPackLayout.
+
+Packs and unpacks a bus transaction with 8 fields through pack_bytes and
+unpack_bytes, once with do_pack/do_unpack calling pack_field_int and
+unpack_field_int for each field, and once with the layout installed by
+uvm_pack_layout. Also times the packer-free layout codec, for single items
+(to_bytes/from_bytes) and for arrays (pack_array/unpack_array).
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_pack_layout.py [num_items]
+"""
+
+import sys
+import time
+
+from uvm.base.uvm_object import UVMObject
+from uvm.base.uvm_packer import UVMPacker
+from uvm.macros.uvm_object_defines import uvm_pack_layout
+
+FIELDS = [("addr", 32), ("data", 32), ("strb", 4), ("prot", 3), ("burst", 2),
+    ("len", 8), ("id", 6), ("last", 1)]
+
+
+class FieldItem(UVMObject):
+
+    def __init__(self, name="FieldItem", i=0):
+        super().__init__(name)
+        for fname, width in FIELDS:
+            setattr(self, fname, i & ((1 << width) - 1))
+
+    def do_pack(self, packer):
+        for fname, width in FIELDS:
+            packer.pack_field_int(getattr(self, fname), width)
+
+    def do_unpack(self, packer):
+        for fname, width in FIELDS:
+            setattr(self, fname, packer.unpack_field_int(width))
+
+
+class LayoutItem(UVMObject):
+
+    def __init__(self, name="LayoutItem", i=0):
+        super().__init__(name)
+        for fname, width in FIELDS:
+            setattr(self, fname, i & ((1 << width) - 1))
+
+
+layout = uvm_pack_layout(LayoutItem, FIELDS)
+
+
+def run_packer(cls, n, be):
+    packer = UVMPacker()
+    packer.big_endian = be
+    items = [cls("item" + str(i), i) for i in range(n)]
+    start = time.perf_counter()
+    frames = []
+    for item in items:
+        frame = []
+        item.pack_bytes(frame, packer)
+        frames.append(frame)
+    packed = time.perf_counter() - start
+    start = time.perf_counter()
+    for item, frame in zip(items, frames):
+        item.unpack_bytes(frame, packer)
+    return packed, time.perf_counter() - start, frames
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print("{:<32} {:>12} {:>12}".format("", "pack us", "unpack us"))
+    for be in [0, 1]:
+        endian = " (big)" if be else " (little)"
+        pack_t, unpack_t, ref = run_packer(FieldItem, n, be)
+        print("{:<32} {:>12.2f} {:>12.2f}".format("pack_field_int" + endian,
+            1e6 * pack_t / n, 1e6 * unpack_t / n))
+        pack_t, unpack_t, frames = run_packer(LayoutItem, n, be)
+        assert frames == ref
+        print("{:<32} {:>12.2f} {:>12.2f}".format("uvm_pack_layout" + endian,
+            1e6 * pack_t / n, 1e6 * unpack_t / n))
+
+        items = [LayoutItem("item" + str(i), i) for i in range(n)]
+        start = time.perf_counter()
+        data = [layout.to_bytes(item, be) for item in items]
+        pack_t = time.perf_counter() - start
+        start = time.perf_counter()
+        for item, d in zip(items, data):
+            layout.from_bytes(item, d, be)
+        unpack_t = time.perf_counter() - start
+        assert [list(d) for d in data] == ref
+        print("{:<32} {:>12.2f} {:>12.2f}".format("to_bytes/from_bytes" + endian,
+            1e6 * pack_t / n, 1e6 * unpack_t / n))
+
+        start = time.perf_counter()
+        buf = layout.pack_array(items, be)
+        pack_t = time.perf_counter() - start
+        start = time.perf_counter()
+        layout.unpack_array(items, buf, be)
+        unpack_t = time.perf_counter() - start
+        assert buf == b''.join(data)
+        print("{:<32} {:>12.2f} {:>12.2f}".format("pack_array/unpack_array" + endian,
+            1e6 * pack_t / n, 1e6 * unpack_t / n))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark for packing and unpacking with UVMPacker.
+
+Packs 32-bit fields into objects of 1 KB up to 1 MB and unpacks them again,
+in both endiannesses. The earlier packer kept the stream in a single int
+(OR-ing each field in at its offset and reversing bits one at a time), which
+is quadratic in the packed size; it is reproduced below as LegacyPacker and
+timed for the smaller sizes.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_packer.py [max_kbytes]
+"""
+
+import sys
+import time
+
+from uvm.base.sv import sv
+from uvm.base.uvm_packer import UVMPacker
+
+
+class LegacyPacker:
+
+    def __init__(self, big_endian):
+        self.big_endian = big_endian
+        self.m_bits = 0
+        self.count = 0
+
+    def flip_bit_order(self, value, size):
+        flipped = 0
+        num_bits = len(bin(value)) - 2
+        while value:
+            flipped = (flipped << 1) + (value & 0x1)
+            value = value >> 1
+        return flipped << (size - num_bits)
+
+    def pack_field_int(self, value, size):
+        if self.big_endian:
+            value = self.flip_bit_order(value, size)
+        self.m_bits |= value << self.count
+        self.count += size
+
+    def set_packed_size(self):
+        self.count = 0
+
+    def unpack_field_int(self, size):
+        value = 0
+        count_before = self.count
+        self.count += size
+        for i in range(size):
+            if self.big_endian:
+                value |= self.m_bits & (1 << (self.count - i - 1))
+            else:
+                value |= self.m_bits & (1 << (self.count - size + i))
+        value >>= count_before
+        if self.big_endian:
+            value = self.flip_bit_order(value, size)
+        return value
+
+
+def run(packer, words):
+    start = time.perf_counter()
+    for w in words:
+        packer.pack_field_int(w, 32)
+    packer.set_packed_size()
+    packed = time.perf_counter() - start
+    start = time.perf_counter()
+    unpacked = [packer.unpack_field_int(32) for _ in words]
+    assert unpacked == words
+    return packed, time.perf_counter() - start
+
+
+def main():
+    max_kbytes = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    print("{:<8} {:<7} {:>14} {:>14} {:>14} {:>14}".format("size", "endian",
+        "legacy pack s", "legacy unpack", "pack s", "unpack s"))
+    kbytes = 1
+    while kbytes <= max_kbytes:
+        words = [sv.urandom() for _ in range(kbytes * 256)]
+        for be in [0, 1]:
+            legacy = ["{:>14}".format("-"), "{:>14}".format("-")]
+            if kbytes <= 16:
+                legacy = ["{:>14.4f}".format(t) for t in
+                    run(LegacyPacker(be), words)]
+            packer = UVMPacker()
+            packer.big_endian = be
+            packed, unpacked = run(packer, words)
+            print("{:<8} {:<7} {} {} {:>14.4f} {:>14.4f}".format(
+                str(kbytes) + "KB", "big" if be else "little", legacy[0],
+                legacy[1], packed, unpacked))
+        kbytes *= 4
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Microbenchmark for the reporting macros (uvm_info etc.).
+
+Compares the current call-site lookup of uvm_info against the previous
+inspect.stack() based implementation, and with file/line capture disabled.
+Messages are sent to a no-op logger, so mostly the reporting overhead is
+measured.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_report_macros.py [num_msgs]
+"""
+
+import sys
+import time
+import inspect
+from inspect import getframeinfo, stack
+
+from uvm.base.uvm_report_object import UVMReportObject
+from uvm.base.uvm_report_server import UVMReportServer
+from uvm.base.uvm_globals import uvm_report_enabled, uvm_report_disable_file_line
+from uvm.base.uvm_object_globals import UVM_INFO, UVM_LOW
+from uvm.macros.uvm_message_defines import uvm_info
+
+
+def legacy_uvm_info(ID, MSG, VERBOSITY):
+    """ uvm_info as it was implemented before the call-site cache """
+    if uvm_report_enabled(VERBOSITY, UVM_INFO, ID):
+        caller = getframeinfo(stack()[1][0])
+        fname = caller.filename
+        lineno = caller.lineno
+        f_locals = inspect.currentframe().f_back.f_locals
+        if 'self' in f_locals:
+            f_locals['self'].uvm_report_info(ID, MSG, VERBOSITY, fname, lineno, "", 1)
+
+
+class Monitor(UVMReportObject):
+
+    def run_legacy(self, n):
+        for i in range(n):
+            legacy_uvm_info("MON", "Observed transaction", UVM_LOW)
+
+    def run_macro(self, n):
+        for i in range(n):
+            uvm_info("MON", "Observed transaction", UVM_LOW)
+
+
+def measure(name, func, n):
+    start = time.perf_counter()
+    func(n)
+    elapsed = time.perf_counter() - start
+    print("{:<32} {:>12.0f} msgs/s".format(name, n / elapsed))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    UVMReportServer.get_server().set_logger(lambda msg: None)
+    mon = Monitor("mon")
+    measure("inspect.stack() (before)", mon.run_legacy, n)
+    measure("uvm_info (after)", mon.run_macro, n)
+    uvm_report_disable_file_line()
+    measure("uvm_info, file/line disabled", mon.run_macro, n)
+    uvm_report_disable_file_line(False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark for the resource audit trail.
+
+Times UVMResource.read/write from a set of accessors (components and
+sequence items, whose full name is built on each call) with auditing off,
+in the full mode (an Access_t record per accessor name) and in the compact
+mode (counters per interned accessor id), with and without read sampling.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_resource_audit.py [num_reads]
+"""
+
+import sys
+import time
+
+from uvm.base.uvm_component import UVMComponent
+from uvm.base.uvm_resource import UVMResource, UVMResourceOptions
+from uvm.seq.uvm_sequence_item import UVMSequenceItem
+
+
+def run(rsrcs, accessors, n):
+    num_acc = len(accessors)
+    num_rsrc = len(rsrcs)
+    start = time.perf_counter()
+    for i in range(n):
+        rsrc = rsrcs[i % num_rsrc]
+        if i & 0xff == 0:
+            rsrc.write(i, accessors[i % num_acc])
+        rsrc.read(accessors[i % num_acc])
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    top = UVMComponent("top", None)
+    accessors = []
+    for i in range(20):
+        env = UVMComponent("env" + str(i), top)
+        for j in range(50):
+            comp = UVMComponent("comp" + str(j), env)
+            item = UVMSequenceItem("item" + str(j))
+            item.set_sequencer(comp)
+            accessors.extend([comp, item])
+
+    modes = [
+        ("auditing off", UVMResourceOptions.turn_off_auditing),
+        ("full audit", UVMResourceOptions.turn_on_auditing),
+        ("compact audit", UVMResourceOptions.turn_on_compact_auditing),
+        ("compact audit, sample=16",
+            lambda: UVMResourceOptions.turn_on_compact_auditing(sample=16)),
+    ]
+    base = None
+    for name, turn_on in modes:
+        UVMResourceOptions.turn_off_compact_auditing()
+        turn_on()
+        rsrcs = [UVMResource("knob" + str(i), "*") for i in range(100)]
+        elapsed = run(rsrcs, accessors, n)
+        if base is None:
+            base = elapsed
+        print("{:<28} {:>8.3f} s {:>+8.0f} ns/read".format(name, elapsed,
+            1e9 * (elapsed - base) / n))
+    UVMResourceOptions.turn_off_compact_auditing()
+
+
+if __name__ == '__main__':
+    main()
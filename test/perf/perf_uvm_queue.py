@@ -0,0 +1,67 @@
+"""
+Benchmark for UVMQueue front and back operations.
+
+Keeps a queue at a fixed depth from 10 to 100k items and times FIFO traffic
+through it (push_back + pop_front), as in sequencer arbitration queues,
+mailboxes and response queues, plus push_front + pop_back. The queue backed
+by a list is reproduced below as ListQueue for comparison.
+
+Run with (from the repository root)::
+
+    PYTHONPATH=src python test/perf/perf_uvm_queue.py [num_ops]
+"""
+
+import sys
+import time
+
+from uvm.base.uvm_queue import UVMQueue
+
+
+class ListQueue(UVMQueue):
+    """ UVMQueue as it was, storing the items in a list """
+
+    def __init__(self, name=""):
+        UVMQueue.__init__(self, name)
+        self.queue = list()
+
+    def pop_front(self):
+        val = self.queue[0]
+        del self.queue[0]
+        return val
+
+    def pop_back(self):
+        return self.queue.pop()
+
+    def push_front(self, item):
+        self.queue.insert(0, item)
+
+
+def run(q, depth, n):
+    for i in range(depth):
+        q.push_back(i)
+    start = time.perf_counter()
+    for i in range(n):
+        q.push_back(i)
+        q.pop_front()
+    fifo = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(n):
+        q.push_front(i)
+        q.pop_back()
+    return fifo, time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print("{:>8} {:>16} {:>16} {:>16} {:>16}".format("depth", "list fifo ns",
+        "deque fifo ns", "list lifo ns", "deque lifo ns"))
+    for depth in [10, 100, 1000, 10000, 100000]:
+        list_fifo, list_lifo = run(ListQueue("list"), depth, n)
+        fifo, lifo = run(UVMQueue("deque"), depth, n)
+        print("{:>8} {:>16.0f} {:>16.0f} {:>16.0f} {:>16.0f}".format(depth,
+            1e9 * list_fifo / n, 1e9 * fifo / n, 1e9 * list_lifo / n,
+            1e9 * lifo / n))
+
+
+if __name__ == '__main__':
+    main()
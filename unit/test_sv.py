@@ -1,6 +1,9 @@
 
 import unittest
-from uvm.base.sv import (sv, sv_obj, uvm_glob_to_re)
+import re
+
+from uvm.base.sv import (sv, sv_obj, uvm_glob_to_re, sv_compile_format,
+    uvm_re_match, uvm_glob_matcher, uvm_glob_literal, RET_OK, RET_ERR)
 
 
 class Packet(sv_obj):
@@ -75,6 +78,28 @@ class TestSV(unittest.TestCase):
         res4 = uvm_glob_to_re(str4)
         self.assertEqual(res4, '__top__\\.master\\[0\\]\\.slave.*')
 
+    def test_glob_matcher(self):
+        globs = ["", "*", "**", "top", "top.env", "top.env*", "top.env.*",
+            "*agent", "*.agent*", "top.*.agent", "top.env?", "m[0]*",
+            "/top/", "/", "top.(env|cfg)", "^top", "env$", "a+b"]
+        strs = ["", "top", "top.env", "top.env.agent", "xtop.env",
+            "top.env1.agent", "uvm_test_top.env", "m[0].x", "top.cfg",
+            "a/top/b", "aab", "env"]
+        for glob in globs:
+            rex = uvm_glob_to_re(glob)
+            for _str in strs:
+                exp = re.search(rex, _str) is not None
+                self.assertEqual(uvm_glob_matcher(glob)(_str), exp, (glob, _str))
+                self.assertEqual(uvm_re_match(rex, _str) == RET_OK, exp,
+                    (rex, _str))
+        self.assertEqual(uvm_glob_literal("top.env.*"), "top.env.")
+        self.assertEqual(uvm_glob_literal("*"), "")
+        self.assertIsNone(uvm_glob_literal("top.*.agent"))
+        self.assertIsNone(uvm_glob_literal("/top/"))
+        self.assertIs(uvm_glob_matcher("top.*"), uvm_glob_matcher("top.*"))
+        self.assertEqual(uvm_re_match("a.c", "abc"), RET_OK)
+        self.assertEqual(uvm_re_match("a.c", "ac"), RET_ERR)
+
     def test_cast(self):
         my_int = 6
         arr = []
@@ -97,6 +122,29 @@ class TestSV(unittest.TestCase):
         for pair in test_str:
             str1 = sv.sformatf(pair[0], pair[1])
 
+    def test_sformatf_compiled(self):
+        def legacy_sformatf(msg, *args):
+            for s in sv.formats:
+                if s == "%h" or s == "%0h":
+                    msg = msg.replace(s, "{:X}")
+                else:
+                    msg = msg.replace(s, "{}")
+            return msg.format(*args)
+
+        test_fmts = [
+            ["Number: %0d, String: %s", 555, "xxx"],
+            ["Hex: %h, %0h", 255, 4096],
+            ["Time %t/%0t: %p", 10, 20, [1, 2]],
+            ["%0b %b %x %f %0s", 5, 6, 7, 1.5, "s"],
+            ["Literal %%d and %5h", 1],
+        ]
+        for fmt in test_fmts:
+            for _ in range(2):  # 2nd round is served from cache
+                self.assertEqual(sv.sformatf(*fmt), legacy_sformatf(*fmt))
+        self.assertEqual(sv.sformatf("%h", 0xabc), "ABC")
+        self.assertIs(sv_compile_format("Hex: %h, %0h"),
+            sv_compile_format("Hex: %h, %0h"))
+
 
 
     def test_clog2(self):
@@ -34,6 +34,69 @@ class TestUVMAnalysisPort(unittest.TestCase):
         self.assertEqual(targetComp.written, True)
         self.assertEqual(targetComp.t, 12345)
 
+    def test_write_many(self):
+        from uvm.base.uvm_component import UVMComponent
+        from uvm.comps.uvm_subscriber import UVMSubscriber
+        from uvm.macros.uvm_tlm_defines import uvm_analysis_imp_decl
+        from uvm.tlm1.uvm_tlm_fifos import UVMTLMAnalysisFIFO
+        UVMAnalysisImpSfx = uvm_analysis_imp_decl("_sfx")
+
+        class BatchSub(UVMSubscriber):
+            def __init__(self, name, parent):
+                super().__init__(name, parent)
+                self.batches = []
+                self.items = []
+
+            def write(self, t):
+                self.items.append(t)
+
+            def write_batch(self, ts):
+                self.batches.append(list(ts))
+
+        class PlainSub(UVMSubscriber):
+            def __init__(self, name, parent):
+                super().__init__(name, parent)
+                self.items = []
+
+            def write(self, t):
+                self.items.append(t)
+
+        class SfxComp(UVMComponent):
+            def __init__(self, name, parent):
+                super().__init__(name, parent)
+                self.imp = UVMAnalysisImpSfx("imp", self)
+                self.items = []
+
+            def write_sfx(self, t):
+                self.items.append(t)
+
+        top = UVMComponent("wm_top", None)
+        port = UVMAnalysisPort("wm_port", top)
+        batch_sub = BatchSub("batch_sub", top)
+        plain_sub = PlainSub("plain_sub", top)
+        sfx_comp = SfxComp("sfx_comp", top)
+        fifo = UVMTLMAnalysisFIFO("wm_fifo", top)
+        for imp in [batch_sub.analysis_export, plain_sub.analysis_export,
+                sfx_comp.imp, fifo.analysis_export]:
+            port.connect(imp)
+        # Nothing is delivered before the bindings are resolved
+        port.write(0)
+        self.assertEqual(plain_sub.items, [])
+        port.resolve_bindings()
+        self.assertEqual(len(port.m_write_fns), 4)
+
+        port.write(1)
+        port.write_many([2, 3, 4])
+        self.assertEqual(batch_sub.items, [1])
+        self.assertEqual(batch_sub.batches, [[2, 3, 4]])
+        self.assertEqual(plain_sub.items, [1, 2, 3, 4])
+        self.assertEqual(sfx_comp.items, [1, 2, 3, 4])
+        self.assertEqual(fifo.used(), 4)
+        got = []
+        while fifo.try_get(got):
+            pass
+        self.assertEqual(got, [1, 2, 3, 4])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,10 @@
 
+import json
+import os
+import tempfile
 import unittest
 from uvm.base.uvm_config_db import UVMConfigDb, UVMConfigDbOptions
+from uvm.base.uvm_resource import UVMResourcePool, PRI_HIGH, PRI_LOW
 from uvm.base.uvm_debug import UVMDebug
 
 str1 = "uvm_test_top.ubus_example_tb0.ubus0.masters[0].monitor"
@@ -51,6 +55,123 @@ class TestUVMConfigDb(unittest.TestCase):
         self.assertEqual(arr[0], 666)
 
 
+    def test_get_cache(self):
+        UVMConfigDbOptions.tracing = False
+        UVMConfigDbOptions.turn_on_caching()
+        try:
+            UVMConfigDb.set(None, "top.drv", "knob", 1)
+            arr = []
+            self.assertTrue(UVMConfigDb.get(None, "top.drv", "knob", arr))
+            self.assertIn((None, "top.drv", "knob", None), UVMConfigDb.m_get_cache)
+            self.assertTrue(UVMConfigDb.get(None, "top.drv", "knob", arr))
+            self.assertFalse(UVMConfigDb.get(None, "top.drv", "no_knob", arr))
+            self.assertFalse(UVMConfigDb.get(None, "top.drv", "no_knob", arr))
+            self.assertEqual(arr, [1, 1])
+
+            # Setting the same field invalidates the cached result
+            UVMConfigDb.set(None, "top.*", "knob", 2)
+            arr = []
+            UVMConfigDb.get(None, "top.drv", "knob", arr)
+            self.assertEqual(arr, [2])
+            UVMConfigDb.set(None, "top.drv", "knob", 3)
+            UVMConfigDb.get(None, "top.drv", "knob", arr)
+            self.assertEqual(arr, [2, 3])
+
+            # So does writing the resource directly
+            rsrc = UVMConfigDb.m_get_cache[(None, "top.drv", "knob", None)][1]
+            rsrc.write(4)
+            UVMConfigDb.get(None, "top.drv", "knob", arr)
+            self.assertEqual(arr, [2, 3, 4])
+
+            UVMConfigDb.set(None, "top.drv", "no_knob", 5)
+            self.assertTrue(UVMConfigDb.get(None, "top.drv", "no_knob", arr))
+            self.assertEqual(arr[-1], 5)
+        finally:
+            UVMConfigDbOptions.turn_off_caching()
+        self.assertEqual(UVMConfigDb.m_get_cache, {})
+
+    def test_waiters(self):
+        UVMConfigDbOptions.tracing = False
+        w1 = UVMConfigDb.m_add_waiter(None, "top.env.drv", "speed")
+        w2 = UVMConfigDb.m_add_waiter(None, "top.env.mon", "speed")
+        w3 = UVMConfigDb.m_add_waiter(None, "top.env.drv", "mode")
+        UVMConfigDb.set(None, "top.env.d*", "speed", 1)
+        self.assertTrue(w1.trigger.is_set())
+        self.assertFalse(w2.trigger.is_set())
+        self.assertFalse(w3.trigger.is_set())
+        self.assertEqual(UVMConfigDb.m_waiters["speed"], [w2])
+
+        # In a batch, waiters are woken in end_batch
+        UVMConfigDb.begin_batch()
+        UVMConfigDb.set(None, "top.*", "speed", 2)
+        UVMConfigDb.set(None, "top.env.*", "mode", 3)
+        self.assertFalse(w2.trigger.is_set())
+        UVMConfigDb.end_batch()
+        self.assertTrue(w2.trigger.is_set())
+        self.assertTrue(w3.trigger.is_set())
+        self.assertNotIn("speed", UVMConfigDb.m_waiters)
+        self.assertNotIn("mode", UVMConfigDb.m_waiters)
+
+    def test_set_many(self):
+        UVMConfigDbOptions.tracing = False
+        settings = [("top.*", "x", 1), ("top.env", "y", "s"), ("top.*", "x", 2),
+            ("", "z", 3), ("top.env.*", "x", 4), ("top.*", "x", 5)]
+        for inst_name, field_name, value in settings:
+            UVMConfigDb.set(None, inst_name, "set_" + field_name, value)
+        num = UVMConfigDb.set_many(None, [(i, "many_" + f, v) for i, f, v in
+            settings])
+        self.assertEqual(num, len(settings))
+
+        rp = UVMResourcePool.get()
+        for field_name in ["x", "y", "z"]:
+            exp = [(r.get_scope(), r.read(), r.precedence) for r in
+                rp.rtab["set_" + field_name]]
+            got = [(r.get_scope(), r.read(), r.precedence) for r in
+                rp.rtab["many_" + field_name]]
+            self.assertEqual(got, exp)
+
+    def test_load_settings(self):
+        UVMConfigDbOptions.tracing = False
+        num = UVMConfigDb.load_settings(None, {"top.ld.*": {"ld_a": 1,
+            "ld_b": "str"}})
+        self.assertEqual(num, 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "cfg.json")
+            with open(fname, "w") as f:
+                json.dump([{"inst_name": "top.ld.x", "field_name": "ld_a",
+                    "value": 2}], f)
+            self.assertEqual(UVMConfigDb.load_settings(None, fname), 1)
+        arr = []
+        UVMConfigDb.get(None, "top.ld.x", "ld_a", arr)
+        UVMConfigDb.get(None, "top.ld.y", "ld_a", arr)
+        UVMConfigDb.get(None, "top.ld.y", "ld_b", arr)
+        self.assertEqual(arr, [2, 1, "str"])
+        with self.assertRaises(ValueError):
+            UVMConfigDb.load_settings(None, {"top": 1})
+
+    def test_set_priority(self):
+        def get(inst_name):
+            got_val = []
+            self.assertTrue(UVMConfigDb.get(None, inst_name, "prio_field", got_val))
+            return got_val[0]
+        UVMConfigDb.set(None, "top.env", "prio_field", 1)
+        UVMConfigDb.set(None, "top.*", "prio_field", 2)
+        self.assertEqual(get("top.env"), 2)
+        # Repeated set moves the setting ahead of the wildcard one with the
+        # same precedence
+        UVMConfigDb.set(None, "top.env", "prio_field", 3)
+        self.assertEqual(get("top.env"), 3)
+
+        rp = UVMResourcePool.get()
+        wildcard = rp.rtab.get("prio_field")[1]
+        self.assertEqual(wildcard.read(), 2)
+        rp.set_priority_name(wildcard, PRI_HIGH)
+        self.assertIs(rp.rtab.get("prio_field")[0], wildcard)
+        self.assertEqual(get("top.env"), 2)
+        rp.set_priority_name(wildcard, PRI_LOW)
+        self.assertIs(rp.rtab.get("prio_field")[-1], wildcard)
+        self.assertEqual(get("top.env"), 3)
+
     def test_set_override(self):
         pass
         # self.assertEqual(0, 1)
@@ -91,6 +91,46 @@ class TestUVMDefaultFactory(unittest.TestCase):
         self.assertEqual(obj2.get_name(), 'is_xxx')
         self.assertEqual(obj2.get_type_name(), 'XXX')
 
+    def test_resolve_cache(self):
+        cs = UVMCoreService.get()
+        fact = UVMDefaultFactory()
+        cs.set_factory(fact)
+
+        XXX = createXXX()
+        YYY = createYYY()
+        LastOverride = createLastOverride()
+
+        obj = fact.create_object_by_type(XXX.get_type(), 'top', 'obj')
+        self.assertEqual(obj.get_type_name(), 'XXX')
+        self.assertIn((XXX.get_type(), 'top.obj'), fact.m_resolve_cache)
+
+        # Any new override invalidates the resolved wrappers
+        fact.set_type_override_by_type(XXX.get_type(), YYY.get_type())
+        self.assertEqual(fact.m_resolve_cache, {})
+        for i in range(3):
+            obj = fact.create_object_by_type(XXX.get_type(), 'top', 'obj')
+            self.assertEqual(obj.get_type_name(), 'YYY')
+            obj = fact.create_object_by_name('XXX', 'top', 'obj')
+            self.assertEqual(obj.get_type_name(), 'YYY')
+        self.assertEqual(fact.m_type_overrides[0].used, 6)
+
+        fact.set_inst_override_by_type(XXX.get_type(), LastOverride.get_type(),
+                'top.obj')
+        obj = fact.create_object_by_type(XXX.get_type(), 'top', 'obj')
+        self.assertEqual(obj.get_type_name(), 'LastOverride')
+        obj = fact.create_object_by_name('XXX', 'top', 'other')
+        self.assertEqual(obj.get_type_name(), 'YYY')
+        self.assertIsNone(fact.create_object_by_name('ZZZ', 'top', 'obj'))
+        fact.debug_create_by_type(XXX.get_type(), 'top', 'obj')
+        fact.debug_create_by_name('XXX', 'top', 'other')
+
+        # Uniquely named objects do not grow the cache without bound
+        fact.m_resolve_cache_size = 100
+        for i in range(1000):
+            obj = fact.create_object_by_type(XXX.get_type(), 'top', 'item_' + str(i))
+            self.assertEqual(obj.get_type_name(), 'YYY')
+            self.assertLessEqual(len(fact.m_resolve_cache), 100)
+
     def test_create_component_by_name(self):
         cs = UVMCoreService.get()
         factory = UVMFactory.get()
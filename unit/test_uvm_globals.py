@@ -1,9 +1,12 @@
 
+import sys
 import unittest
 
 from uvm.base.uvm_globals import (
     uvm_report_enabled,
-    uvm_is_match
+    uvm_is_match,
+    uvm_get_caller_file_line,
+    uvm_report_disable_file_line
 )
 
 from uvm.base.uvm_object_globals import (
@@ -28,6 +31,22 @@ class TestUVMGlobals(unittest.TestCase):
         self.assertFalse(uvm_is_match("my_name??????", "my_name.abc"))
         self.assertTrue(uvm_is_match("zzz*www??yy", "zzz_abcdefg_wwwKKyy"))
 
+    def test_uvm_get_caller_file_line(self):
+        def reporter():
+            return uvm_get_caller_file_line(1)
+        fname, line = reporter()
+        self.assertEqual(fname, __file__)
+        self.assertEqual(line, sys._getframe().f_lineno - 2)
+        # Same call site is served from the cache
+        for _ in range(2):
+            site = reporter()
+            self.assertEqual(site[0], __file__)
+        uvm_report_disable_file_line()
+        try:
+            self.assertEqual(reporter(), ("", 0))
+        finally:
+            uvm_report_disable_file_line(False)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,30 @@
 
 import unittest
+from collections import deque
 from uvm.base.uvm_mailbox import UVMMailbox
 
 
+def run_procs(procs):
+    """
+    Runs the coroutines until all of them are done or blocked, resuming them
+    when the trigger they await fires, without a simulator.
+
+    Returns:
+        int: Number of times a coroutine was resumed.
+    """
+    ready = deque(procs)
+    resumes = 0
+    while ready:
+        proc = ready.popleft()
+        resumes += 1
+        try:
+            trigger = proc.send(None)
+        except StopIteration:
+            continue
+        trigger.prime(lambda trig, proc=proc: ready.append(proc))
+    return resumes
+
+
 class TestUVMMailbox(unittest.TestCase):
 
     def test_try_put(self):
@@ -34,6 +56,84 @@ class TestUVMMailbox(unittest.TestCase):
             self.assertEqual(fifo.try_get(arr), True)
             self.assertEqual(arr[0], i)
 
+    def test_num(self):
+        fifo = UVMMailbox()
+        self.assertEqual(fifo.num(), 0)
+        for i in range(3):
+            fifo.try_put(i)
+        self.assertEqual(fifo.num(), 3)
+
+    def test_blocking_fifo_order(self):
+        fifo = UVMMailbox(2)
+        got = []
+
+        async def producer(base):
+            for i in range(20):
+                await fifo.put(base + i)
+
+        async def consumer():
+            for i in range(20):
+                got.append(await fifo.get())
+
+        run_procs([consumer(), consumer(), producer(0), producer(100)])
+        self.assertEqual(fifo.num(), 0)
+        self.assertEqual(sorted(got), list(range(20)) + list(range(100, 120)))
+        self.assertEqual([x for x in got if x < 100], list(range(20)))
+        self.assertEqual(len(fifo.m_get_waiters) + len(fifo.m_put_waiters), 0)
+
+    def test_wake_one_waiter(self):
+        fifo = UVMMailbox()
+        got = []
+
+        async def consumer():
+            got.append(await fifo.get())
+
+        async def producer():
+            for i in range(3):
+                await fifo.put(i)
+
+        procs = [consumer() for _ in range(10)]
+        # Each put resumes only the first blocked getter
+        self.assertEqual(run_procs(procs + [producer()]), 10 + 1 + 3)
+        self.assertEqual(got, [0, 1, 2])
+        self.assertEqual(len(fifo.m_get_waiters), 7)
+
+    def test_peek_does_not_take_wakeup(self):
+        fifo = UVMMailbox()
+        got = []
+
+        async def peeker():
+            got.append(("peek", await fifo.peek()))
+
+        async def getter():
+            got.append(("get", await fifo.get()))
+
+        async def putter():
+            await fifo.put(5)
+
+        run_procs([peeker(), getter(), peeker(), putter()])
+        self.assertEqual(sorted(got), [("get", 5), ("peek", 5), ("peek", 5)])
+        self.assertEqual(fifo.num(), 0)
+
+    def test_batch(self):
+        fifo = UVMMailbox(4)
+        got = []
+
+        async def producer():
+            await fifo.put_many(range(10))
+
+        async def consumer():
+            got.extend(await fifo.get_many(3))
+            await fifo.get_many(5, got)
+
+        run_procs([consumer(), producer()])
+        self.assertEqual(got, list(range(8)))
+        self.assertEqual(fifo.num(), 2)
+        itemq = []
+        self.assertEqual(fifo.try_get_many(itemq, 1), 1)
+        self.assertEqual(fifo.try_get_many(itemq), 1)
+        self.assertEqual(fifo.try_get_many(itemq), 0)
+        self.assertEqual(itemq, [8, 9])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,99 @@
+import sys
+import unittest
+
+from uvm.base.uvm_report_object import UVMReportObject
+from uvm.base.uvm_report_server import UVMReportServer
+from uvm.base.uvm_globals import uvm_report_disable_file_line
+from uvm.base.uvm_object_globals import UVM_LOW, UVM_DEBUG
+from uvm.macros.uvm_message_defines import uvm_info, uvm_warning, uvm_info_context
+
+
+class MsgObj(UVMReportObject):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.reported = []
+
+    def uvm_report_info(self, id, message, verbosity, filename="", line=0,
+            context_name="", report_enabled_checked=False):
+        self.reported.append((id, message, filename, line))
+        super().uvm_report_info(id, message, verbosity, filename, line,
+            context_name, report_enabled_checked)
+
+    def info_low(self):
+        uvm_info("MSG_ID", "low message", UVM_LOW)
+        return sys._getframe().f_lineno - 1
+
+    def info_debug(self):
+        uvm_info("MSG_ID", "debug message", UVM_DEBUG)
+
+
+class TestUVMMessageDefines(unittest.TestCase):
+
+    def setUp(self):
+        self.msgs = []
+        self.srv = UVMReportServer.get_server()
+        self.srv.set_logger(self.msgs.append)
+
+    def tearDown(self):
+        self.srv.set_logger(print)
+        uvm_report_disable_file_line(False)
+
+    def test_uvm_info_uses_caller_self(self):
+        obj = MsgObj("obj")
+        line = obj.info_low()
+        line2 = obj.info_low()
+        self.assertEqual(line, line2)
+        self.assertEqual(len(obj.reported), 2)
+        self.assertEqual(obj.reported[0], ("MSG_ID", "low message", __file__, line))
+        self.assertEqual(obj.reported[0], obj.reported[1])
+        self.assertEqual(len(self.msgs), 2)
+        self.assertIn(__file__ + "(" + str(line) + ")", self.msgs[0])
+        self.assertIn("[MSG_ID] low message", self.msgs[0])
+
+    def test_uvm_info_filtered(self):
+        obj = MsgObj("obj")
+        obj.info_debug()
+        self.assertEqual(obj.reported, [])
+        self.assertEqual(self.msgs, [])
+
+    def test_uvm_info_no_self(self):
+        uvm_warning("NO_SELF", "warning without self")
+        self.assertEqual(len(self.msgs), 1)
+        self.assertIn(__file__, self.msgs[0])
+
+    def test_uvm_info_context(self):
+        obj = MsgObj("obj")
+        uvm_info_context("CTX", "context message", UVM_LOW, obj)
+        self.assertEqual(obj.reported[0][2], __file__)
+
+    def test_lazy_format_args(self):
+        obj = MsgObj("obj")
+        uvm_info_context("FMT", "val: %0d, hex: %0h", UVM_LOW, obj, 10, 255)
+        self.assertEqual(obj.reported[0][1], "val: 10, hex: FF")
+        uvm_warning("FMT", "name: %s", "abc")
+        self.assertIn("[FMT] name: abc", self.msgs[-1])
+
+    def test_lazy_callable(self):
+        calls = []
+
+        def make_msg():
+            calls.append(1)
+            return "expensive message"
+        obj = MsgObj("obj")
+        uvm_info_context("LAZY", make_msg, UVM_DEBUG, obj)
+        self.assertEqual(calls, [])
+        uvm_info_context("LAZY", make_msg, UVM_LOW, obj)
+        self.assertEqual(calls, [1])
+        self.assertEqual(obj.reported[0][1], "expensive message")
+
+    def test_disable_file_line(self):
+        obj = MsgObj("obj")
+        uvm_report_disable_file_line()
+        obj.info_low()
+        self.assertEqual(obj.reported[0], ("MSG_ID", "low message", "", 0))
+        self.assertNotIn(__file__, self.msgs[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
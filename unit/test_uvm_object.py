@@ -84,6 +84,60 @@ class TestUVMObject(unittest.TestCase):
         sup_obj22.unpack(packed_obj)
         self.assertEqual(sup_obj22.my_obj.addr, 888)
 
+    def test_generated_field_automation(self):
+        class GenBase(UVMObject):
+            def __init__(self, name=""):
+                super().__init__(name)
+                self.addr = 0x10
+                self.kind = "read"
+                self.hidden = 3
+        uvm_object_utils_begin(GenBase)
+        uvm_field_int("addr")
+        uvm_field_string("kind")
+        uvm_field_int("hidden", UVM_ALL_ON | UVM_NOCOPY | UVM_NOCOMPARE |
+            UVM_NOPRINT | UVM_NOPACK)
+        uvm_object_utils_end(GenBase)
+
+        class GenItem(GenBase):
+            def __init__(self, name=""):
+                super().__init__(name)
+                self.data = 5
+                self.sub = TestObj("sub")
+                self.ref = None
+        uvm_object_utils_begin(GenItem)
+        uvm_field_int("data")
+        uvm_field_object("sub")
+        uvm_field_object("ref", UVM_ALL_ON | UVM_REFERENCE | UVM_NOPACK)
+        generic = GenItem._m_uvm_field_automation
+        uvm_object_utils_end(GenItem)
+        generated = GenItem._m_uvm_field_automation
+        self.assertIsNot(generic, generated)
+        self.assertEqual(GenBase._m_uvm_field_names, ["addr", "kind", "hidden"])
+
+        def run_ops():
+            UVMObject.m_inst_count = 0
+            a = GenItem("a")
+            a.addr, a.data, a.hidden, a.ref = 0x55, 0x1234, 7, TestObj("r")
+            a.sub.addr = 9
+            b = GenItem("b")
+            b.copy(a)
+            res = [(b.addr, b.kind, b.data, b.hidden, b.sub.addr, b.sub is a.sub),
+                b.compare(a), a.sprint()]
+            b.data = 1
+            b.kind = "write"
+            res.append(b.compare(a))
+            res.append(a.pack())
+            c = GenItem("c")
+            c.unpack(a.pack()[1])
+            res.append((c.addr, c.kind, c.data, c.hidden, c.sub.addr))
+            return res
+
+        with_generated = run_ops()
+        GenItem._m_uvm_field_automation = generic
+        self.assertEqual(run_ops(), with_generated)
+        self.assertEqual(with_generated[0], (0x55, "read", 0x1234, 3, 9, False))
+        self.assertEqual(with_generated[1:2] + with_generated[3:4], [True, False])
+
 
 class TestRecordIntegration(unittest.TestCase):
 
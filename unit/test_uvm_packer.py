@@ -1,11 +1,32 @@
 
+import importlib.util
 import unittest
 # import re
-from uvm.base.uvm_packer import (UVMPacker, MASK_INT)
+from uvm.base.uvm_packer import (UVMPacker, UVMPackLayout, MASK_INT)
+from uvm.macros.uvm_object_defines import uvm_pack_layout
 from uvm.base.uvm_object import UVMObject
 from uvm.base.sv import sv
 
 
+class BatchItem(UVMObject):
+
+    def __init__(self, name="BatchItem", addr=0, data=0, kind=0):
+        super().__init__(name)
+        self.addr = addr
+        self.data = data
+        self.kind = kind
+
+    def do_pack(self, packer):
+        packer.pack_field_int(self.addr, 32)
+        packer.pack_field_int(self.data, 16)
+        packer.pack_field_int(self.kind, 4)
+
+    def do_unpack(self, packer):
+        self.addr = packer.unpack_field_int(32)
+        self.data = packer.unpack_field_int(16)
+        self.kind = packer.unpack_field_int(4)
+
+
 class TestUVMPacker(unittest.TestCase):
 
     def test_flip_bit_order(self):
@@ -129,7 +150,210 @@ class TestUVMPacker(unittest.TestCase):
             self.assertEqual(hex(val3), hex(0xFACE))
             self.assertEqual(hex(val4), hex(0x77))
 
+    def test_large_objects(self):
+        # Packing and unpacking are linear in the packed size
+        for nbytes, be in [(1024, 0), (1024, 1), (64 * 1024, 0), (1 << 20, 1)]:
+            words = [sv.urandom() for _ in range(nbytes // 4)]
+            packer = UVMPacker()
+            packer.big_endian = be
+            for w in words:
+                packer.pack_field_int(w, 32)
+            packer.set_packed_size()
+            self.assertEqual(packer.get_packed_size(), 8 * nbytes)
+            order = 'big' if be else 'little'
+            expected = b''.join(w.to_bytes(4, order) for w in words)
+            self.assertEqual(bytes(packer.get_bytes()), expected)
+            self.assertEqual(packer.get_ints(), words)
+            unpacked = [packer.unpack_field_int(32) for _ in words]
+            self.assertEqual(unpacked, words)
+
+    def test_put_bytes_ints(self):
+        for be in [0, 1]:
+            packer = UVMPacker()
+            packer.big_endian = be
+            packer.pack_field_int(0x12345, 20)
+            packer.pack_string("abc")
+            packer.pack_field_int(0x3, 2)
+            packer.set_packed_size()
+            packed_bytes = packer.get_bytes()
+            packed_ints = packer.get_ints()
+
+            packer.put_bytes(packed_bytes)
+            self.assertEqual(packer.get_packed_size(), 8 * len(packed_bytes))
+            self.assertEqual(packer.get_bytes(), packed_bytes)
+            self.assertEqual(packer.unpack_field_int(20), 0x12345)
+            packer.put_ints(packed_ints)
+            self.assertEqual(packer.get_ints(), packed_ints)
+            self.assertEqual(packer.unpack_field_int(20), 0x12345)
+
+    def test_pack_into_buffer(self):
+        for be in [0, 1]:
+            packer = UVMPacker()
+            packer.big_endian = be
+            item = BatchItem("item", 0x12345678, 0xABCD, 0x9)
+            expected = []
+            item.pack_bytes(expected, packer)
+            self.assertEqual(len(expected), 7)
+
+            buf = bytearray(10)
+            self.assertEqual(item.pack_into(memoryview(buf), 2, packer), 52)
+            self.assertEqual(list(buf[2:9]), expected)
+            self.assertEqual(buf[:2] + buf[9:], bytes(3))
+            grown = bytearray()
+            item.pack_into(grown, 1, packer)
+            self.assertEqual(list(grown), [0] + expected)
+
+            copy = BatchItem("copy")
+            copy.unpack_bytes(memoryview(buf)[2:9], packer)
+            self.assertEqual((copy.addr, copy.data, copy.kind),
+                (0x12345678, 0xABCD, 0x9))
+
+            # Packing after unpacking from a caller's buffer leaves it intact
+            packer.put_bytes(bytes(expected))
+            packer.count = packer.get_packed_size()
+            packer.pack_field_int(0x5, 4)
+            packer.set_packed_size()
+            self.assertEqual(packer.get_packed_size(), 60)
+            self.assertEqual(list(buf[2:9]), expected)
+
+    def test_pack_batch(self):
+        for be in [0, 1]:
+            packer = UVMPacker()
+            packer.big_endian = be
+            items = [BatchItem("item" + str(i), sv.urandom(), i, i & 0xF)
+                for i in range(20)]
+            buf, stride = UVMObject.pack_batch(items, packer=packer)
+            self.assertEqual(stride, 7)
+            self.assertEqual(len(buf), 7 * 20)
+            expected = []
+            items[3].pack_bytes(expected, packer)
+            self.assertEqual(list(buf[3 * 7:4 * 7]), expected)
+
+            copies = [BatchItem("copy" + str(i)) for i in range(20)]
+            self.assertEqual(UVMObject.unpack_batch(copies, buf, stride, packer),
+                20 * 52)
+            for item, copy in zip(items, copies):
+                self.assertEqual((copy.addr, copy.data, copy.kind),
+                    (item.addr, item.data, item.kind))
+
+    def test_unpack_object_metadata(self):
+        packer = UVMPacker()
+        packer.use_metadata = 1
+        packer.pack_field_int(1, 4)  # Non-null object follows
+        packer.pack_field_int(0x12345678, 32)
+        packer.pack_field_int(0xABCD, 16)
+        packer.pack_field_int(0x9, 4)
+        packer.pack_field_int(0, 4)  # Null object
+        packer.set_packed_size()
+        item = BatchItem("item")
+        packer.unpack_object(item)
+        self.assertEqual((item.addr, item.data, item.kind), (0x12345678, 0xABCD, 0x9))
+        self.assertEqual(packer.count, 56)
+        item = BatchItem("item2")
+        packer.unpack_object(item)
+        self.assertEqual(item.addr, 0)
+        self.assertEqual(packer.count, 60)
+
+    def test_unpack_releases_buffer(self):
+        for be in [0, 1]:
+            packer = UVMPacker()
+            packer.big_endian = be
+            items = [BatchItem("item" + str(i), i, i, i) for i in range(4)]
+            copies = [BatchItem("copy" + str(i)) for i in range(4)]
+
+            buf = bytearray()
+            items[0].pack_into(buf, 0, packer)
+            copies[0].unpack_bytes(buf, packer)
+            # The buffer can be resized after unpacking from it
+            buf.extend(bytes(1))
+            items[1].pack_into(buf, 8, packer)
+            self.assertEqual(len(buf), 15)
+            copies[1].unpack_bytes(memoryview(buf)[8:], packer)
+            self.assertEqual(copies[1].data, 1)
+
+            buf, stride = UVMObject.pack_batch(items, packer=packer)
+            UVMObject.unpack_batch(copies, buf, stride, packer)
+            buf.extend(bytes(stride))
+            items[3].pack_into(buf, 5 * stride, packer)
+            self.assertEqual(len(buf), 6 * stride)
+            self.assertEqual([c.kind for c in copies], [0, 1, 2, 3])
 
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_pack_batch_numpy(self):
+        packer = UVMPacker()
+        items = [BatchItem("item" + str(i), i, i, i) for i in range(4)]
+        arr, stride = UVMObject.pack_batch(items, packer=packer, as_numpy=True)
+        self.assertEqual(arr.shape, (4, stride))
+        copies = [BatchItem("copy" + str(i)) for i in range(4)]
+        UVMObject.unpack_batch(copies, arr, stride, packer)
+        self.assertEqual([c.data for c in copies], [0, 1, 2, 3])
+
+    def test_pack_layout(self):
+        fields = [("addr", 32), ("data", 16), ("kind", 4), ("flag", 1), ("wide", 75)]
+        layout = UVMPackLayout(fields)
+        self.assertEqual(layout.get_packed_size(), 128)
+        self.assertEqual(layout.nbytes, 16)
+        for be in [0, 1]:
+            items = []
+            for i in range(10):
+                item = BatchItem("item" + str(i), sv.urandom(), i, i & 0xF)
+                item.flag = i & 1
+                item.wide = sv.urandom_range(0, (1 << 75) - 1)
+                items.append(item)
+                ref = UVMPacker()
+                ref.big_endian = be
+                for name, width in fields:
+                    ref.pack_field_int(getattr(item, name), width)
+                ref.set_packed_size()
+                packer = UVMPacker()
+                packer.big_endian = be
+                packer.pack_field_int(0x5, 3)
+                layout.pack(item, packer)
+                packer.set_packed_size()
+                self.assertEqual(packer.get_packed_size(), 131)
+                self.assertEqual(packer.unpack_field_int(3), 0x5)
+                copy = BatchItem("copy")
+                layout.unpack(copy, packer)
+                for name, _ in fields:
+                    self.assertEqual(getattr(copy, name), getattr(item, name))
+                self.assertEqual(layout.to_bytes(item, be), bytes(ref.get_bytes()))
+                copy = BatchItem("copy")
+                layout.from_bytes(copy, bytes(ref.get_bytes()), be)
+                self.assertEqual(copy.wide, item.wide)
+
+            buf = layout.pack_array(items, be)
+            self.assertEqual(buf, b''.join(layout.to_bytes(i, be) for i in items))
+            copies = [BatchItem("copy" + str(i)) for i in range(10)]
+            layout.unpack_array(copies, buf, be)
+            self.assertEqual([c.wide for c in copies], [i.wide for i in items])
+        with self.assertRaises(ValueError):
+            UVMPackLayout([("class", 8)])
+        with self.assertRaises(ValueError):
+            UVMPackLayout([("addr", 0)])
+
+    def test_uvm_pack_layout(self):
+        class LayoutItem(UVMObject):
+            def __init__(self, name="LayoutItem"):
+                super().__init__(name)
+                self.addr = 0
+                self.kind = 0
+        layout = uvm_pack_layout(LayoutItem, [("addr", 12), ("kind", 3)])
+        self.assertIs(LayoutItem.pack_layout, layout)
+        items = [LayoutItem("item" + str(i)) for i in range(5)]
+        for i, item in enumerate(items):
+            item.addr = 0xF00 | i
+            item.kind = i
+        for be in [0, 1]:
+            packer = UVMPacker()
+            packer.big_endian = be
+            packed = []
+            self.assertEqual(items[2].pack_bytes(packed, packer), 15)
+            self.assertEqual(bytes(packed), layout.to_bytes(items[2], be))
+            buf, stride = UVMObject.pack_batch(items, packer=packer)
+            self.assertEqual(buf, layout.pack_array(items, be))
+            copy = LayoutItem("copy")
+            copy.unpack_bytes(buf[4 * stride:], packer)
+            self.assertEqual((copy.addr, copy.kind), (0xF04, 4))
 
 
 if __name__ == '__main__':
@@ -66,6 +66,35 @@ class TestUVMQueue(unittest.TestCase):
         for i in q:
             self.assertEqual(True, False)
 
+    def test_front_back_ops(self):
+        q = UVMQueue('fifo')
+        for i in range(10):
+            q.push_back(i)
+            q.push_front(-i - 1)
+        self.assertEqual(q.front(), -10)
+        self.assertEqual(q.back(), 9)
+        self.assertEqual(q.get(10), 0)
+        self.assertEqual(q[-1], 9)
+        self.assertEqual(q[2:5], [-8, -7, -6])
+        self.assertEqual(q[:], list(q))
+        self.assertEqual(q[::-5], [9, 4, -1, -6])
+        q.delete(0)
+        q.delete(q.size() - 1)
+        self.assertEqual((q.pop_front(), q.pop_back()), (-9, 8))
+        q[0] = 100
+        self.assertEqual(q.find_with(lambda x: x > 5).queue[0], 100)
+        self.assertEqual(q.find_first_index(lambda x: x == 0), 8)
+        self.assertEqual(str(q), str(list(q)))
+        for item in q:
+            if item < 0:
+                q.push_back(item)
+        self.assertEqual(q.size(), 23)
+        q.delete()
+        self.assertEqual(q.size(), 0)
+        self.assertIsNone(q.front())
+        with self.assertRaises(Exception):
+            q.pop_front()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,9 @@ import unittest
 
 from uvm.base.uvm_registry import UVMComponentRegistry, UVMObjectRegistry
 from uvm.macros.uvm_object_defines import uvm_component_utils, uvm_object_utils
+from uvm.base.uvm_exceptions import UVMReleasedObjectError
+from uvm.base.uvm_resource import UVMResource, UVMResourceOptions
+from uvm.seq.uvm_sequence_item import UVMSequenceItem
 
 
 class TestUVMRegistry(unittest.TestCase):
@@ -31,6 +34,72 @@ class TestUVMRegistry(unittest.TestCase):
         self.assertEqual(abc_comp.name, 'inst_name')
         self.assertEqual(abc_comp.parent, None)
 
+    def test_object_pool(self):
+        class PooledItem(UVMSequenceItem):
+            def __init__(self, name=""):
+                super().__init__(name)
+                self.data = 0
+
+            def do_reinit(self):
+                self.data = 0
+        uvm_object_utils(PooledItem)
+        reg = PooledItem.type_id
+        item = reg.create('item0')
+        item.release()  # Pooling is off
+        self.assertIsNot(reg.create('item1'), item)
+
+        reg.set_pool_size(2)
+        items = [reg.create('item' + str(i)) for i in range(3)]
+        items[0].data = 10
+        items[0].set_transaction_id(5)
+        for it in items:
+            it.release()
+        self.assertEqual(len(reg.m_free_list), 2)
+        reused = reg.create('reused')
+        self.assertIs(reused, items[1])
+        self.assertIs(reg.create('reused'), items[0])
+        self.assertEqual(items[0].get_name(), 'reused')
+        self.assertEqual(items[0].data, 0)
+        self.assertEqual(items[0].get_transaction_id(), -1)
+        self.assertNotEqual(items[0].get_inst_id(), items[1].get_inst_id())
+
+        reused.release()
+        reused.release()  # Reported as an error, not added twice
+        self.assertEqual(len(reg.m_free_list), 1)
+
+        reg.set_pool_size(4, debug=True)
+        item = reg.create('item')
+        item.release()
+        with self.assertRaises(UVMReleasedObjectError):
+            item.get_name()
+        with self.assertRaises(UVMReleasedObjectError):
+            item.data = 1
+        self.assertIs(reg.create('item'), item)
+        self.assertEqual(item.get_name(), 'item')
+
+        # Objects released in debug mode are reusable after turning it off
+        item.release()
+        reg.set_pool_size(4)
+        self.assertIs(reg.create('item2'), item)
+        self.assertEqual(item.get_name(), 'item2')
+        self.assertIs(type(item), PooledItem)
+
+        # Resource accesses of a reused object are audited under its new name
+        UVMResourceOptions.turn_on_compact_auditing()
+        try:
+            rsc = UVMResource("pooled", "*")
+            rsc.read(item)
+            item.release()
+            self.assertIs(reg.create('item3'), item)
+            rsc.read(item)
+        finally:
+            UVMResourceOptions.turn_off_compact_auditing()
+        self.assertEqual(sorted(rsc.get_access_records()), ['item2', 'item3'])
+
+        reg.set_pool_size(0)
+        self.assertEqual(reg.get_pool_size(), 0)
+        self.assertIsNot(reg.create('item'), item)
+
 
 if __name__ == '__main__':
     unittest.main()
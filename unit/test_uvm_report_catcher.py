@@ -1,6 +1,9 @@
 
 import unittest
-from uvm.base.uvm_report_catcher import UVMReportCatcher
+from uvm.base.uvm_report_catcher import (UVMReportCatcher, UVMReportCb,
+    THROW, CAUGHT)
+from uvm.base.uvm_component import UVMComponent
+from uvm.base.uvm_object_globals import UVM_ERROR, UVM_INFO, UVM_WARNING
 
 
 class MyReportCatcher(UVMReportCatcher):
@@ -13,11 +16,68 @@ class MyReportCatcher(UVMReportCatcher):
         self._id = self.get_id()
 
 
+class LogCatcher(UVMReportCatcher):
+    """ Records the ids it sees, and optionally demotes or catches them """
+
+    def __init__(self, name, log, demote=False, caught=False):
+        super().__init__(name)
+        self.log = log
+        self.demote = demote
+        self.caught = caught
+
+    def catch(self):
+        self.log.append((self.get_name(), self.get_id()))
+        if self.demote:
+            self.set_severity(UVM_INFO)
+        if self.caught:
+            return CAUGHT
+        return THROW
+
+
 class TestUVMReportCatcher(unittest.TestCase):
 
     def test_catcher(self):
         rpt_catcher = MyReportCatcher('catcher')
 
+    def test_is_interested(self):
+        catcher = MyReportCatcher('filtered')
+        self.assertTrue(catcher.is_interested(UVM_ERROR, "ANY"))
+        catcher.add_catch_filter(UVM_ERROR, "MY_*")
+        catcher.add_catch_filter(None, "OTHER")
+        self.assertTrue(catcher.is_interested(UVM_ERROR, "MY_ID"))
+        self.assertFalse(catcher.is_interested(UVM_WARNING, "MY_ID"))
+        self.assertFalse(catcher.is_interested(UVM_ERROR, "ID"))
+        self.assertTrue(catcher.is_interested(UVM_WARNING, "OTHER"))
+
+    def test_indexed_dispatch(self):
+        log = []
+        comp = UVMComponent("catcher_comp", None)
+        c_all = LogCatcher("c_all", log)
+        c_err = LogCatcher("c_err", log, demote=True)
+        c_err.add_catch_filter(UVM_ERROR, "ERR*")
+        c_info = LogCatcher("c_info", log, caught=True)
+        c_info.add_catch_filter(UVM_INFO, None)
+        c_last = LogCatcher("c_last", log)
+        c_last.add_catch_filter(None, "WARN")
+        for c in [c_all, c_err, c_info, c_last]:
+            UVMReportCb.add(comp, c)
+
+        comp.uvm_report_warning("WARN", "warning")
+        self.assertEqual(log, [("c_all", "WARN"), ("c_last", "WARN")])
+
+        # c_err demotes to info, after which c_info catches the message
+        del log[:]
+        caught_error = UVMReportCatcher.m_caught_error
+        comp.uvm_report_error("ERR1", "error")
+        self.assertEqual(log, [("c_all", "ERR1"), ("c_err", "ERR1"),
+            ("c_info", "ERR1")])
+        self.assertEqual(UVMReportCatcher.m_caught_error, caught_error + 1)
+
+        del log[:]
+        c_all.callback_mode(False)
+        comp.uvm_report_warning("WARN", "warning")
+        self.assertEqual(log, [("c_last", "WARN")])
+
 
 if __name__ == '__main__':
     unittest.main()
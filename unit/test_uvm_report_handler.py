@@ -27,6 +27,43 @@ class TestUVMReportHandler(unittest.TestCase):
         verb = rh.get_action(UVM_ERROR, "XYZ")
         self.assertEqual(verb, UVM_COUNT)
 
+    def test_decision_cache(self):
+        rh = UVMReportHandler("handler")
+        self.assertEqual(rh.get_verbosity_level(UVM_INFO, "ID1"), UVM_MEDIUM)
+        self.assertEqual(rh.get_action(UVM_INFO, "ID1"), UVM_DISPLAY)
+        self.assertIn((UVM_INFO, "ID1"), rh.m_decisions)
+
+        rh.set_id_verbosity("ID1", UVM_HIGH)
+        self.assertEqual(rh.get_verbosity_level(UVM_INFO, "ID1"), UVM_HIGH)
+        rh.set_severity_id_verbosity(UVM_INFO, "ID1", UVM_LOW)
+        self.assertEqual(rh.get_verbosity_level(UVM_INFO, "ID1"), UVM_LOW)
+        rh.set_verbosity_level(UVM_DEBUG)
+        self.assertEqual(rh.get_verbosity_level(UVM_INFO, "ID2"), UVM_DEBUG)
+
+        rh.set_id_action("ID1", UVM_LOG)
+        self.assertEqual(rh.get_action(UVM_INFO, "ID1"), UVM_LOG)
+        rh.set_severity_action(UVM_INFO, UVM_NO_ACTION)
+        self.assertEqual(rh.get_action(UVM_INFO, "ID2"), UVM_NO_ACTION)
+
+        rh.set_id_file("ID1", 5)
+        self.assertEqual(rh.get_file_handle(UVM_INFO, "ID1"), 5)
+        rh.set_severity_id_file(UVM_INFO, "ID1", 6)
+        self.assertEqual(rh.get_file_handle(UVM_INFO, "ID1"), 6)
+
+    def test_decision_cache_hier(self):
+        from uvm.base.uvm_component import UVMComponent
+        parent = UVMComponent("rh_parent", None)
+        child = UVMComponent("rh_child", parent)
+        self.assertEqual(child.get_report_verbosity_level(UVM_INFO, "ID"), UVM_MEDIUM)
+        self.assertEqual(child.get_report_action(UVM_INFO, "ID"), UVM_DISPLAY)
+
+        parent.set_report_id_verbosity_hier("ID", UVM_FULL)
+        self.assertEqual(child.get_report_verbosity_level(UVM_INFO, "ID"), UVM_FULL)
+        parent.set_report_verbosity_level_hier(UVM_NONE)
+        self.assertEqual(child.get_report_verbosity_level(UVM_INFO, "ID2"), UVM_NONE)
+        parent.set_report_severity_action_hier(UVM_INFO, UVM_LOG)
+        self.assertEqual(child.get_report_action(UVM_INFO, "ID"), UVM_LOG)
+
 
 if __name__ == '__main__':
     unittest.main()
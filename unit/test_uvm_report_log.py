@@ -0,0 +1,105 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from uvm.base.uvm_report_log import (UVMReportLogWriter, UVMReportLogReader,
+    main)
+from uvm.base.uvm_report_server import UVMReportServer
+from uvm.base.uvm_report_message import UVMReportMessage
+from uvm.base.uvm_object_globals import (UVM_INFO, UVM_ERROR, UVM_WARNING,
+    UVM_DISPLAY, UVM_MEDIUM, UVM_LOW)
+
+
+class TestUVMReportLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.fname = os.path.join(self.tmpdir.name, "msgs.uvmlog")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_log(self):
+        log = UVMReportLogWriter(self.fname, chunk_size=10)
+        for i in range(25):
+            log.write_record(i * 10, UVM_INFO, "INFO/" + str(i % 3), UVM_LOW,
+                "top.env", "tb.py", i, "info " + str(i))
+        log.write_record(300, UVM_ERROR, "ERR", UVM_LOW, "top.env.drv",
+            "drv.py", 5, "timeout on bus")
+        log.write_record(310, UVM_WARNING, "WARN", UVM_LOW, "top", "", 0,
+            "careful")
+        log.close()
+        return log
+
+    def test_count(self):
+        log = self.write_log()
+        self.assertEqual(log.get_num_written(), 27)
+        reader = UVMReportLogReader(self.fname)
+        self.assertEqual(len(list(reader.chunks())), 3)
+        counts = reader.count()
+        self.assertEqual(sum(counts.values()), 27)
+        self.assertEqual(counts[(UVM_INFO, "INFO/0")], 9)
+        self.assertEqual(reader.count(severity=UVM_ERROR), {(UVM_ERROR, "ERR"): 1})
+        self.assertEqual(sum(reader.count(id="INFO/*").values()), 25)
+
+    def test_messages(self):
+        self.write_log()
+        reader = UVMReportLogReader(self.fname)
+        msgs = list(reader.messages(severity=UVM_ERROR))
+        self.assertEqual(len(msgs), 1)
+        self.assertEqual(msgs[0]["name"], "top.env.drv")
+        self.assertEqual(msgs[0]["line"], 5)
+        msgs = list(reader.messages(id="INFO/1", start=100, end=200))
+        self.assertEqual([m["time"] for m in msgs], [100, 130, 160, 190])
+        msgs = list(reader.messages(text="care"))
+        self.assertEqual([m["id"] for m in msgs], ["WARN"])
+
+    def test_truncated(self):
+        self.write_log()
+        with open(self.fname, "rb") as f:
+            data = f.read()
+        with open(self.fname, "wb") as f:
+            f.write(data[:-5])
+        reader = UVMReportLogReader(self.fname)
+        self.assertEqual(sum(reader.count().values()), 20)
+
+    def test_cli(self):
+        self.write_log()
+        out = io.StringIO()
+        with redirect_stdout(out):
+            main(["--count", "-s", "error", self.fname])
+        self.assertIn("UVM_ERROR", out.getvalue())
+        self.assertIn("Total: 1", out.getvalue())
+        out = io.StringIO()
+        with redirect_stdout(out):
+            main(["-g", "timeout", self.fname])
+        self.assertEqual(out.getvalue(),
+            "UVM_ERROR drv.py(5) @ 300NS: top.env.drv [ERR] timeout on bus\n")
+
+    def test_server_with_log(self):
+        msgs = []
+        srv = UVMReportServer.get_server()
+        logger = srv.logger
+        srv.set_logger(msgs.append)
+        log = UVMReportLogWriter(self.fname)
+        srv.set_report_log(log, text=False)
+        self.assertIs(srv.get_report_log(), log)
+        rpt_msg = UVMReportMessage()
+        rpt_msg.set_report_message(UVM_INFO, "RLOG", "structured", UVM_MEDIUM,
+            "", 0, "")
+        rpt_msg.set_action(UVM_DISPLAY)
+        srv.process_report_message(rpt_msg)
+        srv.flush()
+        srv.set_report_log(None)
+        srv.set_logger(logger)
+        log.close()
+        self.assertEqual(msgs, [])
+        recs = list(UVMReportLogReader(self.fname).messages(id="RLOG"))
+        self.assertEqual(len(recs), 1)
+        self.assertEqual(recs[0]["message"], "structured")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -33,6 +33,27 @@ class TestUVMReportObject(unittest.TestCase):
         act = obj.get_report_action(UVM_ERROR, id="")
         self.assertEqual(act, UVM_LOG)
 
+    def test_lazy_message(self):
+        from uvm.base.uvm_report_server import UVMReportServer
+        msgs = []
+        srv = UVMReportServer.get_server()
+        srv.set_logger(msgs.append)
+        obj = UVMReportObject('rpt')
+        calls = []
+
+        def make_msg():
+            calls.append(1)
+            return "callable message"
+        try:
+            obj.uvm_report_info("LAZY", make_msg, UVM_HIGH)
+            self.assertEqual(calls, [])
+            obj.uvm_report_info("LAZY", make_msg, UVM_MEDIUM)
+            self.assertEqual(calls, [1])
+            self.assertIn("[LAZY] callable message", msgs[-1])
+            obj.uvm_report_info("FMT", "%0d items", UVM_MEDIUM, args=(3,))
+            self.assertIn("[FMT] 3 items", msgs[-1])
+        finally:
+            srv.set_logger(print)
 
 
 if __name__ == '__main__':
@@ -70,5 +70,42 @@ class TestUVMReportServer(unittest.TestCase):
         srv.process_report_message(rpt_msg)
         srv.report_summarize()
 
+    def test_rate_limit(self):
+        from uvm.base.uvm_report_server import UVMReportRateLimit
+        limit = UVMReportRateLimit(first=2, every=3)
+        shown = [i for i in range(1, 12) if limit.allow("ID")]
+        self.assertEqual(shown, [1, 2, 5, 8, 11])
+        limit = UVMReportRateLimit(max_per_us=2)
+        shown = [i for i in range(5) if limit.allow("ID")]
+        self.assertEqual(shown, [0, 1])
+
+    def test_rate_limited_messages(self):
+        from uvm.base.uvm_report_message import UVMReportMessage
+        srv = UVMReportServer.get_server()
+        logger = srv.logger
+        msgs = []
+        srv.set_logger(msgs.append)
+        srv.set_id_rate_limit("FLOOD", first=1, every=4)
+        srv.set_severity_rate_limit(UVM_WARNING, first=2)
+        id_count = srv.get_id_count("FLOOD")
+        for i in range(10):
+            for (sev, id) in [(UVM_INFO, "FLOOD"), (UVM_WARNING, "WARN_A"),
+                    (UVM_WARNING, "WARN_B")]:
+                rpt_msg = UVMReportMessage()
+                rpt_msg.set_report_message(sev, id, "msg" + str(i), UVM_LOW, "", 0, "")
+                rpt_msg.set_action(UVM_DISPLAY)
+                srv.process_report_message(rpt_msg)
+        srv.set_logger(logger)
+        srv.set_id_rate_limit("FLOOD")
+        srv.set_severity_rate_limit(UVM_WARNING)
+
+        flood = [m for m in msgs if "[FLOOD]" in m]
+        self.assertEqual(len(flood), 3)  # 1st, 5th and 9th
+        self.assertEqual(len([m for m in msgs if "[WARN_A]" in m]), 2)
+        self.assertEqual(srv.get_id_count("FLOOD"), id_count + 10)
+        self.assertEqual(srv.get_suppressed_count("FLOOD"), 7)
+        self.assertEqual(srv.get_suppressed_count("WARN_B"), 8)
+        self.assertIn("[FLOOD] 7", srv.get_summary_string())
+
 if __name__ == '__main__':
     unittest.main()
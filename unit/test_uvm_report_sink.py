@@ -0,0 +1,114 @@
+import io
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from uvm.base.uvm_report_sink import UVMReportSink, UVMAsyncReportSink, _STOP
+from uvm.base.uvm_report_server import UVMReportServer
+from uvm.base.uvm_report_message import UVMReportMessage
+from uvm.base.uvm_object_globals import UVM_INFO, UVM_LOG, UVM_DISPLAY, UVM_MEDIUM
+
+
+class TestUVMReportSink(unittest.TestCase):
+
+    def test_sync_sink(self):
+        msgs = []
+        sink = UVMReportSink(msgs.append)
+        sink.display("msg1")
+        self.assertEqual(msgs, ["msg1"])
+
+    def test_async_sink_display(self):
+        msgs = []
+        sink = UVMAsyncReportSink(msgs.append, batch_size=7)
+        for i in range(100):
+            sink.display("msg" + str(i))
+        sink.flush()
+        self.assertEqual(msgs, ["msg" + str(i) for i in range(100)])
+        self.assertEqual(sink.get_num_written(), 100)
+        self.assertEqual(sink.get_num_dropped(), 0)
+        sink.close()
+        sink.display("after close")
+        self.assertEqual(sink.get_num_dropped(), 1)
+
+    def test_async_sink_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "log.txt")
+            with open(fname, "w") as fh:
+                sink = UVMAsyncReportSink()
+                for i in range(10):
+                    sink.write(fh, "line" + str(i))
+                sink.close()
+            with open(fname, "r") as fh:
+                lines = fh.read().splitlines()
+            self.assertEqual(lines, ["line" + str(i) for i in range(10)])
+
+    def test_async_sink_full_queue(self):
+        release = threading.Event()
+        msgs = []
+
+        def slow_logger(msg):
+            release.wait()
+            msgs.append(msg)
+        sink = UVMAsyncReportSink(slow_logger, max_queue_size=2, block=False)
+        for i in range(10):
+            sink.display("msg" + str(i))
+        self.assertGreater(sink.get_num_dropped(), 0)
+        release.set()
+        sink.close()
+        self.assertEqual(len(msgs) + sink.get_num_dropped(), 10)
+
+    def test_async_sink_failing_logger(self):
+        msgs = []
+
+        def failing_logger(msg):
+            if msg == "fail":
+                raise IOError("logger failed")
+            msgs.append(msg)
+        sink = UVMAsyncReportSink(failing_logger, batch_size=1)
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            sink.display("msg0")
+            sink.display("fail")
+            sink.display("msg1")
+            sink.flush()
+        self.assertEqual(msgs, ["msg0", "msg1"])
+        self.assertIn("logger failed", stderr.getvalue())
+        self.assertEqual(sink.get_num_written(), 2)
+        self.assertEqual(sink.get_num_dropped(), 1)
+        self.assertTrue(sink.m_thread.is_alive())
+        sink.close()
+
+    def test_async_sink_dead_writer(self):
+        msgs = []
+        sink = UVMAsyncReportSink(msgs.append, max_queue_size=1)
+        sink.m_queue.put(_STOP)
+        sink.m_thread.join()
+        # Writer is gone, messages are written synchronously without blocking
+        for i in range(3):
+            sink.display("msg" + str(i))
+        sink.flush()
+        self.assertEqual(msgs, ["msg0", "msg1", "msg2"])
+        self.assertEqual(sink.get_num_written(), 3)
+        sink.close()
+
+    def test_server_with_sink(self):
+        msgs = []
+        srv = UVMReportServer.get_server()
+        sink = UVMAsyncReportSink(msgs.append)
+        srv.set_report_sink(sink)
+        self.assertIs(srv.get_report_sink(), sink)
+        rpt_msg = UVMReportMessage()
+        rpt_msg.set_report_message(UVM_INFO, "SINK", "via sink", UVM_MEDIUM, "", 0, "")
+        rpt_msg.set_action(UVM_LOG | UVM_DISPLAY)
+        rpt_msg.set_file(0)
+        srv.process_report_message(rpt_msg)
+        srv.flush()
+        self.assertEqual(len(msgs), 2)  # Both display and log to file 0
+        self.assertIn("[SINK] via sink", msgs[0])
+        srv.set_report_sink(None)
+        sink.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
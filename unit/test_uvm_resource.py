@@ -1,6 +1,9 @@
 
 import unittest
-from uvm.base.uvm_resource import UVMResource, UVMResourcePool
+from unittest import mock
+from uvm.base.uvm_resource import (UVMResource, UVMResourcePool, PRI_LOW,
+    NAME_OVERRIDE, UVMResourceOptions)
+from uvm.base.uvm_object import UVMObject
 
 
 class TestUVMResource(unittest.TestCase):
@@ -19,6 +22,46 @@ class TestUVMResource(unittest.TestCase):
         val = rsc.read()
         self.assertEqual(val, 123)
 
+    def access(self, rsc, accessors):
+        for i in range(10):
+            rsc.write(i, accessors[i % 2])
+            for acc in accessors:
+                rsc.read(acc)
+        rsc.read()
+
+    def test_compact_audit(self):
+        accessors = [UVMObject("acc0"), UVMObject("acc1")]
+        full = UVMResource("full", "*")
+        self.access(full, accessors)
+        UVMResourceOptions.turn_on_compact_auditing()
+        try:
+            compact = UVMResource("compact", "*")
+            self.access(compact, accessors)
+            self.assertEqual(compact.access, {})
+            self.assertEqual(len(compact.m_audit_reads), 3)
+        finally:
+            UVMResourceOptions.turn_off_compact_auditing()
+        self.assertTrue(UVMResourceOptions.is_auditing())
+
+        def counts(rsc):
+            return {name: (acc.read_count, acc.write_count) for name, acc in
+                rsc.get_access_records().items()}
+        self.assertEqual(counts(full), counts(compact))
+        self.assertEqual(counts(compact), {"acc0": (10, 5), "acc1": (10, 5),
+            "<empty>": (1, 0)})
+        full.print_accessors()
+        compact.print_accessors()
+
+    def test_compact_audit_sample(self):
+        UVMResourceOptions.turn_on_compact_auditing(sample=4)
+        try:
+            rsc = UVMResource("sampled", "*")
+            for i in range(100):
+                rsc.read()
+        finally:
+            UVMResourceOptions.turn_off_compact_auditing()
+        self.assertEqual(rsc.get_access_records()["<empty>"].read_count, 100)
+
 
 class TestUVMResourcePool(unittest.TestCase):
 
@@ -67,6 +110,84 @@ class TestUVMResourcePool(unittest.TestCase):
         self.assertEqual(len(rq), 1)
         self.assertEqual(rq[0].read(), 567)
 
+    def test_spell_check(self):
+        pool = UVMResourcePool()
+        pool.set(UVMResource("num_masters", "*"))
+        with mock.patch("uvm.base.uvm_spell_chkr.uvm_info") as info:
+            self.assertFalse(pool.spell_check("num_master"))
+        self.assertIn("did you mean num_masters", info.call_args[0][1])
+        self.assertEqual(pool.m_spell_index.size(), 1)
+
+        # Names set after the index was built are added on the next miss
+        pool.set(UVMResource("num_slaves", "*"))
+        with mock.patch("uvm.base.uvm_spell_chkr.uvm_info") as info:
+            self.assertFalse(pool.spell_check("num_slave"))
+        self.assertIn("did you mean num_slaves", info.call_args[0][1])
+        self.assertEqual(pool.m_spell_index.size(), 2)
+        self.assertTrue(pool.spell_check("num_slaves"))
+
+    def test_lookup_cache(self):
+        pool = UVMResourcePool()
+        r1 = UVMResource("cached", "top.*")
+        r1.write(1)
+        pool.set(r1)
+        rq = pool.lookup_name("top.env", "cached")
+        self.assertEqual(rq, [r1])
+        self.assertIn(("top.env", "cached", None), pool.m_lookup_cache)
+        rq.append(None)  # Returned list must not alias the cache
+        self.assertEqual(pool.lookup_name("top.env", "cached"), [r1])
+
+        # New resources invalidate the cached result
+        r2 = UVMResource("cached", "top.env")
+        r2.write(2)
+        pool.set(r2, NAME_OVERRIDE)
+        self.assertEqual(pool.lookup_name("top.env", "cached"), [r2, r1])
+
+        # So do priority changes and scope changes
+        pool.set_priority_name(r2, PRI_LOW)
+        self.assertEqual(pool.lookup_name("top.env", "cached"), [r1, r2])
+        r1.set_scope("other.*")
+        self.assertEqual(pool.lookup_name("top.env", "cached"), [r2])
+
+    def test_lookup_scope(self):
+        pool = UVMResourcePool()
+        r_exact = UVMResource("a", "top.env.agent")
+        r_prefix = UVMResource("a", "top.env*")
+        r_all = UVMResource("b", "*")
+        r_glob = UVMResource("b", "top.*.agent")
+        r_regex = UVMResource("c", "top.(env|cfg)$")
+        r_other = UVMResource("c", "*other*")
+        for r in [r_exact, r_prefix, r_all, r_glob, r_regex, r_other]:
+            pool.set(r)
+
+        def scan(scope):
+            return [r for name in reversed(pool.rtab.key_list())
+                for r in pool.rtab[name] if r.match_scope(scope)]
+
+        for scope in ["top.env.agent", "top.env", "top.other.agent",
+                "uvm_test_top.env", "", "x"]:
+            rq = pool.lookup_scope(scope)
+            self.assertEqual(list(rq), scan(scope), scope)
+        self.assertEqual(list(pool.lookup_scope("top.env")),
+            [r_regex, r_all, r_prefix])
+        self.assertEqual(list(pool.lookup_scope("x.top.env.agent.y")),
+            [r_all, r_glob, r_exact, r_prefix])
+
+        # The index is rebuilt when scopes change
+        r_exact.set_scope("top.env.agent2")
+        self.assertNotIn(r_exact, pool.lookup_scope("top.env.agent").queue)
+        self.assertIn(r_exact, pool.lookup_scope("top.env.agent2").queue)
+
+    def test_sort_by_precedence(self):
+        rq = []
+        for i, prec in enumerate([1000, 999, 1001, 999, 1000]):
+            r = UVMResource("r" + str(i), "*")
+            r.precedence = prec
+            rq.append(r)
+        res = UVMResourcePool.sort_by_precedence(rq)
+        self.assertEqual([r.get_name() for r in res],
+            ["r2", "r0", "r4", "r1", "r3"])
+
 
 if __name__ == '__main__':
     unittest.main()
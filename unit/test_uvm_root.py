@@ -1,8 +1,11 @@
 
 # UNIT TESTS
 
+import os
+import tempfile
 import unittest
 from uvm.base.uvm_root import UVMRoot
+from uvm.base.uvm_config_db import UVMConfigDb
 
 
 class TestUVMRoot(unittest.TestCase):
@@ -16,6 +19,18 @@ class TestUVMRoot(unittest.TestCase):
         root2 = UVMRoot.m_uvm_get_root()
         self.assertEqual(root1, root2)
 
+    def test_config_file(self):
+        root = UVMRoot.m_uvm_get_root()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "cfg.toml")
+            with open(fname, "w") as f:
+                f.write('["top.cfgfile.*"]\nnum_items = 7\nmode = "fast"\n')
+            root.m_process_config_file(fname)
+        arr = []
+        self.assertTrue(UVMConfigDb.get(None, "top.cfgfile.drv", "num_items", arr))
+        self.assertTrue(UVMConfigDb.get(None, "top.cfgfile.drv", "mode", arr))
+        self.assertEqual(arr, [7, "fast"])
+
     async def test_run_phase(self):
         root = UVMRoot()
         await root.run_phase()
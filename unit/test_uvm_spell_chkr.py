@@ -1,7 +1,8 @@
 
+import random
 import unittest
 
-from uvm.base.uvm_spell_chkr import UVMSpellChkr
+from uvm.base.uvm_spell_chkr import UVMSpellChkr, UVMSpellIndex
 
 
 class TestUVMSpellChkr(unittest.TestCase):
@@ -11,6 +12,40 @@ class TestUVMSpellChkr(unittest.TestCase):
         self.assertTrue(UVMSpellChkr.check(strtab, 'xxx'))
         self.assertFalse(UVMSpellChkr.check(strtab, 'vvv'))
 
+    def test_levenshtein_distance(self):
+        dist = UVMSpellChkr.levenshtein_distance
+        self.assertEqual(dist("kitten", "sitting"), 3)
+        self.assertEqual(dist("flaw", "lawn"), 2)
+        self.assertEqual(dist("abc", "abc"), 0)
+        self.assertEqual(dist("abc", "abcd"), 1)
+        self.assertEqual(dist("xabcx", "yabcy"), 2)
+        self.assertEqual(dist("", "abc"), -1)
+
+    def test_index(self):
+        random.seed(3)
+        chars = "abcde_"
+        words = ["".join(random.choice(chars) for _ in range(random.randint(1, 8)))
+            for _ in range(300)]
+        strtab = dict.fromkeys(words, 1)
+        index = UVMSpellIndex()
+        for word in strtab:
+            index.add(word)
+        self.assertEqual(index.size(), len(strtab))
+        for _ in range(50):
+            s = "".join(random.choice(chars) for _ in range(random.randint(1, 9)))
+            dists = [(UVMSpellChkr.levenshtein_distance(key, s), key)
+                for key in strtab]
+            best = min(d for d, _ in dists)
+            exp = [key for d, key in dists if d == best]
+            self.assertEqual(index.nearest(s), (best, exp))
+
+    def test_check_with_index(self):
+        strtab = {'num_masters': 1, 'num_slaves': 2}
+        index = UVMSpellIndex()
+        self.assertFalse(UVMSpellChkr.check(strtab, 'num_master', index))
+        self.assertEqual(index.size(), 2)
+        self.assertEqual(index.nearest('num_master'), (1, ['num_masters']))
+
 
 if __name__ == '__main__':
     unittest.main()